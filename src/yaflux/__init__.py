@@ -1,32 +1,76 @@
+from typing import TYPE_CHECKING, Any
+
 from ._ast import AstSelfMutationError, AstUndeclaredUsageError
 from ._base import Base
-from ._executor import (
-    ExecutorCircularDependencyError,
-    ExecutorMissingStartError,
-    ExecutorMissingTargetStepError,
-)
 from ._graph import CircularDependencyError, MutabilityConflictError
-from ._loaders import load
+from ._map import map_step
 from ._results import FlagError, UnauthorizedMutationError
 from ._step import step
-from ._yax import (
-    YaxMissingParametersFileError,
-    YaxMissingResultError,
-    YaxMissingResultFileError,
-    YaxMissingVersionFileError,
-    YaxNotArchiveFileError,
-)
+from ._stream import ChunkStream
+from ._trace import TraceRecorder, load_trace, trace
+
+if TYPE_CHECKING:
+    from ._executor import (
+        ExecutorCircularDependencyError,
+        ExecutorMissingStartError,
+        ExecutorMissingTargetStepError,
+        ExecutorResourceError,
+    )
+    from ._loaders import load
+    from ._sweep import sweep
+    from ._yax import (
+        YaxMissingParametersFileError,
+        YaxMissingResultError,
+        YaxMissingResultFileError,
+        YaxMissingVersionFileError,
+        YaxNotArchiveFileError,
+    )
+
+# Subsystems imported on first access to keep `import yaflux` fast
+_LAZY_ATTRIBUTES = {
+    "ExecutorCircularDependencyError": "._executor",
+    "ExecutorMissingStartError": "._executor",
+    "ExecutorMissingTargetStepError": "._executor",
+    "ExecutorResourceError": "._executor",
+    "YaxMissingParametersFileError": "._yax",
+    "YaxMissingResultError": "._yax",
+    "YaxMissingResultFileError": "._yax",
+    "YaxMissingVersionFileError": "._yax",
+    "YaxNotArchiveFileError": "._yax",
+    "load": "._loaders",
+    "sweep": "._sweep",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported attributes on first access (PEP 562)."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     "AstSelfMutationError",
     "AstUndeclaredUsageError",
     "Base",
+    "ChunkStream",
     "CircularDependencyError",
     "ExecutorCircularDependencyError",
     "ExecutorMissingStartError",
     "ExecutorMissingTargetStepError",
+    "ExecutorResourceError",
     "FlagError",
     "MutabilityConflictError",
+    "TraceRecorder",
     "UnauthorizedMutationError",
     "YaxMissingParametersFileError",
     "YaxMissingResultError",
@@ -34,5 +78,9 @@ __all__ = [
     "YaxMissingVersionFileError",
     "YaxNotArchiveFileError",
     "load",
+    "load_trace",
+    "map_step",
     "step",
+    "sweep",
+    "trace",
 ]
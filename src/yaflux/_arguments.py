@@ -0,0 +1,84 @@
+import reprlib
+from typing import Any
+
+from ._fingerprint import fingerprint
+
+# Maximum length of the summary of a single argument
+MAX_ARGUMENT_LENGTH = 200
+
+# Arrays and frames up to this many bytes are fingerprinted
+MAX_FINGERPRINT_BYTES = 1 << 20
+
+
+def _truncate(text: str) -> str:
+    """Cap a summary at the maximum argument length."""
+    if len(text) <= MAX_ARGUMENT_LENGTH:
+        return text
+    return text[: MAX_ARGUMENT_LENGTH - 3] + "..."
+
+
+def _describe(type_name: str, shape: Any, extra: str, value: Any, nbytes: int) -> str:
+    """Describe a sized object by its shape and, if small enough, its content."""
+    description = f"{type_name}(shape={shape}{extra}"
+    if nbytes <= MAX_FINGERPRINT_BYTES:
+        digest = fingerprint(value)
+        if digest is not None:
+            description += f", fingerprint={digest}"
+    return description + ")"
+
+
+class _ArgumentRepr(reprlib.Repr):
+    """Bounded repr summarizing arrays and frames instead of rendering them.
+
+    `reprlib` dispatches on the type name, so these methods also apply to
+    arrays and frames nested in containers.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.maxstring = MAX_ARGUMENT_LENGTH
+        self.maxother = MAX_ARGUMENT_LENGTH
+
+    def repr_ndarray(self, x: Any, level: int) -> str:
+        """Summarize a numpy array by its shape and dtype."""
+        return _describe("ndarray", x.shape, f", dtype={x.dtype}", x, x.nbytes)
+
+    def repr_DataFrame(self, x: Any, level: int) -> str:  # noqa: N802
+        """Summarize a pandas DataFrame by its shape."""
+        nbytes = int(x.memory_usage(index=True, deep=False).sum())
+        return _describe("DataFrame", x.shape, "", x, nbytes)
+
+    def repr_Series(self, x: Any, level: int) -> str:  # noqa: N802
+        """Summarize a pandas Series by its shape and dtype."""
+        nbytes = int(x.memory_usage(index=True, deep=False))
+        return _describe("Series", x.shape, f", dtype={x.dtype}", x, nbytes)
+
+
+_argument_repr = _ArgumentRepr()
+
+
+def summarize_argument(value: Any) -> str:
+    """Summarize a step argument for the step metadata.
+
+    Strings and scalars are kept as is, arrays and frames are described by
+    their shape, dtype and a content fingerprint, and other objects by a repr
+    truncated to at most `MAX_ARGUMENT_LENGTH` characters. Containers only
+    render their first few items, so the cost of a summary does not grow with
+    the size of the argument.
+
+    Parameters
+    ----------
+    value : Any
+        The argument passed to the step.
+
+    Returns
+    -------
+    str
+        A bounded summary of the argument.
+    """
+    if value is None or isinstance(value, str | bool | int | float | complex):
+        return _truncate(str(value))
+    try:
+        return _truncate(_argument_repr.repr(value))
+    except Exception:
+        return f"<{type(value).__name__}>"
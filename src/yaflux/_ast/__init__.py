@@ -1,4 +1,14 @@
 from ._error import AstSelfMutationError, AstUndeclaredUsageError
-from ._validation import validate_ast
+from ._parameters import infer_parameters
+from ._summary import StepSummary, summarize_step
+from ._validation import validate_ast, validation_mode
 
-__all__ = ["AstSelfMutationError", "AstUndeclaredUsageError", "validate_ast"]
+__all__ = [
+    "AstSelfMutationError",
+    "AstUndeclaredUsageError",
+    "StepSummary",
+    "infer_parameters",
+    "summarize_step",
+    "validate_ast",
+    "validation_mode",
+]
@@ -1,7 +1,6 @@
 import ast
 
 from ._error import AstSelfMutationError
-from ._utils import get_function_node
 
 
 def _get_leftmost_name(node) -> str | None:
@@ -28,51 +27,33 @@ def _build_assignment_name(node) -> str:
         raise ValueError("Unexpected node type in assignment")
 
 
-class AssignmentVisitor(ast.NodeVisitor):
-    """AST visitor that finds all assignments to self."""
+def is_illegal_assignment(assignment_name: str, mutates: list[str]) -> bool:
+    """Whether an assignment to an attribute of self is forbidden.
 
-    def __init__(self, mutates: list[str]):
-        self.mutates = set(mutates)
-        self.assignees: set[str] = set()
-
-    def visit_Assign(self, node: ast.Assign) -> None:  # noqa
-        # Check for pattern: self.{attr} = ...
-
-        if (
-            len(node.targets) == 1
-            and isinstance(node.targets[0], ast.Attribute)
-            and _get_leftmost_name(node.targets[0]) == "self"
-        ):
-            assignment_name = _build_assignment_name(node.targets[0])
-
-            if assignment_name.startswith("self.results"):
-                attr = assignment_name.split("self.results.")[1]
-                base_attr = attr.split(".")[0]
-                if base_attr not in self.mutates:
-                    self.assignees.add(assignment_name)
-
-            # all non-results assignments are illegal regardless of `mutates`
-            else:
-                self.assignees.add(assignment_name)
+    Only results declared in `mutates` can be assigned to.
+    """
+    if assignment_name.startswith("self.results."):
+        attr = assignment_name.split("self.results.")[1]
+        return attr.split(".")[0] not in mutates
+    # all non-results assignments are illegal regardless of `mutates`
+    return True
 
 
-def validate_no_self_assignment(func, mutates: list[str]) -> None:
-    """Parse a function's AST and validate that self is not assigned to.
+def check_no_self_assignment(
+    func_name: str, assignments: list[str], mutates: list[str]
+) -> None:
+    """Validate that self is not assigned to.
 
     Parameters
     ----------
-    func : function
-        The function to validate
+    func_name : str
+        The name of the step function
+    assignments : list[str]
+        Full paths of the attributes of self assigned to in the function
     mutates : list[str]
         A list of attributes that are mutated by the function. If self is assigned to
         attributes outside of this list, an error is raised.
     """
-    # Get the function AST node
-    func_node = get_function_node(func)
-
-    # Find assignments to self
-    visitor = AssignmentVisitor(mutates=mutates)
-    visitor.visit(func_node)
-
-    if len(visitor.assignees) > 0:
-        raise AstSelfMutationError(func.__name__, list(visitor.assignees))
+    assignees = [name for name in assignments if is_illegal_assignment(name, mutates)]
+    if assignees:
+        raise AstSelfMutationError(func_name, assignees)
@@ -0,0 +1,108 @@
+import contextlib
+import functools
+import hashlib
+import json
+import marshal
+import os
+import sys
+from typing import Any, ClassVar
+
+# Bump when the content of step summaries changes
+CACHE_FORMAT = 3
+
+
+@functools.cache
+def _yaflux_version() -> str:
+    """Return the installed version of yaflux."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("yaflux")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class SummaryCache:
+    """In-memory and on-disk cache of step AST summaries.
+
+    Summaries are stored as one small JSON file per step under the directory
+    given by `YAFLUX_CACHE_DIR`, by default `~/.cache/yaflux/ast`. Setting
+    `YAFLUX_CACHE_DIR` to an empty string disables the disk cache.
+    """
+
+    _memory: ClassVar[dict[str, dict[str, Any]]] = {}
+
+    @classmethod
+    def directory(cls) -> str | None:
+        """Return the directory of the disk cache, or None if disabled."""
+        directory = os.environ.get("YAFLUX_CACHE_DIR")
+        if directory is None:
+            base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+                os.path.expanduser("~"), ".cache"
+            )
+            directory = os.path.join(base, "yaflux", "ast")
+        return directory or None
+
+    @classmethod
+    def key(cls, func) -> str | None:
+        """Identify a function by its compiled code and the yaflux version.
+
+        Any change to the source of the function changes its code object, so
+        the summary of a changed step is never served from the cache.
+        """
+        try:
+            code = marshal.dumps(func.__code__)
+        except (AttributeError, ValueError):
+            return None
+
+        digest = hashlib.sha256(code)
+        digest.update(
+            f"{CACHE_FORMAT}:{_yaflux_version()}:{sys.version_info[:2]}".encode()
+        )
+        return digest.hexdigest()
+
+    @classmethod
+    def get(cls, key: str) -> dict[str, Any] | None:
+        """Look up a summary in memory, then on disk."""
+        if key in cls._memory:
+            return cls._memory[key]
+
+        directory = cls.directory()
+        if directory is None:
+            return None
+        try:
+            with open(os.path.join(directory, key[:2], f"{key}.json")) as f:
+                summary = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        cls._memory[key] = summary
+        return summary
+
+    @classmethod
+    def put(cls, key: str, summary: dict[str, Any]) -> None:
+        """Store a summary in memory and on disk.
+
+        Failures to write to disk (e.g. a read-only home directory) are ignored.
+        """
+        cls._memory[key] = summary
+
+        directory = cls.directory()
+        if directory is None:
+            return
+
+        import tempfile  # only needed on cache misses
+
+        subdirectory = os.path.join(directory, key[:2])
+        with contextlib.suppress(OSError):
+            os.makedirs(subdirectory, exist_ok=True)
+            # Write atomically so concurrent imports never read partial files
+            fd, tmp_path = tempfile.mkstemp(dir=subdirectory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(summary, f)
+            os.replace(tmp_path, os.path.join(subdirectory, f"{key}.json"))
+
+    @classmethod
+    def clear_memory(cls) -> None:
+        """Forget the summaries cached in memory."""
+        cls._memory.clear()
@@ -0,0 +1,116 @@
+import ast
+
+# Attributes of the parameters which expose all of them at once, or any of them
+# by a key that may not be a constant
+_WHOLE_ATTRIBUTES = {"__dict__", "copy", "get", "items", "keys", "to_dict", "values"}
+
+
+def _is_self_parameters(node: ast.AST) -> bool:
+    """Check if a node is the expression `self.parameters`."""
+    return (
+        isinstance(node, ast.Attribute)
+        and isinstance(node.value, ast.Name)
+        and node.value.id == "self"
+        and node.attr == "parameters"
+    )
+
+
+def _constant_key(node: ast.AST) -> str | None:
+    """Return the value of a string constant node."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+class ParametersAccessVisitor(ast.NodeVisitor):
+    """AST visitor that finds all self.parameters accesses.
+
+    Records `self.parameters.{attr}`, `self.parameters["{key}"]` and
+    `self.parameters.get("{key}")`. Any other use of `self.parameters` (e.g.
+    passing it to a function, calling one of its methods, or indexing it with
+    a variable) marks the access as dynamic, since the parameters read cannot
+    be determined statically. So does any use of `self` other than through
+    `self.results` and `self.parameters` (e.g. calling a helper method or
+    passing `self` to a function), which may read any parameter.
+    """
+
+    def __init__(self):
+        self.accessed_params: set[str] = set()
+        self.dynamic = False
+
+    def visit_Call(self, node: ast.Call) -> None:
+        """Visit calls to find self.parameters.get("{key}") and other methods."""
+        func = node.func
+        if isinstance(func, ast.Attribute) and _is_self_parameters(func.value):
+            key = _constant_key(node.args[0]) if node.args else None
+            if func.attr == "get" and key is not None:
+                self.accessed_params.add(key)
+                arguments = [*node.args[1:], *node.keywords]
+            else:
+                # Methods of the parameters may read any of them
+                self.dynamic = True
+                arguments = [*node.args, *node.keywords]
+            for argument in arguments:
+                self.visit(argument)
+            return
+        self.generic_visit(node)
+
+    def visit_Subscript(self, node: ast.Subscript) -> None:
+        """Visit subscripts to find self.parameters["{key}"]."""
+        if _is_self_parameters(node.value):
+            key = _constant_key(node.slice)
+            if key is None:
+                self.dynamic = True
+            else:
+                self.accessed_params.add(key)
+            self.visit(node.slice)
+            return
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        """Visit attribute access nodes to find self.parameters.{attr}."""
+        if _is_self_parameters(node.value):
+            if node.attr in _WHOLE_ATTRIBUTES:
+                self.dynamic = True
+            else:
+                self.accessed_params.add(node.attr)
+            return
+        if _is_self_parameters(node):
+            # self.parameters used as a whole
+            self.dynamic = True
+            return
+        if (
+            isinstance(node.value, ast.Name)
+            and node.value.id == "self"
+            and node.attr == "results"
+        ):
+            return
+        self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        """Visit names to find uses of self other than its results and parameters."""
+        if node.id in ("self", "super"):
+            self.dynamic = True
+
+
+def infer_parameters(func) -> list[str] | None:
+    """Infer the names of the analysis parameters read by a step.
+
+    Parameters
+    ----------
+    func : Callable
+        The step function
+
+    Returns
+    -------
+    list[str] | None
+        The sorted names of the parameters read by the function, or None if
+        the function uses the parameters dynamically or its source cannot be
+        parsed.
+    """
+    from ._summary import summarize_step  # avoid circular import
+
+    try:
+        return summarize_step(func).parameters
+    except (OSError, TypeError, ValueError):
+        return None
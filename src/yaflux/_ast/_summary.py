@@ -0,0 +1,102 @@
+import ast
+from dataclasses import dataclass
+
+from ._assignment import _build_assignment_name, _get_leftmost_name
+from ._cache import SummaryCache
+from ._parameters import ParametersAccessVisitor
+from ._utils import get_function_node
+
+
+@dataclass
+class StepSummary:
+    """Everything validation and dependency inference need from a step's AST."""
+
+    # Names of the results accessed as `self.results.{attr}`
+    results: list[str]
+
+    # Full paths of the attributes of `self` assigned to (e.g. `self.results.x`)
+    assignments: list[str]
+
+    # Names of the parameters read, or None if they are used dynamically
+    parameters: list[str] | None
+
+    def to_dict(self):
+        return self.__dict__
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StepSummary":
+        return cls(
+            results=data["results"],
+            assignments=data["assignments"],
+            parameters=data["parameters"],
+        )
+
+
+class StepVisitor(ParametersAccessVisitor):
+    """AST visitor collecting results, parameters, and assignments in one pass."""
+
+    def __init__(self):
+        super().__init__()
+        self.accessed_attrs: set[str] = set()
+        self.assignments: set[str] = set()
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:  # noqa: N802
+        """Visit attribute access nodes in the AST."""
+        # Check for pattern: self.results.{attr}
+        if (
+            isinstance(node.value, ast.Attribute)
+            and isinstance(node.value.value, ast.Name)
+            and node.value.value.id == "self"
+            and node.value.attr == "results"
+        ):
+            self.accessed_attrs.add(node.attr)
+        super().visit_Attribute(node)
+
+    def visit_Assign(self, node: ast.Assign) -> None:  # noqa: N802
+        """Visit assignments to find assignments to attributes of self."""
+        # Check for pattern: self.{attr} = ...
+        if (
+            len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Attribute)
+            and _get_leftmost_name(node.targets[0]) == "self"
+        ):
+            self.assignments.add(_build_assignment_name(node.targets[0]))
+        self.generic_visit(node)
+
+    def summary(self) -> StepSummary:
+        return StepSummary(
+            results=sorted(self.accessed_attrs),
+            assignments=sorted(self.assignments),
+            parameters=None if self.dynamic else sorted(self.accessed_params),
+        )
+
+
+def summarize_step(func) -> StepSummary:
+    """Parse and visit a step function once, reusing cached summaries.
+
+    Summaries are cached in memory and on disk, keyed by the function's code
+    and the yaflux version, so unchanged steps are never parsed again.
+
+    Parameters
+    ----------
+    func : Callable
+        The step function
+
+    Returns
+    -------
+    StepSummary
+        The results, assignments, and parameters used by the function.
+    """
+    key = SummaryCache.key(func)
+    if key is not None:
+        cached = SummaryCache.get(key)
+        if cached is not None:
+            return StepSummary.from_dict(cached)
+
+    visitor = StepVisitor()
+    visitor.visit(get_function_node(func))
+    summary = visitor.summary()
+
+    if key is not None:
+        SummaryCache.put(key, summary.to_dict())
+    return summary
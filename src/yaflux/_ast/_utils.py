@@ -3,14 +3,14 @@ import inspect
 import textwrap
 
 
-def get_function_node(func) -> ast.FunctionDef:
-    """Extract the FunctionDef node from a function's source code."""
+def get_function_node(func) -> ast.FunctionDef | ast.AsyncFunctionDef:
+    """Extract the (Async)FunctionDef node from a function's source code."""
     # Get the source lines
     source_lines = inspect.getsource(func).splitlines()
 
-    # Find the first line that starts with 'def'
+    # Find the first line that starts with 'def' or 'async def'
     for i, line in enumerate(source_lines):
-        if line.lstrip().startswith("def "):
+        if line.lstrip().startswith(("def ", "async def ")):
             # Join from this line onwards
             func_source = "\n".join(source_lines[i:])
             # Dedent the source code to remove any indentation
@@ -22,7 +22,7 @@ def get_function_node(func) -> ast.FunctionDef:
     # Parse the function source
     try:
         tree = ast.parse(func_source)
-        if not isinstance(tree.body[0], ast.FunctionDef):
+        if not isinstance(tree.body[0], ast.FunctionDef | ast.AsyncFunctionDef):
             raise ValueError("Could not parse function definition")
         return tree.body[0]
     except SyntaxError as e:
@@ -1,5 +1,26 @@
-from ._assignment import validate_no_self_assignment
-from ._results import validate_step_requirements
+import os
+
+from ._assignment import check_no_self_assignment
+from ._results import check_results_usage
+from ._summary import summarize_step
+
+VALIDATION_MODES = ("eager", "lazy", "off")
+
+
+def validation_mode() -> str:
+    """Return the AST validation mode selected by `YAFLUX_VALIDATE`.
+
+    - "eager" (default): steps are validated when they are decorated
+    - "lazy": steps are validated the first time they are executed
+    - "off": steps are never validated
+    """
+    mode = os.environ.get("YAFLUX_VALIDATE", "eager").strip().lower() or "eager"
+    if mode not in VALIDATION_MODES:
+        raise ValueError(
+            f"Invalid YAFLUX_VALIDATE value: '{mode}'. "
+            + f"Expected one of {list(VALIDATION_MODES)}"
+        )
+    return mode
 
 
 def validate_ast(
@@ -8,5 +29,6 @@ def validate_ast(
     mutates: list[str],
 ) -> None:
     """Parse a function's AST and perform validation checks."""
-    validate_step_requirements(func, requires=requires + mutates)
-    validate_no_self_assignment(func, mutates=mutates)
+    summary = summarize_step(func)
+    check_results_usage(func.__name__, summary.results, requires + mutates)
+    check_no_self_assignment(func.__name__, summary.assignments, mutates)
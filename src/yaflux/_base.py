@@ -1,8 +1,7 @@
-from typing import Any
+from typing import Any, Literal
 
 from ._metadata import Metadata
 from ._results import Results, ResultsLock
-from ._yax import TarfileSerializer
 
 
 class Base:
@@ -67,6 +66,8 @@ class Base:
             "name": step_name,
             "creates": method.creates,
             "requires": method.requires,
+            "resources": method.resources,
+            "parameters": method.parameters,
             "completed": step_name in self._completed_steps,
         }
 
@@ -82,6 +83,20 @@ class Base:
             raise ValueError(f"Step '{step_name}' has not been completed")
         return self._results.get_step_results(step_name)
 
+    def step_durations(self) -> dict[str, float]:
+        """Return the elapsed time of each completed step in seconds."""
+        return {
+            step: self.get_step_metadata(step).elapsed for step in self._completed_steps
+        }
+
+    def stale_steps(self) -> list[str]:
+        """List completed steps whose inputs or parameters changed since they ran.
+
+        This includes every completed step downstream of a changed result. These
+        are the steps re-executed by `execute(mode="incremental")`.
+        """
+        return self._executor.stale_steps()
+
     def metadata_report(self) -> list[dict[str, Any]]:
         """Return the metadata for all completed steps.
 
@@ -98,31 +113,82 @@ class Base:
             for step in self._step_ordering
         ]
 
-    def save(self, filepath: str, force=False, compress=False):
+    def critical_path(self, durations: dict[str, float] | None = None):
+        """Compute the critical path of the analysis from recorded step timings.
+
+        The critical path is the longest-duration chain of dependent steps. It is
+        the end-to-end latency of the analysis with unlimited parallelism, so only
+        optimizing steps on it reduces the total runtime.
+
+        Parameters
+        ----------
+        durations : dict[str, float], optional
+            Duration of each step in seconds. Defaults to the `elapsed` time
+            recorded in the metadata of each completed step. Steps without a
+            duration are assumed to take no time.
+
+        Returns
+        -------
+        CriticalPath
+            The critical path, its length, the slack of every step, and the
+            theoretical speedup of unlimited parallelism.
+        """
+        from ._graph import compute_critical_path  # avoid circular import
+
+        if durations is None:
+            durations = self.step_durations()
+        return compute_critical_path(self._build_read_graph(), durations)
+
+    def save(
+        self,
+        filepath: str,
+        force=False,
+        compress=False,
+        workers=None,
+        backend=None,
+        chunks=None,
+    ):
         """Save the analysis to a file.
 
-        If the filepath ends in .yax, saves in yaflux archive format.
+        The layout of the archive is picked from the extension of the path:
+
+        - `.yax` (or `.yax.gz`): a tar file, the default for other paths
+        - `.yax.zip`: a zip file, with random access to each result
+        - `.yaxd`: an unpacked directory, where every result is a separate file
+        - `.yax.sqlite`: an SQLite database, suited to many small results
 
         Parameters
         ----------
         filepath : str
             Path to save the analysis
         force : bool, optional
-            Whether to overwrite existing file, by default False
+            Whether to overwrite existing file, by default False. Saving over an
+            existing directory or SQLite archive only rewrites the changed results.
         compress : bool, optional
-            Whether to compress the file, by default False
+            Whether to compress the file, by default False. Directory and SQLite
+            archives are not compressed as a whole, instead the components of
+            sparse matrices are compressed separately.
+        workers : int, optional
+            Number of threads serializing results, by default only concurrent
+            for directory archives
+        backend : type[ArchiveBackend], optional
+            Backend storing the archive, overriding the extension
+        chunks : dict[str, int | tuple[int | None, ...]], optional
+            Chunk shapes of array results to store as a grid of separately
+            readable chunks, by result name. A None chunk size spans the whole
+            dimension and a single integer only chunks the first dimension.
         """
-        if filepath.endswith(TarfileSerializer.EXTENSION):
-            TarfileSerializer.save(filepath, self, force=force, compress=compress)
-        elif filepath.endswith(TarfileSerializer.COMPRESSED_EXTENSION):
-            TarfileSerializer.save(filepath, self, force=force, compress=True)
-        else:
-            TarfileSerializer.save(
-                f"{filepath}.{TarfileSerializer.EXTENSION}",
-                self,
-                force=force,
-                compress=compress,
-            )
+        from ._yax import ArchiveSerializer
+
+        ArchiveSerializer.save(
+            filepath,
+            self,
+            force=force,
+            compress=compress,
+            workers=workers,
+            backend=backend,
+            chunks=chunks,
+        )
 
     @classmethod
     def load(
@@ -132,6 +198,11 @@ class Base:
         no_results: bool = False,
         select: list[str] | str | None = None,
         exclude: list[str] | str | None = None,
+        columns: dict[str, list[str]] | None = None,
+        rows: dict[str, slice | tuple[int, int]] | None = None,
+        slices: dict[str, Any] | None = None,
+        backed: list[str] | str | None = None,
+        components: dict[str, list[str]] | None = None,
     ):
         """Load an analysis object from a file.
 
@@ -146,6 +217,23 @@ class Base:
             Only load specific results (yaflux archive format only), by default None
         exclude : Optional[List[str]], optional
             Skip specific results (yaflux archive format only), by default None
+        columns : Optional[Dict[str, List[str]]], optional
+            Only load specific columns of tabular results, by result name, by
+            default None
+        rows : Optional[Dict[str, slice | tuple[int, int]]], optional
+            Only load a range of rows of tabular results, by result name, by
+            default None
+        slices : Optional[Dict[str, Any]], optional
+            Only load a slice (e.g. `np.s_[:1000, :]`) of array results, by
+            result name, by default None
+        backed : Optional[List[str]], optional
+            Open specific results in read-only backed mode, reading their data
+            on demand (AnnData results, and memory mapped sparse matrices, of
+            `.yaxd` archives only), by default None
+        components : Optional[Dict[str, List[str]]], optional
+            Only load specific components (e.g. `["obs", "obsm/X_umap"]`) of
+            AnnData results, or items (e.g. `["sample_a", "folds/0"]`) of dict,
+            list and tuple results, by result name, by default None
 
         Returns
         -------
@@ -160,7 +248,16 @@ class Base:
         from ._loaders import load
 
         return load(
-            filepath, cls, no_results=no_results, select=select, exclude=exclude
+            filepath,
+            cls,
+            no_results=no_results,
+            select=select,
+            exclude=exclude,
+            columns=columns,
+            rows=rows,
+            slices=slices,
+            backed=backed,
+            components=components,
         )
 
     def _build_read_graph(self) -> dict[str, set[str]]:
@@ -250,8 +347,8 @@ class Base:
     def visualize_dependencies(self, *args, **kwargs):
         """Create a visualization of step dependencies.
 
-        This is a stub that will be replaced with the actual visualization
-        if graphviz is installed. Install with:
+        Requires graphviz, which is only imported when this method is called.
+        Install with:
 
         ```bash
         pip install yaflux[viz]
@@ -261,31 +358,109 @@ class Base:
         ------
             ImportError: If graphviz is not installed.
         """
-        raise ImportError(
-            "graphviz package is required for visualization. "
-            "Install with: pip install yaflux[viz]"
-        )
+        from ._viz import visualize_dependencies
+
+        return visualize_dependencies(self, *args, **kwargs)
 
     def execute(
         self,
         target_step: str | None = None,
         force: bool = False,
         panic_on_existing: bool = False,
+        workers: int = 1,
+        durations: dict[str, float] | None = None,
+        resources: dict[str, Any] | None = None,
+        requirements: dict[str, Any] | None = None,
+        mode: Literal["default", "incremental"] = "default",
     ) -> Any:
-        """Execute analysis steps in dependency order up to target_step."""
+        """Execute analysis steps in dependency order up to target_step.
+
+        Parameters
+        ----------
+        target_step : str, optional
+            Only execute the steps up to and including this step.
+        force : bool, optional
+            Whether to re-run steps that have already been completed.
+        panic_on_existing : bool, optional
+            Whether to raise an error if a result already exists.
+        workers : int, optional
+            Number of steps to run concurrently, by default 1 (sequential).
+        durations : dict[str, float], optional
+            Historical duration of each step (e.g. `previous.step_durations()`)
+            used to prioritize steps with the longest remaining critical path
+            when running in parallel.
+        resources : dict[str, Any], optional
+            Resources available to the analysis (e.g. `{"cpus": 64, "memory":
+            "256GB"}`). When provided, steps are only run concurrently if their
+            combined requirements fit. Undeclared resources are unlimited.
+        requirements : dict[str, dict[str, Any]], optional
+            Measured resource requirements of steps which do not declare them
+            with `@step(resources=...)`.
+        mode : {"default", "incremental"}, optional
+            How completed steps are handled. By default they are skipped. In
+            incremental mode, completed steps whose inputs changed since they
+            ran (and every step downstream of them) are executed again.
+        """
         return self._executor.execute(
-            target_step=target_step, force=force, panic_on_existing=panic_on_existing
+            target_step=target_step,
+            force=force,
+            panic_on_existing=panic_on_existing,
+            workers=workers,
+            durations=durations,
+            resources=resources,
+            requirements=requirements,
+            mode=mode,
         )
 
-    def execute_all(self, force: bool = False, panic_on_existing: bool = False) -> None:
-        """Execute all available steps in the analysis."""
-        self._executor.execute_all(force=force, panic_on_existing=panic_on_existing)
+    async def execute_async(
+        self,
+        target_step: str | None = None,
+        force: bool = False,
+        panic_on_existing: bool = False,
+        mode: Literal["default", "incremental"] = "default",
+    ) -> Any:
+        """Execute analysis steps concurrently on the running event loop.
 
+        Steps defined with `async def` run concurrently with every other step
+        whose dependencies are complete. Synchronous steps run inline.
 
-try:
-    from ._viz import _check_graphviz, visualize_dependencies
+        Parameters
+        ----------
+        target_step : str, optional
+            Only execute the steps up to and including this step.
+        force : bool, optional
+            Whether to re-run steps that have already been completed.
+        panic_on_existing : bool, optional
+            Whether to raise an error if a result already exists.
+        mode : {"default", "incremental"}, optional
+            How completed steps are handled. By default they are skipped. In
+            incremental mode, completed steps whose inputs changed since they
+            ran (and every step downstream of them) are executed again.
+        """
+        return await self._executor.execute_async(
+            target_step=target_step,
+            force=force,
+            panic_on_existing=panic_on_existing,
+            mode=mode,
+        )
 
-    if _check_graphviz():
-        Base.visualize_dependencies = visualize_dependencies  # type: ignore
-except ImportError:
-    pass  # Keep the stub method
+    def execute_all(
+        self,
+        force: bool = False,
+        panic_on_existing: bool = False,
+        workers: int = 1,
+        durations: dict[str, float] | None = None,
+        resources: dict[str, Any] | None = None,
+        requirements: dict[str, Any] | None = None,
+        mode: Literal["default", "incremental"] = "default",
+    ) -> None:
+        """Execute all available steps in the analysis."""
+        self._executor.execute_all(
+            force=force,
+            panic_on_existing=panic_on_existing,
+            workers=workers,
+            durations=durations,
+            resources=resources,
+            requirements=requirements,
+            mode=mode,
+        )
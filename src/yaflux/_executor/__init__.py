@@ -3,11 +3,17 @@ from ._error import (
     ExecutorCircularDependencyError,
     ExecutorMissingStartError,
     ExecutorMissingTargetStepError,
+    ExecutorResourceError,
 )
+from ._scheduler import CriticalPathScheduler, ResourceScheduler, Scheduler
 
 __all__ = [
+    "CriticalPathScheduler",
     "Executor",
     "ExecutorCircularDependencyError",
     "ExecutorMissingStartError",
     "ExecutorMissingTargetStepError",
+    "ExecutorResourceError",
+    "ResourceScheduler",
+    "Scheduler",
 ]
@@ -1,20 +1,52 @@
+import inspect
+import weakref
 from collections import deque
-from typing import Any
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Literal
 
 from .._base import Base
-from .._graph import build_read_graph
+from .._graph import build_read_graph, build_write_graph
+from .._resources import Resources
 from ._error import (
     ExecutorCircularDependencyError,
     ExecutorMissingStartError,
     ExecutorMissingTargetStepError,
 )
+from ._parallel import ReadyQueue
+from ._scheduler import CriticalPathScheduler, ResourceScheduler, Scheduler
+from ._stale import find_stale_steps
+
+ExecutionMode = Literal["default", "incremental"]
+
+
+def _run_step(method, **kwargs) -> Any:
+    """Run a step to completion, driving coroutine steps on a new event loop."""
+    result = method(**kwargs)
+    if inspect.iscoroutine(result):
+        import asyncio
+
+        return asyncio.run(result)
+    return result
+
+
+async def _await_step(method, **kwargs) -> Any:
+    """Run a step on the current event loop.
+
+    Synchronous steps run inline and block the loop while they execute.
+    """
+    result = method(**kwargs)
+    if inspect.iscoroutine(result):
+        return await result
+    return result
 
 
 class Executor:
     """Handles execution order and dependency management for analysis pipelines."""
 
     def __init__(self, analysis: "Base"):
-        self._analysis = analysis
+        # A proxy avoids a reference cycle which would keep the analysis (and
+        # all of its results) alive until the next garbage collection
+        self._analysis = weakref.proxy(analysis)
 
     def _calculate_indegrees(self, graph: dict[str, set[str]]) -> dict[str, int]:
         """Calculate the indegree of each step in the dependency graph."""
@@ -59,13 +91,8 @@ class Executor:
 
         return execution_order
 
-    def execute(
-        self,
-        target_step: str | None = None,
-        force: bool = False,
-        panic_on_existing: bool = False,
-    ) -> Any:
-        """Execute analysis steps in dependency order up to target_step."""
+    def _get_trimmed_execution_order(self, target_step: str | None) -> list[str]:
+        """Determine the order of step execution up to the target step."""
         execution_order = self._get_execution_order()
 
         # If target specified, trim execution order to that step
@@ -77,15 +104,291 @@ class Executor:
             target_idx = execution_order.index(target_step)
             execution_order = execution_order[: target_idx + 1]
 
+        return execution_order
+
+    def _step_requirements(
+        self, graph: dict[str, set[str]], requirements: dict[str, Any] | None
+    ) -> dict[str, Resources]:
+        """Resolve the resources required by each step.
+
+        Resources declared on the step take precedence over provided requirements.
+        """
+        requirements = requirements or {}
+        resolved = {}
+        for step in graph:
+            declared = getattr(self._analysis.__class__, step).resources
+            if declared is not None:
+                resolved[step] = declared
+            elif step in requirements:
+                resolved[step] = Resources.parse(requirements[step])
+        return resolved
+
+    def _build_scheduler(
+        self,
+        graph: dict[str, set[str]],
+        durations: dict[str, float] | None,
+        resources: dict[str, Any] | None,
+        requirements: dict[str, Any] | None,
+    ) -> Scheduler:
+        """Build the scheduler prioritizing ready steps during parallel execution."""
+        if durations is None:
+            durations = self._analysis.step_durations()
+        if resources is None:
+            return CriticalPathScheduler(graph, durations)
+        return ResourceScheduler(
+            graph,
+            durations,
+            self._step_requirements(graph, requirements),
+            Resources.budget(resources),
+        )
+
+    def _restrict_graphs(
+        self, execution_order: list[str]
+    ) -> tuple[dict[str, set[str]], dict[str, set[str]]]:
+        """Build the read and write graphs restricted to the steps of a run."""
+        steps = set(execution_order)
+        graph = build_read_graph(self._analysis)
+        wgraph = build_write_graph(self._analysis)
+        return (
+            {step: graph[step] & steps for step in execution_order},
+            {step: wgraph[step] & steps for step in execution_order},
+        )
+
+    def stale_steps(self) -> list[str]:
+        """List the completed steps invalidated by changes to their inputs."""
+        stale = find_stale_steps(self._analysis, build_read_graph(self._analysis))
+        return [step for step in self._get_execution_order() if step in stale]
+
+    def _get_rerun_steps(
+        self, execution_order: list[str], force: bool, mode: ExecutionMode
+    ) -> set[str]:
+        """Determine which completed steps of a run are executed again."""
+        if mode not in ("default", "incremental"):
+            raise ValueError(f"Unknown execution mode: '{mode}'")
+        if force:
+            return set(execution_order)
+        if mode == "incremental":
+            return set(self.stale_steps()) & set(execution_order)
+        return set()
+
+    def _execute_parallel(
+        self,
+        execution_order: list[str],
+        workers: int,
+        durations: dict[str, float] | None,
+        resources: dict[str, Any] | None,
+        requirements: dict[str, Any] | None,
+        rerun: set[str],
+        panic_on_existing: bool,
+    ) -> dict[str, Any]:
+        """Execute steps concurrently on a fixed number of worker threads.
+
+        Ready steps are started in the order given by the scheduler. Steps which
+        mutate results read by a running step, or which do not fit in the resource
+        budget left over by the running steps, are held back until they finish.
+
+        Returns
+        -------
+        dict[str, Any]
+            The return value of each executed step.
+        """
+        graph, wgraph = self._restrict_graphs(execution_order)
+        scheduler = self._build_scheduler(graph, durations, resources, requirements)
+        queue = ReadyQueue(execution_order, graph, wgraph)
+
+        def skip(step: str) -> bool:
+            return step in self._analysis.completed_steps and step not in rerun
+
+        outputs = {}
+        futures: dict[Future, str] = {}
+        error = None
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while queue.ready or futures:
+                if error is None:
+                    slots = workers - len(futures)
+                    for step in queue.select(
+                        scheduler.prioritize, scheduler.admit, skip, slots
+                    ):
+                        future = pool.submit(
+                            _run_step,
+                            getattr(self._analysis, step),
+                            force=step in rerun,
+                            panic_on_existing=panic_on_existing,
+                        )
+                        futures[future] = step
+
+                if not futures:
+                    break
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = futures.pop(future)
+                    if future.exception() is not None:
+                        error = error or future.exception()
+                        continue
+                    outputs[step] = future.result()
+                    queue.finish(step)
+
+        if error is not None:
+            raise error
+
+        return outputs
+
+    def execute(
+        self,
+        target_step: str | None = None,
+        force: bool = False,
+        panic_on_existing: bool = False,
+        workers: int = 1,
+        durations: dict[str, float] | None = None,
+        resources: dict[str, Any] | None = None,
+        requirements: dict[str, Any] | None = None,
+        mode: ExecutionMode = "default",
+    ) -> Any:
+        """Execute analysis steps in dependency order up to target_step.
+
+        Parameters
+        ----------
+        target_step : str, optional
+            Only execute the steps up to and including this step.
+        force : bool, optional
+            Whether to re-run steps that have already been completed.
+        panic_on_existing : bool, optional
+            Whether to raise an error if a result already exists.
+        workers : int, optional
+            Number of steps to run concurrently, by default 1 (sequential).
+        durations : dict[str, float], optional
+            Historical duration of each step used to start the steps with the
+            longest remaining critical path first when running in parallel.
+            Defaults to the elapsed times of previously completed steps.
+        resources : dict[str, Any], optional
+            Resources available to the analysis (e.g. `{"cpus": 64, "memory":
+            "256GB"}`). When provided, steps are only run concurrently if their
+            combined requirements fit. Undeclared resources are unlimited.
+        requirements : dict[str, dict[str, Any]], optional
+            Measured resource requirements of steps which do not declare them.
+        mode : {"default", "incremental"}, optional
+            How completed steps are handled. By default they are skipped. In
+            incremental mode, completed steps whose inputs changed since they
+            ran (and every step downstream of them) are executed again.
+        """
+        execution_order = self._get_trimmed_execution_order(target_step)
+        rerun = self._get_rerun_steps(execution_order, force, mode)
+
+        if workers > 1:
+            outputs = self._execute_parallel(
+                execution_order,
+                workers,
+                durations,
+                resources,
+                requirements,
+                rerun,
+                panic_on_existing,
+            )
+            return outputs.get(target_step) if target_step else None
+
         # Execute steps in order
         result = None
         for step_name in execution_order:
             method = getattr(self._analysis, step_name)
-            if step_name not in self._analysis.completed_steps or force:
-                result = method(force=force, panic_on_existing=panic_on_existing)
+            if step_name not in self._analysis.completed_steps or step_name in rerun:
+                result = _run_step(
+                    method,
+                    force=step_name in rerun,
+                    panic_on_existing=panic_on_existing,
+                )
 
         return result if target_step else None
 
-    def execute_all(self, force: bool = False, panic_on_existing: bool = False) -> None:
+    async def execute_async(
+        self,
+        target_step: str | None = None,
+        force: bool = False,
+        panic_on_existing: bool = False,
+        mode: ExecutionMode = "default",
+    ) -> Any:
+        """Execute analysis steps concurrently on the running event loop.
+
+        Every step is started as soon as its dependencies are complete, so
+        independent coroutine steps overlap while they await. Synchronous steps
+        run inline and block the loop while they execute.
+
+        Parameters
+        ----------
+        target_step : str, optional
+            Only execute the steps up to and including this step.
+        force : bool, optional
+            Whether to re-run steps that have already been completed.
+        panic_on_existing : bool, optional
+            Whether to raise an error if a result already exists.
+        mode : {"default", "incremental"}, optional
+            How completed steps are handled. By default they are skipped. In
+            incremental mode, completed steps whose inputs changed since they
+            ran (and every step downstream of them) are executed again.
+        """
+        import asyncio
+
+        execution_order = self._get_trimmed_execution_order(target_step)
+        rerun = self._get_rerun_steps(execution_order, force, mode)
+        graph, wgraph = self._restrict_graphs(execution_order)
+        scheduler = Scheduler(graph)
+        queue = ReadyQueue(execution_order, graph, wgraph)
+
+        def skip(step: str) -> bool:
+            return step in self._analysis.completed_steps and step not in rerun
+
+        outputs = {}
+        tasks: dict[asyncio.Task, str] = {}
+        error = None
+        while queue.ready or tasks:
+            if error is None:
+                slots = len(execution_order)
+                for step in queue.select(
+                    scheduler.prioritize, scheduler.admit, skip, slots
+                ):
+                    task = asyncio.ensure_future(
+                        _await_step(
+                            getattr(self._analysis, step),
+                            force=step in rerun,
+                            panic_on_existing=panic_on_existing,
+                        )
+                    )
+                    tasks[task] = step
+
+            if not tasks:
+                break
+
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                step = tasks.pop(task)
+                if task.exception() is not None:
+                    error = error or task.exception()
+                    continue
+                outputs[step] = task.result()
+                queue.finish(step)
+
+        if error is not None:
+            raise error
+
+        return outputs.get(target_step) if target_step else None
+
+    def execute_all(
+        self,
+        force: bool = False,
+        panic_on_existing: bool = False,
+        workers: int = 1,
+        durations: dict[str, float] | None = None,
+        resources: dict[str, Any] | None = None,
+        requirements: dict[str, Any] | None = None,
+        mode: ExecutionMode = "default",
+    ) -> None:
         """Execute all available steps in the analysis."""
-        self.execute(force=force, panic_on_existing=panic_on_existing)
+        self.execute(
+            force=force,
+            panic_on_existing=panic_on_existing,
+            workers=workers,
+            durations=durations,
+            resources=resources,
+            requirements=requirements,
+            mode=mode,
+        )
@@ -8,3 +8,7 @@ class ExecutorCircularDependencyError(Exception):
 
 class ExecutorMissingTargetStepError(Exception):
     """Raised when the target step is not found in the analysis."""
+
+
+class ExecutorResourceError(Exception):
+    """Raised when a step requires more resources than are available."""
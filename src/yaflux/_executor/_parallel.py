@@ -0,0 +1,95 @@
+from collections.abc import Callable
+
+
+class ReadyQueue:
+    """Tracks which steps of a run are ready, running, and finished.
+
+    Parameters
+    ----------
+    execution_order : list[str]
+        The steps of the run in topological order.
+    graph : dict[str, set[str]]
+        Read dependencies of each step restricted to the steps of the run.
+    wgraph : dict[str, set[str]]
+        Write dependencies of each step restricted to the steps of the run.
+    """
+
+    def __init__(
+        self,
+        execution_order: list[str],
+        graph: dict[str, set[str]],
+        wgraph: dict[str, set[str]],
+    ):
+        self._graph = graph
+        self._wgraph = wgraph
+        self._pending = {step: set(graph[step]) for step in execution_order}
+        self._dependents = {step: [] for step in execution_order}
+        for step in execution_order:
+            for dep in graph[step]:
+                self._dependents[dep].append(step)
+
+        self.ready = [step for step in execution_order if not self._pending[step]]
+        self.running: set[str] = set()
+
+    def has_conflict(self, step: str) -> bool:
+        """Check if a step mutates results read by a running step or vice versa."""
+        return any(
+            (self._wgraph[step] & self._graph[other])
+            or (self._wgraph[other] & self._graph[step])
+            for other in self.running
+        )
+
+    def start(self, step: str) -> None:
+        """Mark a ready step as running."""
+        self.ready.remove(step)
+        self.running.add(step)
+
+    def finish(self, step: str) -> None:
+        """Mark a step as finished and release the steps depending on it."""
+        self.running.discard(step)
+        if step in self.ready:
+            self.ready.remove(step)
+        for dependent in self._dependents[step]:
+            self._pending[dependent].discard(step)
+            if not self._pending[dependent]:
+                self.ready.append(dependent)
+
+    def select(
+        self,
+        prioritize: Callable[[list[str]], list[str]],
+        admit: Callable[[str, set[str]], bool],
+        skip: Callable[[str], bool],
+        slots: int,
+    ) -> list[str]:
+        """Select ready steps to start next.
+
+        Steps for which `skip` is true are finished immediately without running.
+        Steps conflicting with running steps or not admitted are held back.
+
+        Parameters
+        ----------
+        prioritize : Callable[[list[str]], list[str]]
+            Orders the ready steps from highest to lowest priority.
+        admit : Callable[[str, set[str]], bool]
+            Whether a step can start alongside the running steps.
+        skip : Callable[[str], bool]
+            Whether a step can be finished without running it.
+        slots : int
+            Maximum number of steps to select.
+        """
+        selected = []
+        progress = True
+        while progress:
+            progress = False
+            for step in prioritize(self.ready):
+                if len(selected) >= slots:
+                    return selected
+                if skip(step):
+                    self.finish(step)
+                    progress = True
+                    break
+                if self.has_conflict(step) or not admit(step, self.running):
+                    continue
+                self.start(step)
+                selected.append(step)
+        return selected
@@ -0,0 +1,135 @@
+from itertools import chain
+from typing import Any
+
+from .._base import Base
+from .._fingerprint import fingerprint_parameters
+
+
+def _downstream(step: str, dependents: dict[str, set[str]]) -> set[str]:
+    """Find the steps depending on a step, directly or transitively."""
+    found: set[str] = set()
+    queue = [step]
+    while queue:
+        for other in dependents[queue.pop()]:
+            if other not in found:
+                found.add(other)
+                queue.append(other)
+    return found
+
+
+def _version_read(
+    analysis: Base, key: str, downstream: set[str], writers: dict[str, str]
+) -> str | None:
+    """Version of an input before the steps downstream of its reader wrote it.
+
+    A step mutating a result after a step reading it (e.g. because it requires
+    the reader) does not change what the reader saw, so the versions written by
+    such steps are traced back to the version they mutated.
+    """
+    version = analysis._results.get_version(key)
+    seen = set()
+    while version in writers and writers[version] in downstream:
+        writer = analysis._results._metadata[writers[version]]
+        if version in seen or writer.input_versions is None:
+            break
+        seen.add(version)
+        version = writer.input_versions.get(key)
+    return version
+
+
+def _inputs_changed(
+    analysis: Base,
+    step: str,
+    method: Any,
+    dependents: dict[str, set[str]],
+    writers: dict[str, str],
+) -> bool:
+    """Check if the inputs of a completed step changed since it ran."""
+    metadata = analysis._results._metadata.get(step)
+    if metadata is None or metadata.input_versions is None:
+        return False
+
+    changed = [
+        key
+        for key in chain(method.requires, method.requires_flags)
+        if analysis._results.get_version(key) != metadata.input_versions.get(key)
+    ]
+    if changed:
+        downstream = _downstream(step, dependents)
+        if any(
+            _version_read(analysis, key, downstream, writers)
+            != metadata.input_versions.get(key)
+            for key in changed
+        ):
+            return True
+
+    return (
+        metadata.parameters_fingerprint is not None
+        and fingerprint_parameters(analysis.parameters, method.parameters)
+        != metadata.parameters_fingerprint
+    )
+
+
+def find_stale_steps(analysis: Base, graph: dict[str, set[str]]) -> set[str]:
+    """Find the completed steps invalidated by changes to their inputs.
+
+    A step is stale if the version of a result or flag it requires, or the value
+    of a parameter it reads, changed since it ran. Versions written by steps
+    downstream of the step itself (e.g. a mutation of a result after the step
+    read it) do not count as changes. Staleness then propagates to
+    every step depending on a stale step, and to the creators of results mutated
+    by a stale step, since re-applying a mutation requires the unmutated result.
+
+    Steps without recorded input versions are assumed to be up to date.
+
+    Parameters
+    ----------
+    analysis : Base
+        The analysis to inspect.
+    graph : dict[str, set[str]]
+        Graph indexed by step name with values as sets of dependent step names.
+        An edge A -> B means step A depends on step B.
+
+    Returns
+    -------
+    set[str]
+        The names of the stale steps.
+    """
+    completed = set(analysis.completed_steps)
+    methods = {step: getattr(analysis.__class__, step) for step in graph}
+
+    creators = {}
+    dependents = {step: set() for step in graph}
+    for step, method in methods.items():
+        for item in chain(method.creates, method.creates_flags):
+            creators[item] = step
+        for dep in graph[step]:
+            dependents[dep].add(step)
+
+    # Steps by the version they last wrote
+    writers = {
+        metadata.version: step
+        for step, metadata in analysis._results._metadata.items()
+        if step in completed and metadata.version
+    }
+
+    # Steps whose inputs changed directly
+    stale = {
+        step
+        for step in completed & set(graph)
+        if _inputs_changed(analysis, step, methods[step], dependents, writers)
+    }
+
+    # Propagate to everything downstream of the stale steps
+    queue = list(stale)
+    while queue:
+        step = queue.pop()
+        affected = dependents[step] | {
+            creators[key] for key in methods[step].mutates if key in creators
+        }
+        for other in affected & completed:
+            if other not in stale:
+                stale.add(other)
+                queue.append(other)
+
+    return stale
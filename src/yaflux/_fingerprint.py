@@ -0,0 +1,140 @@
+import hashlib
+import pickle
+import sys
+from collections.abc import Mapping
+from types import SimpleNamespace
+from typing import Any
+
+# Stands in for parameters missing from the analysis parameters
+_MISSING = "<missing>"
+
+
+def _item_digest(obj: Any) -> bytes:
+    """Digest a single item of an unordered container."""
+    digest = hashlib.blake2b(digest_size=16)
+    _update(digest, obj)
+    return digest.digest()
+
+
+def _update_unordered(digest: Any, obj: dict | set | frozenset) -> None:
+    """Feed a dict or set into a digest, independent of its iteration order.
+
+    Items are sorted by their digests, so the fingerprint depends on neither
+    insertion order nor the hash seed.
+    """
+    digest.update(f"{type(obj).__name__}:{len(obj)}".encode())
+    if isinstance(obj, dict):
+        items = sorted(
+            ((_item_digest(key), value) for key, value in obj.items()),
+            key=lambda item: item[0],
+        )
+        for key_digest, value in items:
+            digest.update(key_digest)
+            _update(digest, value)
+    else:
+        for item_digest in sorted(_item_digest(item) for item in obj):
+            digest.update(item_digest)
+
+
+def _update(digest: Any, obj: Any) -> None:
+    """Feed the content of an object into a digest."""
+    if obj is None or isinstance(obj, bool | int | float | complex | str | bytes):
+        digest.update(repr((type(obj).__name__, obj)).encode())
+        return
+
+    if isinstance(obj, list | tuple):
+        digest.update(f"{type(obj).__name__}:{len(obj)}".encode())
+        for item in obj:
+            _update(digest, item)
+        return
+
+    if isinstance(obj, dict | set | frozenset):
+        _update_unordered(digest, obj)
+        return
+
+    # Only check optional types if their modules were already imported
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(obj, np.ndarray) and obj.dtype != object:
+        digest.update(f"ndarray:{obj.dtype.str}:{obj.shape}".encode())
+        # Contiguous arrays are hashed in place, without copying their data
+        digest.update(np.ascontiguousarray(obj).data)
+        return
+
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(obj, pd.DataFrame | pd.Series):
+        digest.update(f"{type(obj).__name__}:{obj.shape}".encode())
+        digest.update(repr(obj.dtypes).encode())
+        if isinstance(obj, pd.DataFrame):
+            _update(digest, list(obj.columns))
+        digest.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+        return
+
+    # Namespaces are hashed by their attributes, so arrays are not pickled
+    if isinstance(obj, SimpleNamespace):
+        digest.update(f"{type(obj).__qualname__}:".encode())
+        _update(digest, vars(obj))
+        return
+
+    digest.update(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def fingerprint(obj: Any) -> str | None:
+    """Compute a content fingerprint of an object.
+
+    Containers are hashed recursively, numpy arrays and pandas objects by their
+    data buffers, and other objects by their pickled representation.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to fingerprint.
+
+    Returns
+    -------
+    str | None
+        A hex digest identifying the content of the object, or None if the
+        object cannot be fingerprinted.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        _update(digest, obj)
+    except Exception:
+        return None
+    return digest.hexdigest()
+
+
+def _parameter_value(parameters: Any, name: str) -> Any:
+    """Look up a parameter by key or attribute, returning a marker if missing."""
+    if isinstance(parameters, Mapping):
+        return parameters.get(name, _MISSING)
+    return getattr(parameters, name, _MISSING)
+
+
+def fingerprint_parameters(parameters: Any, names: list[str] | None) -> str | None:
+    """Fingerprint the subset of the parameters a step depends on.
+
+    Parameters
+    ----------
+    parameters : Any
+        The analysis parameters. Parameters are looked up by key in mappings
+        and by attribute otherwise.
+    names : list[str] | None
+        Names of the parameters to fingerprint, or None for all parameters.
+
+    Returns
+    -------
+    str | None
+        A hex digest identifying the parameter values, or None if they cannot be
+        fingerprinted.
+    """
+    if names is None:
+        return fingerprint(parameters)
+    if not names:
+        return _NO_PARAMETERS
+    return fingerprint(
+        {name: _parameter_value(parameters, name) for name in sorted(names)}
+    )
+
+
+# Fingerprint of steps reading no parameters, the same for every call
+_NO_PARAMETERS = fingerprint({})
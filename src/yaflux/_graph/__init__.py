@@ -1,12 +1,16 @@
+from ._critical import CriticalPath, compute_bottom_levels, compute_critical_path
 from ._error import CircularDependencyError, MutabilityConflictError
 from ._utils import build_read_graph, build_write_graph, compute_topological_levels
 from ._validation import validate_incompatible_mutability
 
 __all__ = [
     "CircularDependencyError",
+    "CriticalPath",
     "MutabilityConflictError",
     "build_read_graph",
     "build_write_graph",
+    "compute_bottom_levels",
+    "compute_critical_path",
     "compute_topological_levels",
     "validate_incompatible_mutability",
 ]
@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+
+from ._utils import compute_topological_levels
+
+
+@dataclass
+class CriticalPath:
+    """Critical path analysis of an analysis dependency graph."""
+
+    # The longest-duration chain of dependent steps in execution order
+    path: list[str]
+
+    # The duration of the critical path (end-to-end latency with unlimited workers)
+    length: float
+
+    # The sum of all step durations (end-to-end latency of serial execution)
+    total: float
+
+    # How long each step can be delayed without delaying the critical path
+    slack: dict[str, float]
+
+    @property
+    def speedup(self) -> float:
+        """Theoretical speedup of unlimited parallelism over serial execution."""
+        if self.length <= 0:
+            return 1.0
+        return self.total / self.length
+
+    def to_dict(self):
+        return {**self.__dict__, "speedup": self.speedup}
+
+
+def compute_bottom_levels(
+    graph: dict[str, set[str]], durations: dict[str, float]
+) -> dict[str, float]:
+    """Compute the remaining critical path length starting at each step.
+
+    A step's bottom level is its own duration plus the largest bottom level of
+    any step that depends on it.
+
+    Parameters
+    ----------
+    graph : dict[str, set[str]]
+        Graph indexed by step name with values as sets of dependent step names.
+        An edge A -> B means step A depends on step B.
+    durations : dict[str, float]
+        Duration of each step. Missing steps are assumed to take no time.
+
+    Returns
+    -------
+    dict[str, float]
+        Mapping of step names to their bottom level.
+    """
+    levels = compute_topological_levels(graph)
+    dependents = {node: set() for node in graph}
+    for node, deps in graph.items():
+        for dep in deps:
+            dependents[dep].add(node)
+
+    bottom = {}
+    for node in sorted(graph, key=lambda n: levels[n], reverse=True):
+        bottom[node] = durations.get(node, 0.0) + max(
+            (bottom[d] for d in dependents[node]), default=0.0
+        )
+    return bottom
+
+
+def compute_critical_path(
+    graph: dict[str, set[str]], durations: dict[str, float]
+) -> CriticalPath:
+    """Compute the critical path of the dependency graph.
+
+    Parameters
+    ----------
+    graph : dict[str, set[str]]
+        Graph indexed by step name with values as sets of dependent step names.
+        An edge A -> B means step A depends on step B.
+    durations : dict[str, float]
+        Duration of each step. Missing steps are assumed to take no time.
+
+    Returns
+    -------
+    CriticalPath
+        The critical path, its length, and the slack of every step.
+    """
+    levels = compute_topological_levels(graph)
+    order = sorted(graph, key=lambda n: (levels[n], n))
+
+    # Earliest finish time of each step with unlimited workers
+    finish = {}
+    for node in order:
+        start = max((finish[dep] for dep in graph[node]), default=0.0)
+        finish[node] = start + durations.get(node, 0.0)
+
+    length = max(finish.values(), default=0.0)
+
+    # Slack is the distance between earliest start and latest start
+    bottom = compute_bottom_levels(graph, durations)
+    slack = {
+        node: max(
+            0.0, length - (finish[node] - durations.get(node, 0.0)) - bottom[node]
+        )
+        for node in order
+    }
+
+    # Walk back from the last finishing step along the latest finishing deps
+    path = []
+    node = max(order, key=lambda n: finish[n], default=None)
+    while node is not None:
+        path.append(node)
+        node = max(sorted(graph[node]), key=lambda n: finish[n], default=None)
+    path.reverse()
+
+    return CriticalPath(
+        path=path,
+        length=length,
+        total=sum(durations.get(node, 0.0) for node in graph),
+        slack=slack,
+    )
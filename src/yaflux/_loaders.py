@@ -1,9 +1,9 @@
 # yaflux/_loaders.py
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from ._base import Base
 from ._results import ResultsLock
-from ._yax import TarfileSerializer, YaxNotArchiveFileError
+from ._yax import ArchiveSerializer
 
 T = TypeVar("T", bound="Base")
 
@@ -14,6 +14,11 @@ def load(
     no_results: bool = False,
     select: list[str] | str | None = None,
     exclude: list[str] | str | None = None,
+    columns: dict[str, list[str]] | None = None,
+    rows: dict[str, slice | tuple[int, int]] | None = None,
+    slices: dict[str, Any] | None = None,
+    backed: list[str] | str | None = None,
+    components: dict[str, list[str]] | None = None,
 ) -> T:
     """
     Load analysis, attempting original class first, falling back to portable.
@@ -30,24 +35,43 @@ def load(
         Only load specific results (yax format only), by default None
     exclude : Optional[List[str]], optional
         Skip specific results (yax format only), by default None
+    columns : Optional[Dict[str, List[str]]], optional
+        Only load specific columns of tabular results, by result name, by default
+        None
+    rows : Optional[Dict[str, slice | tuple[int, int]]], optional
+        Only load a range of rows of tabular results, by result name, by default
+        None
+    slices : Optional[Dict[str, Any]], optional
+        Only load a slice (e.g. `np.s_[:1000, :]`) of array results, by result
+        name, by default None
+    backed : Optional[List[str]], optional
+        Open specific results in read-only backed mode, reading their data on
+        demand (AnnData results, and memory mapped sparse matrices, of `.yaxd`
+        archives only), by default None
+    components : Optional[Dict[str, List[str]]], optional
+        Only load specific components (e.g. `["obs", "obsm/X_umap"]`) of AnnData
+        results, or items (e.g. `["sample_a", "folds/0"]`) of dict, list and
+        tuple results, by result name, by default None
     """
-    if TarfileSerializer.is_yaflux_archive(filepath):
-        build_cls = cls if cls is not None else Base
-        metadata, results = TarfileSerializer.load(
-            filepath, no_results=no_results, select=select, exclude=exclude
-        )
+    build_cls = cls if cls is not None else Base
+    metadata, results = ArchiveSerializer.load(
+        filepath,
+        no_results=no_results,
+        select=select,
+        exclude=exclude,
+        columns=columns,
+        rows=rows,
+        slices=slices,
+        backed=backed,
+        components=components,
+    )
 
-        try:
-            # Load as original class
-            return _load_file(filepath, build_cls, metadata, results)  # type: ignore
-        except (AttributeError, ImportError, TypeError):
-            # If loading as original class fails, load as `Base`
-            return _load_file(filepath, Base, metadata, results)  # type: ignore
-
-    else:
-        raise YaxNotArchiveFileError(
-            "Provided file is not a yax archive. Please provide a valid yax archive."
-        )
+    try:
+        # Load as original class
+        return _load_file(filepath, build_cls, metadata, results)  # type: ignore
+    except (AttributeError, ImportError, TypeError):
+        # If loading as original class fails, load as `Base`
+        return _load_file(filepath, Base, metadata, results)  # type: ignore
 
 
 def _load_file(
@@ -66,5 +90,6 @@ def _load_file(
         instance._step_ordering = metadata.get("step_ordering", [])
         instance._results._data = results
         instance._results._metadata = metadata["step_metadata"]
+        instance._results._versions = metadata.get("result_versions", {})
 
     return instance
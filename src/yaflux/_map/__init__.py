@@ -0,0 +1,4 @@
+from ._partition import gather, partition
+from ._step import map_step
+
+__all__ = ["gather", "map_step", "partition"]
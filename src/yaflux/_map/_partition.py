@@ -0,0 +1,89 @@
+import sys
+from collections.abc import Hashable
+from typing import Any, Literal
+
+PartitionKind = Literal["dict", "list", "array", "groups"]
+
+
+def partition(
+    data: Any, axis: int = 0, groupby: str | list[str] | None = None
+) -> tuple[PartitionKind, list[tuple[Hashable, Any]]]:
+    """Split a result into keyed partitions.
+
+    Parameters
+    ----------
+    data : Any
+        The result to partition. Dictionaries are split by key, lists and tuples
+        by element, numpy arrays along `axis`, and pandas DataFrames by the
+        groups of `groupby`.
+    axis : int, optional
+        The axis along which numpy arrays are split, by default 0.
+    groupby : str | list[str] | None, optional
+        The column(s) by which pandas DataFrames are grouped.
+
+    Returns
+    -------
+    tuple[PartitionKind, list[tuple[Hashable, Any]]]
+        The kind of partitioning and the (key, partition) pairs.
+    """
+    if isinstance(data, dict):
+        return "dict", list(data.items())
+
+    if isinstance(data, list | tuple):
+        return "list", list(enumerate(data))
+
+    # Only check optional types if their modules were already imported
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(data, np.ndarray):
+        return "array", [
+            (idx, np.take(data, idx, axis=axis)) for idx in range(data.shape[axis])
+        ]
+
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(data, pd.DataFrame):
+        if groupby is None:
+            raise TypeError("Partitioning a DataFrame requires `groupby`")
+        return "groups", list(data.groupby(groupby, sort=True))
+
+    raise TypeError(f"Cannot partition object of type: {type(data)}")
+
+
+def gather(
+    kind: PartitionKind, keys: list[Hashable], outputs: list[Any], axis: int = 0
+) -> Any:
+    """Combine the outputs of each partition into a single result.
+
+    Dictionaries and DataFrame groups gather into a dictionary indexed by key,
+    lists and tuples into a list, and numpy arrays are stacked along `axis`.
+    """
+    if kind in ("dict", "groups"):
+        return dict(zip(keys, outputs, strict=True))
+
+    if kind == "array":
+        import numpy as np
+
+        if not outputs:
+            return np.asarray(outputs)
+        return np.stack(outputs, axis=axis if np.ndim(outputs[0]) >= axis else 0)
+
+    return list(outputs)
+
+
+def scatter(kind: PartitionKind, result: Any, axis: int = 0) -> dict[Hashable, Any]:
+    """Split a gathered result back into the outputs of each partition.
+
+    This is the inverse of `gather` and is used to recover the outputs of
+    partitions from a previously computed result.
+    """
+    if kind in ("dict", "groups"):
+        return dict(result)
+
+    if kind == "array":
+        import numpy as np
+
+        axis = axis if np.ndim(result) - 1 >= axis else 0
+        return {
+            idx: np.take(result, idx, axis=axis) for idx in range(result.shape[axis])
+        }
+
+    return dict(enumerate(result))
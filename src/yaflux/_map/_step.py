@@ -0,0 +1,344 @@
+import functools
+import inspect
+import time
+from collections.abc import Callable, Hashable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextvars import ContextVar
+from types import CodeType
+from typing import Any, Literal
+
+from .._base import Base
+from .._fingerprint import fingerprint, fingerprint_parameters
+from .._metadata import Metadata
+from .._resources import Resources
+from .._results import Results, ResultsLock
+from .._step import (
+    StepOutput,
+    _infer_parameters,
+    _make_step,
+    _normalize_list,
+    _prepare_validation,
+    _pull_flags,
+)
+from .._trace import Tracer
+from ._partition import gather as gather_partitions
+from ._partition import partition, scatter
+
+MapExecutor = Literal["thread", "process", "serial"]
+
+# The result and metadata of the previous execution of the running map step,
+# captured before a forced re-execution deletes the result
+_previous_execution: ContextVar[tuple[Any, Metadata | None]] = ContextVar(
+    "previous_execution", default=(None, None)
+)
+
+
+def _call_partition(
+    func: Callable, analysis: Base, key: Hashable, part: Any, pass_key: bool
+) -> tuple[Any, dict[str, float]]:
+    """Run the step body on a single partition and time it."""
+    start_time = time.time()
+    output = func(analysis, part, key=key) if pass_key else func(analysis, part)
+    elapsed = time.time() - start_time
+    Tracer.emit(f"{func.__name__}[{key}]", "partition", start_time, elapsed)
+    return output, {"timestamp": start_time, "elapsed": elapsed}
+
+
+def _detached_instance(cls: type[Base], parameters: Any) -> Base:
+    """Build an instance carrying only the parameters of an analysis."""
+    instance = cls.__new__(cls)
+    with ResultsLock.allow_mutation():
+        instance._results = Results()
+    instance._completed_steps = set()
+    instance._step_ordering = []
+    instance.parameters = parameters
+    return instance
+
+
+def _call_partition_in_process(
+    cls: type[Base],
+    step_name: str,
+    parameters: Any,
+    key: Hashable,
+    part: Any,
+    pass_key: bool,
+) -> tuple[Any, dict[str, float]]:
+    """Run the step body on a single partition in a worker process.
+
+    The analysis results are not sent to the worker, so the body only has
+    access to the partition and the analysis parameters.
+    """
+    func = getattr(cls, step_name).map_func
+    analysis = _detached_instance(cls, parameters)
+    return _call_partition(func, analysis, key, part, pass_key)
+
+
+def _build_pool(executor: MapExecutor, workers: int | None) -> Executor | None:
+    """Build the pool running the partitions of a map step."""
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=workers)
+    if executor == "process":
+        # Importing the process pool loads multiprocessing, so defer it
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(max_workers=workers)
+    if executor == "serial":
+        return None
+    raise ValueError(f"Unknown map executor: '{executor}'")
+
+
+def _run_partitions(
+    analysis: Base,
+    func: Callable,
+    parts: list[tuple[Hashable, Any]],
+    pass_key: bool,
+    executor: MapExecutor,
+    workers: int | None,
+) -> list[tuple[Any, dict[str, float]]]:
+    """Run the step body on every partition, preserving partition order."""
+    pool = _build_pool(executor, workers)
+    if pool is None:
+        return [_call_partition(func, analysis, k, p, pass_key) for k, p in parts]
+
+    with pool:
+        if executor == "process":
+            futures = [
+                pool.submit(
+                    _call_partition_in_process,
+                    analysis.__class__,
+                    func.__name__,
+                    analysis.parameters,
+                    key,
+                    part,
+                    pass_key,
+                )
+                for key, part in parts
+            ]
+        else:
+            futures = [
+                pool.submit(_call_partition, func, analysis, key, part, pass_key)
+                for key, part in parts
+            ]
+        return [future.result() for future in futures]
+
+
+def _code_parts(code: CodeType) -> tuple:
+    """Collect the bytecode, names and constants of a code and its nested codes."""
+    return (
+        code.co_code,
+        code.co_names,
+        tuple(
+            _code_parts(const) if isinstance(const, CodeType) else const
+            for const in code.co_consts
+        ),
+    )
+
+
+def _source_fingerprint(func: Callable) -> str:
+    """Fingerprint the code of a step body.
+
+    The compiled code is fingerprinted rather than the source, which would be
+    read and parsed every time a map step is defined.
+    """
+    return fingerprint(_code_parts(func.__code__))
+
+
+def _reusable_outputs(
+    kind: str,
+    fingerprints: dict[Hashable, str | None],
+    axis: int,
+) -> dict[Hashable, tuple[Any, dict[str, Any]]]:
+    """Find the partitions whose inputs are unchanged since the previous execution.
+
+    Returns the output and timing of each reusable partition, indexed by key.
+    """
+    result, metadata = _previous_execution.get()
+    if result is None or metadata is None or not metadata.partitions:
+        return {}
+
+    try:
+        outputs = scatter(kind, result, axis=axis)  # type: ignore
+    except (TypeError, ValueError, IndexError):
+        return {}
+
+    reusable = {}
+    for key, fp in fingerprints.items():
+        timing = metadata.partitions.get(str(key))
+        if (
+            fp is not None
+            and timing is not None
+            and timing.get("fingerprint") == fp
+            and key in outputs
+        ):
+            reusable[key] = (outputs[key], {**timing, "reused": True})
+    return reusable
+
+
+def map_step(
+    over: str,
+    creates: str,
+    requires: list[str] | str | None = None,
+    executor: MapExecutor = "thread",
+    workers: int | None = None,
+    axis: int = 0,
+    groupby: str | list[str] | None = None,
+    gather: Callable[[list[Any]], Any] | None = None,
+    resources: dict[str, Any] | None = None,
+    incremental: bool = True,
+    parameters: list[str] | str | None = None,
+) -> Callable:
+    """Register an analysis step applied to each partition of a result.
+
+    The decorated function is called once per partition of the `over` result as
+    `func(self, partition)`, or `func(self, partition, key=key)` if it accepts a
+    `key` argument. The outputs are gathered into the single `creates` result.
+
+    Each partition is fingerprinted together with the other required results,
+    the parameters the step depends on, and the source of the function. When
+    the step is forced to re-execute, only partitions whose fingerprint changed
+    are recomputed and the outputs of the other partitions are reused from the
+    previous result.
+
+    Parameters
+    ----------
+    over : str
+        Name of the result to partition. Dictionaries are split by key, lists
+        and tuples by element, numpy arrays along `axis`, and pandas DataFrames
+        by the groups of `groupby`.
+    creates : str
+        Name of the gathered result this step creates.
+    requires : str | list[str] | None
+        Names of additional results this step requires.
+    executor : {"thread", "process", "serial"}
+        How partitions are executed, by default on a thread pool. In a process
+        pool the function only has access to the partition and the analysis
+        parameters, and the analysis class must be importable.
+    workers : int | None
+        Maximum number of partitions run concurrently.
+    axis : int
+        Axis along which numpy arrays are partitioned and stacked, by default 0.
+    groupby : str | list[str] | None
+        Column(s) by which pandas DataFrames are partitioned.
+    gather : Callable[[list[Any]], Any] | None
+        Combines the list of partition outputs into the result. By default
+        dictionaries and groups gather into a dictionary indexed by key, lists
+        into a list, and arrays are stacked.
+    resources : dict[str, Any] | None
+        Resources required by this step.
+    incremental : bool
+        Whether unchanged partitions are reused on re-execution, by default
+        True. Reuse requires the default `gather`, as the outputs of each
+        partition are recovered by splitting the previous result.
+    parameters : str | list[str] | None
+        Names of the analysis parameters this step depends on. By default they
+        are inferred from the `self.parameters` accesses in the function, and a
+        step using the parameters dynamically depends on all of them.
+
+    Attributes
+    ----------
+    over : str
+        Name of the partitioned result
+    map_func : Callable
+        The function applied to each partition
+    """
+    requires_list, requires_flags = _pull_flags(_normalize_list(requires))
+    declared_parameters = (
+        _normalize_list(parameters) if parameters is not None else None
+    )
+    step_resources = Resources.parse(resources) if resources is not None else None
+
+    def decorator(func: Callable) -> Callable:
+        # Partitions are passed as arguments so `over` is not accessed directly
+        check = _prepare_validation(func, requires_list, [])
+        parameter_deps = (
+            declared_parameters
+            if declared_parameters is not None
+            else _infer_parameters(func)
+        )
+        pass_key = "key" in inspect.signature(func).parameters
+        source = _source_fingerprint(func)
+
+        def run(self) -> StepOutput:
+            if check is not None:
+                check()
+            kind, parts = partition(self.results[over], axis=axis, groupby=groupby)
+
+            # Partitions depend on their own data and everything shared by them
+            context = (
+                fingerprint(
+                    (
+                        source,
+                        fingerprint_parameters(self.parameters, parameter_deps),
+                        [self.results[r] for r in requires_list],
+                    )
+                )
+                if incremental
+                else None
+            )
+            fingerprints = {
+                key: fingerprint((context, part)) if context is not None else None
+                for key, part in parts
+            }
+            reused = (
+                _reusable_outputs(kind, fingerprints, axis) if gather is None else {}
+            )
+
+            to_run = [(key, part) for key, part in parts if key not in reused]
+            calls = dict(
+                zip(
+                    [key for key, _ in to_run],
+                    _run_partitions(self, func, to_run, pass_key, executor, workers),
+                    strict=True,
+                )
+            )
+            for key, (_, timing) in calls.items():
+                timing.update(fingerprint=fingerprints[key], reused=False)
+            calls.update(reused)
+
+            keys = [key for key, _ in parts]
+            outputs = [calls[key][0] for key in keys]
+            result = (
+                gather(outputs)
+                if gather is not None
+                else gather_partitions(kind, keys, outputs, axis=axis)
+            )
+            timings = {str(key): calls[key][1] for key in keys}
+            return StepOutput(result, {"partitions": timings})
+
+        run.__name__ = func.__name__
+        run.__qualname__ = func.__qualname__
+        run.__module__ = func.__module__
+        run.__doc__ = func.__doc__
+
+        step_wrapper = _make_step(
+            run,
+            creates_list=[creates],
+            creates_flags=[],
+            requires_list=[over, *requires_list],
+            requires_flags=requires_flags,
+            mutates_list=[],
+            step_resources=step_resources,
+            validate=False,
+            parameter_deps=parameter_deps,
+        )
+
+        @functools.wraps(step_wrapper)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            analysis = args[0] if args else None
+            previous = (None, None)
+            if isinstance(analysis, Base):
+                previous = (
+                    getattr(analysis._results, creates, None),
+                    analysis._results._metadata.get(func.__name__),
+                )
+            token = _previous_execution.set(previous)
+            try:
+                return step_wrapper(*args, **kwargs)
+            finally:
+                _previous_execution.reset(token)
+
+        wrapper.over = over  # type: ignore
+        wrapper.map_func = func  # type: ignore
+        return wrapper
+
+    return decorator
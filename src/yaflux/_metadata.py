@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Any
 
 
 @dataclass
@@ -23,5 +24,23 @@ class Metadata:
     # The named arguments for this step
     kwargs: dict[str, str]
 
+    # The process this step was executed in
+    process_id: int = 0
+
+    # The thread this step was executed in
+    thread_id: int = 0
+
+    # The version assigned to the results written by this step
+    version: str = ""
+
+    # The versions of the results and flags read by this step when it ran
+    input_versions: dict[str, str] | None = None
+
+    # Fingerprint of the parameters read by this step when it ran
+    parameters_fingerprint: str | None = None
+
+    # Timings of each partition of a map step, indexed by partition key
+    partitions: dict[str, dict[str, Any]] | None = None
+
     def to_dict(self):
         return self.__dict__
@@ -0,0 +1,95 @@
+import math
+import re
+from dataclasses import dataclass
+from typing import Any
+
+_MEMORY_UNITS = {
+    "": 1,
+    "b": 1,
+    "k": 1024,
+    "kb": 1024,
+    "kib": 1024,
+    "m": 1024**2,
+    "mb": 1024**2,
+    "mib": 1024**2,
+    "g": 1024**3,
+    "gb": 1024**3,
+    "gib": 1024**3,
+    "t": 1024**4,
+    "tb": 1024**4,
+    "tib": 1024**4,
+}
+
+_MEMORY_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]*)\s*$")
+
+
+def parse_memory(value: int | float | str) -> float:
+    """Parse a memory amount into bytes.
+
+    Parameters
+    ----------
+    value : int | float | str
+        A number of bytes or a string with a unit (e.g. "512MB", "16GB", "1.5TiB").
+        Units are powers of 1024.
+
+    Returns
+    -------
+    float
+        The number of bytes.
+    """
+    if isinstance(value, int | float):
+        if value < 0:
+            raise ValueError(f"Memory cannot be negative: {value}")
+        return value if math.isinf(value) else int(value)
+
+    match = _MEMORY_PATTERN.match(value)
+    if match is None or match.group(2).lower() not in _MEMORY_UNITS:
+        raise ValueError(f"Invalid memory specification: '{value}'")
+
+    number, unit = match.groups()
+    return int(float(number) * _MEMORY_UNITS[unit.lower()])
+
+
+@dataclass(frozen=True)
+class Resources:
+    """Resources required by a step or available on a node."""
+
+    # Number of CPUs
+    cpus: float = 1.0
+
+    # Memory in bytes
+    memory: float = 0
+
+    @classmethod
+    def budget(cls, value: "dict[str, Any] | Resources") -> "Resources":
+        """Build a node budget where undeclared resources are unlimited."""
+        if isinstance(value, Resources):
+            return value
+        return cls.parse({"cpus": math.inf, "memory": math.inf, **value})
+
+    @classmethod
+    def parse(cls, value: "dict[str, Any] | Resources | None") -> "Resources":
+        """Build resources from a declaration like `{"cpus": 4, "memory": "16GB"}`."""
+        if value is None:
+            return cls()
+        if isinstance(value, Resources):
+            return value
+
+        unknown = set(value) - {"cpus", "memory"}
+        if unknown:
+            raise ValueError(f"Unknown resources: {sorted(unknown)}")
+
+        cpus = float(value.get("cpus", 1.0))
+        if cpus < 0:
+            raise ValueError(f"CPUs cannot be negative: {cpus}")
+        return cls(cpus=cpus, memory=parse_memory(value.get("memory", 0)))
+
+    def __add__(self, other: "Resources") -> "Resources":
+        return Resources(cpus=self.cpus + other.cpus, memory=self.memory + other.memory)
+
+    def fits(self, budget: "Resources") -> bool:
+        """Check if these resources fit within a budget."""
+        return self.cpus <= budget.cpus and self.memory <= budget.memory
+
+    def to_dict(self):
+        return self.__dict__
@@ -1,34 +1,39 @@
-import threading
 from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Context variables are local to each thread and to each asyncio task, so
+# concurrently running steps never share their mutation permissions.
+_can_mutate_results: ContextVar[bool] = ContextVar("can_mutate_results", default=False)
+_mutable_keys: ContextVar[frozenset[str]] = ContextVar(
+    "mutable_keys", default=frozenset()
+)
+_can_mutate_flags: ContextVar[bool] = ContextVar("can_mutate_flags", default=False)
 
 
 class ResultsLock:
     """Context manager for controlling results mutation with granular key control."""
 
-    _thread_local = threading.local()
-
     @classmethod
     def can_mutate(cls) -> bool:
-        """Check if the current thread is allowed to mutate any results."""
-        return getattr(cls._thread_local, "can_mutate", False)
+        """Check if the current context is allowed to mutate any results."""
+        return _can_mutate_results.get()
 
     @classmethod
     def get_mutable_keys(cls) -> set[str]:
         """Get the set of keys that can currently be mutated."""
-        return getattr(cls._thread_local, "mutable_keys", set())
+        return set(_mutable_keys.get())
 
     @classmethod
     def can_mutate_key(cls, key: str) -> bool:
         """Check if a specific key can be mutated."""
-        if not cls.can_mutate():
+        if not _can_mutate_results.get():
             return False
-        mutable_keys = cls.get_mutable_keys()
+        mutable_keys = _mutable_keys.get()
         # If no specific keys are set, allow all mutations when can_mutate is True
         return len(mutable_keys) == 0 or key in mutable_keys
 
     @classmethod
-    @contextmanager
-    def allow_mutation(cls, keys: set[str] | None = None):
+    def allow_mutation(cls, keys: set[str] | None = None) -> "_MutationContext":
         """Context manager for allowing results mutation.
 
         Parameters
@@ -36,38 +41,44 @@ class ResultsLock:
         keys : Optional[set[str]]
             Set of specific keys that can be mutated. If None, all keys can be mutated.
         """
-        previous_state = (
-            cls.can_mutate(),
-            getattr(cls._thread_local, "mutable_keys", set()),
-        )
+        return _MutationContext(frozenset(keys or ()))
 
-        cls._thread_local.can_mutate = True
-        cls._thread_local.mutable_keys = keys or set()
 
-        try:
-            yield
-        finally:
-            cls._thread_local.can_mutate = previous_state[0]
-            cls._thread_local.mutable_keys = previous_state[1]
+class _MutationContext:
+    """Allow results mutation within a `with` block.
+
+    A plain class rather than a generator based context manager because it is
+    entered on every step call.
+    """
+
+    __slots__ = ("_can_mutate_token", "_keys", "_keys_token")
+
+    def __init__(self, keys: frozenset[str]):
+        self._keys = keys
+
+    def __enter__(self) -> None:
+        self._can_mutate_token = _can_mutate_results.set(True)
+        self._keys_token = _mutable_keys.set(self._keys)
+
+    def __exit__(self, *exc_info) -> None:
+        _mutable_keys.reset(self._keys_token)
+        _can_mutate_results.reset(self._can_mutate_token)
 
 
 class FlagLock:
     """Context manager for controlling flag mutation."""
 
-    _thread_local = threading.local()
-
     @classmethod
     def can_mutate(cls) -> bool:
-        """Check if the current thread is allowed to mutate."""
-        return getattr(cls._thread_local, "can_mutate", False)
+        """Check if the current context is allowed to mutate."""
+        return _can_mutate_flags.get()
 
     @classmethod
     @contextmanager
     def allow_mutation(cls):
         """Context manager for allowing mutation."""
-        previous = cls.can_mutate()
-        cls._thread_local.can_mutate = True
+        token = _can_mutate_flags.set(True)
         try:
             yield
         finally:
-            cls._thread_local.can_mutate = previous
+            _can_mutate_flags.reset(token)
@@ -15,11 +15,16 @@ class Results:
 
     _metadata: dict[str, Metadata]
         The metadata for each result. Indexed by the step name.
+
+    _versions: dict[str, str]
+        The version of each result and flag. A new version is assigned every
+        time a step creates or mutates it.
     """
 
     def __init__(self):
         self._data = {}
         self._metadata = {}
+        self._versions = {}
 
     def __getitem__(self, name):
         return self._data[name]
@@ -39,7 +44,7 @@ class Results:
                 f"Results key '{name}' cannot be modified outside of current context"
             )
 
-        if name == "_data" or name == "_metadata":
+        if name in ("_data", "_metadata", "_versions"):
             raise AttributeError(f"Cannot delete attribute '{name}'")
 
         if (
@@ -59,7 +64,7 @@ class Results:
             raise UnauthorizedMutationError(
                 f"Results key '{name}' cannot be modified outside of current context"
             )
-        if name == "_data" or name == "_metadata":
+        if name in ("_data", "_metadata", "_versions"):
             if not ResultsLock.can_mutate():
                 raise UnauthorizedMutationError(
                     f"Cannot modify '{name}' attribute outside of current context"
@@ -96,6 +101,15 @@ class Results:
         """Get the metadata for a result."""
         return self._metadata[step_name]
 
+    def get_version(self, name: str) -> str | None:
+        """Get the current version of a result or flag."""
+        return self._versions.get(name)
+
+    def set_versions(self, names: list[str], version: str) -> None:
+        """Assign a new version to results or flags written by a step."""
+        for name in names:
+            self._versions[name] = version
+
     def get_step_results(self, step_name: str) -> dict[str, Any]:
         """Get the results for a step."""
         return {
@@ -1,17 +1,43 @@
 import functools
 import inspect
+import os
+import threading
 import time
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any, TypeVar
 
-from yaflux._ast import validate_ast
+from yaflux._arguments import summarize_argument
+from yaflux._ast import infer_parameters, validate_ast, validation_mode
 from yaflux._base import Base
+from yaflux._fingerprint import fingerprint_parameters
 from yaflux._metadata import Metadata
+from yaflux._resources import Resources
 from yaflux._results._lock import ResultsLock
+from yaflux._stream import ChunkStream
+from yaflux._trace import Tracer
 
 T = TypeVar("T")
 
 
+@dataclass
+class StepOutput:
+    """Return value of a generated step body carrying additional step metadata."""
+
+    # The value returned by the step
+    value: Any
+
+    # Additional fields of the step's `Metadata`
+    metadata: dict[str, Any]
+
+
+def _unwrap_output(result: Any) -> tuple[Any, dict[str, Any]]:
+    """Split a step's return value from any additional step metadata."""
+    if isinstance(result, StepOutput):
+        return result.value, result.metadata
+    return result, {}
+
+
 def _pull_flags(arglist: list[str]) -> tuple[list[str], list[str]]:
     args = []
     flags = []
@@ -41,8 +67,8 @@ def _check_requirements(
     analysis: Base, requires: list[str], mutates: list[str]
 ) -> None:
     """Validate that all required results exist."""
-    all_requirements = requires + mutates
-    missing = [req for req in all_requirements if not hasattr(analysis._results, req)]
+    data = analysis._results._data
+    missing = [req for req in (*requires, *mutates) if req not in data]
     if missing:
         raise ValueError(
             f"Missing required results: {missing}. Run required steps first."
@@ -51,7 +77,8 @@ def _check_requirements(
 
 def _check_required_flags(analysis: Base, requires: list[str]) -> None:
     """Validate that all required flags exist."""
-    missing = [req for req in requires if not hasattr(analysis._results, req)]
+    data = analysis._results._data
+    missing = [req for req in requires if req not in data]
     if missing:
         raise ValueError(f"Missing required flag: {missing}. Run required steps first.")
 
@@ -60,8 +87,9 @@ def _handle_existing_attributes(
     analysis: Base, creates: list[str], force: bool, panic: bool
 ) -> dict[str, Any] | None:
     """Handle cases where results already exist."""
+    data = analysis._results._data
     for attr in creates:
-        if hasattr(analysis._results, attr):
+        if attr in data:
             if force:
                 with ResultsLock.allow_mutation():
                     delattr(analysis._results, attr)
@@ -69,7 +97,7 @@ def _handle_existing_attributes(
                 raise ValueError(f"Attribute {attr} already exists!")
             else:
                 print(f"Attribute {attr} already exists - skipping step.")
-                return {attr: getattr(analysis._results, attr) for attr in creates}
+                return {attr: data[attr] for attr in creates}
     return None
 
 
@@ -169,19 +197,120 @@ def _store_metadata(
     analysis._results.set_metadata(step_name, metadata)
 
 
-def _filter_valid_kwargs(func: Callable, kwargs: dict) -> dict:
-    """Remove kwargs that aren't in the function signature."""
-    sig = inspect.signature(func)
-    return {k: v for k, v in kwargs.items() if k in sig.parameters}
+def _resolve_body(
+    func: Callable, creates: list[str], mutates: list[str], buffer_size: int
+) -> Callable:
+    """Resolve the callable executed by a synchronous step."""
+    if not inspect.isgeneratorfunction(func):
+        return func
+    _check_streaming_step(func.__name__, creates, mutates)
+    return _streaming_body(func, buffer_size)
+
+
+def _check_streaming_step(
+    step_name: str, creates: list[str], mutates: list[str]
+) -> None:
+    """Validate the declaration of a streaming (generator) step."""
+    if len(creates) != 1:
+        raise ValueError(f"Streaming step '{step_name}' must create exactly one result")
+    if mutates:
+        raise ValueError(f"Streaming step '{step_name}' cannot mutate results")
+
+
+def _streaming_body(func: Callable, buffer_size: int) -> Callable[..., ChunkStream]:
+    """Wrap a generator function to return a stream over its chunks."""
+
+    def body(*args: Any, **kwargs: Any) -> ChunkStream:
+        return ChunkStream(
+            functools.partial(func, *args, **kwargs), buffer_size=buffer_size
+        )
+
+    return body
+
+
+def _capture_args(args: tuple) -> list[str]:
+    """Summarize the positional arguments of a step call."""
+    return [summarize_argument(arg) for arg in args]
+
+
+def _capture_kwargs(kwargs: dict[str, Any]) -> dict[str, str]:
+    """Summarize the keyword arguments of a step call."""
+    return {k: summarize_argument(v) for k, v in kwargs.items()}
+
+
+def _prepare_validation(
+    func: Callable, requires: list[str], mutates: list[str]
+) -> Callable[[], None] | None:
+    """Validate the AST of a step according to the `YAFLUX_VALIDATE` mode.
+
+    In lazy mode validation is deferred: the returned check must be called
+    before the step is executed and only validates on its first call.
+    """
+    mode = validation_mode()
+    if mode == "eager":
+        validate_ast(func, requires=requires, mutates=mutates)
+    elif mode == "lazy":
+        return functools.cache(
+            functools.partial(validate_ast, func, requires=requires, mutates=mutates)
+        )
+    return None
+
+
+def _infer_parameters(func: Callable) -> list[str] | None:
+    """Infer the parameters read by a step unless validation is deferred.
+
+    Without eager validation the AST is not parsed at decoration time, so the
+    step is assumed to depend on all parameters.
+    """
+    if validation_mode() != "eager":
+        return None
+    return infer_parameters(func)
+
+
+def _filter_valid_kwargs(accepted: frozenset[str], kwargs: dict) -> dict:
+    """Remove kwargs that aren't in the function signature.
+
+    The names accepted by the function are computed once when the step is
+    defined rather than inspecting its signature on every call.
+    """
+    if not kwargs:
+        return kwargs
+    return {k: v for k, v in kwargs.items() if k in accepted}
+
+
+def _record_inputs(
+    analysis_obj: Base,
+    version_inputs: tuple[str, ...],
+    parameter_deps: list[str] | None,
+) -> dict[str, Any]:
+    """Record the versions and parameters read by a step before it runs.
+
+    Only steps about to run record their inputs, so the parameters of skipped
+    steps are never fingerprinted.
+    """
+    versions = analysis_obj._results._versions
+    return {
+        "input_versions": {key: versions.get(key) for key in version_inputs},
+        "parameters_fingerprint": fingerprint_parameters(
+            analysis_obj.parameters, parameter_deps
+        ),
+    }
 
 
 def step(
     creates: list[str] | str | None = None,
     requires: list[str] | str | None = None,
     mutates: list[str] | str | None = None,
+    resources: dict[str, Any] | None = None,
+    buffer_size: int = 8,
+    parameters: list[str] | str | None = None,
+    capture_args: bool = True,
 ) -> Callable:
     """Register analysis steps and their results.
 
+    Steps defined as generators are streaming steps: they create a single
+    `ChunkStream` result which lazily yields the chunks of the generator.
+
     Parameters
     ----------
     creates : str | list[str] | None
@@ -190,6 +319,19 @@ def step(
         Names of the results this step requires
     mutates: str | list[str] | None
         Names of the results this step mutates
+    resources: dict[str, Any] | None
+        Resources required by this step, e.g. `{"cpus": 4, "memory": "16GB"}`.
+        Used to avoid oversubscribing the node during parallel execution.
+    buffer_size: int
+        Maximum number of chunks a streaming step buffers ahead of its consumer.
+    parameters: str | list[str] | None
+        Names of the analysis parameters this step depends on. By default they
+        are inferred from the `self.parameters` accesses in the function, and a
+        step using the parameters dynamically depends on all of them.
+    capture_args: bool
+        Whether to record summaries of the arguments of each call in the step
+        metadata. Summaries are bounded in size, with arrays and frames
+        described by their shape and fingerprint.
 
     Attributes
     ----------
@@ -203,90 +345,226 @@ def step(
         Names of the flags this step creates
     requires_flags : list[str]
         Names of the flags this step requires
+    resources : Resources | None
+        Resources required by this step
+    parameters : list[str] | None
+        Names of the parameters this step depends on, or None for all
     """
     creates_list = _normalize_list(creates)
     requires_list = _normalize_list(requires)
     mutates_list = _normalize_list(mutates)
 
+    step_resources = Resources.parse(resources) if resources is not None else None
+
+    declared_parameters = (
+        _normalize_list(parameters) if parameters is not None else None
+    )
+
     creates_list, creates_flags = _pull_flags(creates_list)
     requires_list, requires_flags = _pull_flags(requires_list)
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        # Validate AST before wrapping the function
-        validate_ast(func, requires=requires_list, mutates=mutates_list)
+        return _make_step(
+            func,
+            creates_list=creates_list,
+            creates_flags=creates_flags,
+            requires_list=requires_list,
+            requires_flags=requires_flags,
+            mutates_list=mutates_list,
+            step_resources=step_resources,
+            buffer_size=buffer_size,
+            parameter_deps=(
+                declared_parameters
+                if declared_parameters is not None
+                else _infer_parameters(func)
+            ),
+            capture_args=capture_args,
+        )
+
+    return decorator
+
+
+def _make_step(
+    func: Callable[..., T],
+    creates_list: list[str],
+    creates_flags: list[str],
+    requires_list: list[str],
+    requires_flags: list[str],
+    mutates_list: list[str],
+    step_resources: Resources | None,
+    validate: bool = True,
+    buffer_size: int = 8,
+    parameter_deps: list[str] | None = None,
+    capture_args: bool = True,
+) -> Callable[..., T]:
+    """Wrap a function as an analysis step.
+
+    See `step` for details. `validate` disables AST validation for step bodies
+    generated by yaflux itself (e.g. map steps).
+    """
+    # Validate AST before wrapping the function
+    check = _prepare_validation(func, requires_list, mutates_list) if validate else None
+
+    # Identify the step name
+    step_name = func.__name__
+
+    # Generator steps create a stream instead of running to completion
+    body = _resolve_body(func, creates_list, mutates_list, buffer_size)
+
+    # Setup mutable context
+    mutable_keys = set(mutates_list) if mutates_list else None
+
+    # Precompute everything that does not depend on the call
+    accepted_kwargs = frozenset(inspect.signature(func).parameters)
+    version_inputs = (*requires_list, *requires_flags, *mutates_list)
+    version_outputs = [*creates_list, *creates_flags, *mutates_list]
+
+    def begin(args: tuple, kwargs: dict) -> tuple[Base, tuple, dict, Any]:
+        """Validate the call and resolve the arguments of the step."""
+        # Extract control flags
+        force = kwargs.pop("force", False)
+        panic_on_existing = kwargs.pop("panic_on_existing", False)
+
+        # Setup and validation
+        if check is not None:
+            check()
+        analysis_obj, remaining_args = _validate_instance_method(args)
+        _check_requirements(analysis_obj, requires_list, mutates_list)
+        _check_required_flags(analysis_obj, requires_flags)
+
+        # Handle existing results
+        existing = _handle_existing_attributes(
+            analysis_obj, creates_list, force, panic_on_existing
+        )
+
+        # Filter valid kwargs
+        valid_kwargs = _filter_valid_kwargs(accepted_kwargs, kwargs)
+
+        return analysis_obj, remaining_args, valid_kwargs, existing
+
+    def complete(
+        analysis_obj: Base,
+        remaining_args: tuple,
+        valid_kwargs: dict,
+        result: Any,
+        start_time: float,
+        elapsed: float,
+        inputs: dict[str, Any],
+        extra_metadata: dict[str, Any],
+    ) -> None:
+        """Store the results and metadata of a finished step."""
+        # Build the metadata object
+        # Equivalent to a random uuid4 hex digest without building the UUID
+        version = os.urandom(16).hex()
+        step_metadata = Metadata(
+            creates=creates_list,
+            requires=requires_list,
+            timestamp=start_time,
+            elapsed=elapsed,
+            args=_capture_args(remaining_args) if capture_args else [],
+            kwargs=_capture_kwargs(valid_kwargs) if capture_args else {},
+            process_id=os.getpid(),
+            thread_id=threading.get_ident(),
+            version=version,
+            **inputs,
+            **extra_metadata,
+        )
+        Tracer.emit(step_name, "step", start_time, elapsed, creates=creates_list)
+
+        with ResultsLock.allow_mutation():
+            # Store the results
+            _store_results(analysis_obj, creates_list, result)
+
+            # Set the flags
+            _set_flags(analysis_obj, creates_flags)
+
+            # Store the metadata
+            _store_metadata(analysis_obj, step_name, step_metadata)
+
+            # Assign a new version to everything written by the step
+            analysis_obj._results.set_versions(version_outputs, version)
+
+        # Add to ordering if not already present (only re-run steps can be)
+        if (
+            step_name not in analysis_obj._completed_steps
+            or step_name not in analysis_obj._step_ordering
+        ):
+            analysis_obj._step_ordering.append(step_name)
+
+        # Mark completion
+        analysis_obj._completed_steps.add(step_name)
+
+    if inspect.iscoroutinefunction(func):
 
         @functools.wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> T:
-            # Identify the step name
-            step_name = func.__name__
-
-            # Extract control flags
-            force = kwargs.pop("force", False)
-            panic_on_existing = kwargs.pop("panic_on_existing", False)
-
-            # Setup and validation
-            analysis_obj, remaining_args = _validate_instance_method(args)
-            _check_requirements(analysis_obj, requires_list, mutates_list)
-            _check_required_flags(analysis_obj, requires_flags)
-
-            # Handle existing results
-            existing = _handle_existing_attributes(
-                analysis_obj, creates_list, force, panic_on_existing
-            )
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            analysis_obj, remaining_args, valid_kwargs, existing = begin(args, kwargs)
             if existing is not None:
-                return existing  # type: ignore
+                return existing
+            inputs = _record_inputs(analysis_obj, version_inputs, parameter_deps)
 
-            # Filter valid kwargs
-            valid_kwargs = _filter_valid_kwargs(func, kwargs)
+            # The lock is held by this task's context only so concurrent
+            # steps on the same event loop cannot mutate each other's keys
+            with ResultsLock.allow_mutation(mutable_keys):
+                start_time = time.time()
+                result = await func(analysis_obj, *remaining_args, **valid_kwargs)
+                elapsed = time.time() - start_time
+
+            result, extra_metadata = _unwrap_output(result)
+            complete(
+                analysis_obj,
+                remaining_args,
+                valid_kwargs,
+                result,
+                start_time,
+                elapsed,
+                inputs,
+                extra_metadata,
+            )
+            return result
+
+        wrapper = async_wrapper
 
-            # Setup mutable context
-            mutable_keys = set(mutates_list) if mutates_list else None
+    else:
+
+        @functools.wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> T:
+            analysis_obj, remaining_args, valid_kwargs, existing = begin(args, kwargs)
+            if existing is not None:
+                return existing  # type: ignore
+            inputs = _record_inputs(analysis_obj, version_inputs, parameter_deps)
 
             with ResultsLock.allow_mutation(mutable_keys):
                 # Timestamp the start of the step
                 start_time = time.time()
 
                 # Execute the function
-                result = func(analysis_obj, *remaining_args, **valid_kwargs)
+                result = body(analysis_obj, *remaining_args, **valid_kwargs)
 
                 # Record the elapsed time
                 elapsed = time.time() - start_time
 
-            # Build the metadata object
-            step_metadata = Metadata(
-                creates=creates_list,
-                requires=requires_list,
-                timestamp=start_time,
-                elapsed=elapsed,
-                args=[str(arg) for arg in remaining_args],
-                kwargs={k: str(v) for k, v in valid_kwargs.items()},
+            result, extra_metadata = _unwrap_output(result)
+            complete(
+                analysis_obj,
+                remaining_args,
+                valid_kwargs,
+                result,
+                start_time,
+                elapsed,
+                inputs,
+                extra_metadata,
             )
-
-            with ResultsLock.allow_mutation():
-                # Store the results
-                _store_results(analysis_obj, creates_list, result)
-
-                # Set the flags
-                _set_flags(analysis_obj, creates_flags)
-
-                # Store the metadata
-                _store_metadata(analysis_obj, step_name, step_metadata)
-
-            # Mark completion
-            analysis_obj._completed_steps.add(step_name)
-
-            # Add to ordering if not already present
-            if step_name not in analysis_obj._step_ordering:
-                analysis_obj._step_ordering.append(step_name)
-
             return result
 
-        # Store metadata
-        wrapper.creates = creates_list  # type: ignore
-        wrapper.requires = requires_list  # type: ignore
-        wrapper.creates_flags = creates_flags  # type: ignore
-        wrapper.requires_flags = requires_flags  # type: ignore
-        wrapper.mutates = mutates_list  # type: ignore
-        return wrapper
-
-    return decorator
+        wrapper = sync_wrapper
+
+    # Store metadata
+    wrapper.creates = creates_list  # type: ignore
+    wrapper.requires = requires_list  # type: ignore
+    wrapper.creates_flags = creates_flags  # type: ignore
+    wrapper.requires_flags = requires_flags  # type: ignore
+    wrapper.mutates = mutates_list  # type: ignore
+    wrapper.resources = step_resources  # type: ignore
+    wrapper.parameters = parameter_deps  # type: ignore
+    return wrapper
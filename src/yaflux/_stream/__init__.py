@@ -0,0 +1,3 @@
+from ._stream import ChunkStream
+
+__all__ = ["ChunkStream"]
@@ -0,0 +1,88 @@
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from typing import Any
+
+# Marks the end of a stream in the buffer
+_END = object()
+
+
+class _ProducerError:
+    """Carries an exception raised by the producer to the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class ChunkStream:
+    """A lazily evaluated stream of chunks produced by a generator step.
+
+    Each iteration runs the generator in a producer thread which pushes chunks
+    into a bounded buffer, so a chain of streaming steps is pipelined and peak
+    memory is proportional to the chunk size rather than the dataset size.
+
+    Streams are replayable: every iteration re-runs the generator from the
+    start. Consumers iterating more than once pay for it each time.
+
+    Parameters
+    ----------
+    factory : Callable[[], Iterator[Any]]
+        Creates a new iterator over the chunks of the stream.
+    buffer_size : int, optional
+        Maximum number of chunks buffered ahead of the consumer, by default 8.
+    """
+
+    def __init__(self, factory: Callable[[], Iterator[Any]], buffer_size: int = 8):
+        if buffer_size < 1:
+            raise ValueError("Stream buffer size must be at least 1")
+        self._factory = factory
+        self.buffer_size = buffer_size
+
+    def __iter__(self) -> Iterator[Any]:
+        buffer: queue.Queue = queue.Queue(maxsize=self.buffer_size)
+        stop = threading.Event()
+
+        producer = threading.Thread(
+            target=self._produce, args=(buffer, stop), daemon=True
+        )
+        producer.start()
+
+        try:
+            while True:
+                item = buffer.get()
+                if item is _END:
+                    return
+                if isinstance(item, _ProducerError):
+                    raise item.error
+                yield item
+        finally:
+            # Release the producer if the consumer stops early
+            stop.set()
+
+    def _produce(self, buffer: queue.Queue, stop: threading.Event) -> None:
+        """Run the generator and push its chunks into the buffer."""
+        try:
+            for chunk in self._factory():
+                if not self._put(buffer, stop, chunk):
+                    return
+            self._put(buffer, stop, _END)
+        except BaseException as e:
+            self._put(buffer, stop, _ProducerError(e))
+
+    @staticmethod
+    def _put(buffer: queue.Queue, stop: threading.Event, item: Any) -> bool:
+        """Wait for room in the buffer unless the consumer has stopped."""
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(buffer_size={self.buffer_size})"
+
+    def collect(self) -> list[Any]:
+        """Materialize all chunks of the stream into a list."""
+        return list(self)
@@ -0,0 +1,110 @@
+import copy
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from .._base import Base
+from .._executor._engine import _run_step
+from .._fingerprint import fingerprint, fingerprint_parameters
+from .._graph import build_read_graph
+from .._results import ResultsLock
+
+T = TypeVar("T", bound=Base)
+
+
+def _share_step(source: Base, target: Base, step: str, mutated: set[str]) -> None:
+    """Copy the outputs and metadata of a completed step to another analysis.
+
+    Results are shared by reference, except results which are mutated by some
+    step of the analysis: those are copied so that mutations applied to one
+    analysis never leak into another.
+    """
+    method = getattr(source.__class__, step)
+    written = [*method.creates, *method.creates_flags, *method.mutates]
+    metadata = source._results.get_step_metadata(step)
+
+    with ResultsLock.allow_mutation():
+        for key in written:
+            value = getattr(source._results, key)
+            if key in mutated:
+                value = copy.deepcopy(value)
+            setattr(target._results, key, value)
+        target._results.set_metadata(step, copy.copy(metadata))
+        target._results.set_versions(written, metadata.version)
+
+    target._completed_steps.add(step)
+    if step not in target._step_ordering:
+        target._step_ordering.append(step)
+
+
+def sweep(
+    cls: type[T],
+    parameters: Iterable[Any],
+    workers: int = 1,
+    target_step: str | None = None,
+) -> list[T]:
+    """Run an analysis for many parameter variants, sharing common computation.
+
+    A step invocation is identified by the step, the values of the parameters
+    it depends on, and the invocations which produced its inputs. Identical
+    invocations across variants are executed once and their results are shared
+    with every variant, so the cost of a sweep scales with the number of
+    distinct computations rather than the number of variants.
+
+    Steps depend on the parameters they read, inferred from their source as
+    `self.parameters.{name}`, `self.parameters["{name}"]` or
+    `self.parameters.get("{name}")`, or declared with `@step(parameters=...)`.
+    Steps using the parameters (or `self`) in other ways, e.g. through a helper
+    method, depend on all parameters.
+
+    Parameters
+    ----------
+    cls : type[Base]
+        The analysis class to run.
+    parameters : Iterable[Any]
+        The parameters of each variant.
+    workers : int, optional
+        Number of distinct step invocations run concurrently, by default 1.
+    target_step : str, optional
+        Only execute the steps up to and including this step.
+
+    Returns
+    -------
+    list[Base]
+        An executed analysis for each variant, in the order of `parameters`.
+    """
+    analyses = [cls(parameters=params) for params in parameters]
+    if not analyses:
+        return []
+
+    execution_order = analyses[0]._executor._get_trimmed_execution_order(target_step)
+    graph = build_read_graph(analyses[0])
+    mutated = {key for step in execution_order for key in getattr(cls, step).mutates}
+
+    # The invocation which produced each step's outputs in each analysis
+    lineage: list[dict[str, str]] = [{} for _ in analyses]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for step in execution_order:
+            method = getattr(cls, step)
+
+            groups: dict[str, list[int]] = {}
+            for idx, analysis in enumerate(analyses):
+                params = fingerprint_parameters(analysis.parameters, method.parameters)
+                upstream = sorted((dep, lineage[idx][dep]) for dep in graph[step])
+                key = fingerprint((step, params, upstream)) if params else None
+                # Invocations with parameters that cannot be fingerprinted are unique
+                key = key or f"{step}:{idx}"
+                lineage[idx][step] = key
+                groups.setdefault(key, []).append(idx)
+
+            futures = {
+                key: pool.submit(_run_step, getattr(analyses[members[0]], step))
+                for key, members in groups.items()
+            }
+            for key, members in groups.items():
+                futures[key].result()
+                for idx in members[1:]:
+                    _share_step(analyses[members[0]], analyses[idx], step, mutated)
+
+    return analyses
@@ -0,0 +1,29 @@
+from ._chrome import load_trace, to_chrome_trace, trace_from_manifest
+from ._recorder import TraceEvent, Tracer, TraceRecorder
+
+
+def trace():
+    """Record a timeline of step execution and serialization.
+
+    Returns a context manager yielding a `TraceRecorder`. Every step executed and
+    every archive saved or loaded while the context is active is recorded.
+
+    Examples
+    --------
+    >>> with yf.trace() as recorder:
+    ...     analysis.execute_all()
+    ...     analysis.save("analysis.yax")
+    >>> recorder.save("analysis.trace.json")
+    """
+    return Tracer.record()
+
+
+__all__ = [
+    "TraceEvent",
+    "TraceRecorder",
+    "Tracer",
+    "load_trace",
+    "to_chrome_trace",
+    "trace",
+    "trace_from_manifest",
+]
@@ -0,0 +1,122 @@
+from datetime import datetime
+from typing import Any
+
+from ._recorder import TraceEvent
+
+# Chrome trace timestamps and durations are expressed in microseconds
+_US = 1e6
+
+
+def _complete_event(event: TraceEvent) -> dict[str, Any]:
+    """Convert a trace event into a Chrome "complete" (ph=X) event."""
+    return {
+        "name": event.name,
+        "cat": event.category,
+        "ph": "X",
+        "ts": event.start * _US,
+        "dur": event.elapsed * _US,
+        "pid": event.process_id,
+        "tid": event.thread_id,
+        "args": event.args,
+    }
+
+
+def _lane_events(events: list[TraceEvent]) -> list[dict[str, Any]]:
+    """Build the metadata events naming each process and thread lane."""
+    lanes = []
+    processes = set()
+    threads = set()
+    for event in events:
+        if event.process_id not in processes:
+            processes.add(event.process_id)
+            lanes.append(
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": event.process_id,
+                    "args": {"name": f"yaflux ({event.process_id})"},
+                }
+            )
+        if (event.process_id, event.thread_id) not in threads:
+            threads.add((event.process_id, event.thread_id))
+            lanes.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": event.process_id,
+                    "tid": event.thread_id,
+                    "args": {"name": event.thread_name or str(event.thread_id)},
+                }
+            )
+    return lanes
+
+
+def to_chrome_trace(events: list[TraceEvent]) -> dict[str, Any]:
+    """Convert trace events to the Chrome Trace Event format.
+
+    The output can be loaded by `chrome://tracing` or https://ui.perfetto.dev
+
+    Parameters
+    ----------
+    events : list[TraceEvent]
+        The events to convert.
+
+    Returns
+    -------
+    dict[str, Any]
+        A JSON-serializable Chrome trace.
+    """
+    return {
+        "traceEvents": _lane_events(events) + [_complete_event(e) for e in events],
+        "displayTimeUnit": "ms",
+    }
+
+
+def trace_from_manifest(manifest: dict) -> dict[str, Any]:
+    """Reconstruct a Chrome trace from the `steps` section of an archive manifest.
+
+    Only step spans can be reconstructed since serialization timings are not
+    stored in the archive.
+
+    Parameters
+    ----------
+    manifest : dict
+        The parsed `manifest.json` of a yaflux archive.
+
+    Returns
+    -------
+    dict[str, Any]
+        A JSON-serializable Chrome trace.
+    """
+    events = [
+        TraceEvent(
+            name=step,
+            category="step",
+            start=datetime.fromisoformat(info["timestamp"]).timestamp(),
+            elapsed=info["elapsed"],
+            process_id=info.get("process_id", 0),
+            thread_id=info.get("thread_id", 0),
+            args={"creates": info["creates"], "requires": info["requires"]},
+        )
+        for step, info in manifest.get("steps", {}).items()
+    ]
+    events.sort(key=lambda event: event.start)
+    return to_chrome_trace(events)
+
+
+def load_trace(filepath: str) -> dict[str, Any]:
+    """Reconstruct a Chrome trace of the step timings stored in a yaflux archive.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the yaflux archive.
+
+    Returns
+    -------
+    dict[str, Any]
+        A JSON-serializable Chrome trace.
+    """
+    from .._yax import ArchiveSerializer  # avoid circular import
+
+    return trace_from_manifest(ArchiveSerializer.read_manifest(filepath))
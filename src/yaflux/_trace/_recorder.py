@@ -0,0 +1,137 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+
+@dataclass
+class TraceEvent:
+    """A single timed span recorded during execution or serialization."""
+
+    # Name of the span (step name, result key, or io operation)
+    name: str
+
+    # Category of the span (e.g. "step", "io", "serialize")
+    category: str
+
+    # When the span started (seconds since the epoch)
+    start: float
+
+    # How long the span took (seconds)
+    elapsed: float
+
+    # The process the span was recorded in
+    process_id: int
+
+    # The thread the span was recorded in
+    thread_id: int
+
+    # The name of the thread the span was recorded in
+    thread_name: str = ""
+
+    # Additional information attached to the span
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+class TraceRecorder:
+    """Collects trace events and exports them as a Chrome trace.
+
+    Recorders are created with :func:`yaflux.trace` and collect every span
+    emitted while they are active.
+    """
+
+    def __init__(self):
+        self._events: list[TraceEvent] = []
+        self._lock = threading.Lock()
+
+    @property
+    def events(self) -> list[TraceEvent]:
+        """The events recorded so far, ordered by start time."""
+        with self._lock:
+            return sorted(self._events, key=lambda event: event.start)
+
+    def add(self, event: TraceEvent) -> None:
+        """Add an event to the recorder."""
+        with self._lock:
+            self._events.append(event)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Export the recorded events in the Chrome Trace Event format."""
+        from ._chrome import to_chrome_trace
+
+        return to_chrome_trace(self.events)
+
+    def save(self, filepath: str) -> None:
+        """Write the recorded events to a Chrome trace JSON file.
+
+        The file can be opened with `chrome://tracing` or https://ui.perfetto.dev
+        """
+        with open(filepath, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+class Tracer:
+    """Dispatches trace spans to all active recorders.
+
+    When no recorder is active emitting a span is a no-op.
+    """
+
+    _recorders: ClassVar[list[TraceRecorder]] = []
+    _lock = threading.Lock()
+
+    @classmethod
+    def is_active(cls) -> bool:
+        """Check if any recorder is currently collecting events."""
+        return len(cls._recorders) > 0
+
+    @classmethod
+    def emit(
+        cls, name: str, category: str, start: float, elapsed: float, **args: Any
+    ) -> None:
+        """Record an already timed span on all active recorders."""
+        if not cls._recorders:
+            return
+
+        thread = threading.current_thread()
+        event = TraceEvent(
+            name=name,
+            category=category,
+            start=start,
+            elapsed=elapsed,
+            process_id=os.getpid(),
+            thread_id=threading.get_ident(),
+            thread_name=thread.name,
+            args=args,
+        )
+        for recorder in list(cls._recorders):
+            recorder.add(event)
+
+    @classmethod
+    @contextmanager
+    def span(cls, name: str, category: str, **args: Any):
+        """Context manager timing the enclosed block as a span."""
+        if not cls._recorders:
+            yield
+            return
+
+        start = time.time()
+        try:
+            yield
+        finally:
+            cls.emit(name, category, start, time.time() - start, **args)
+
+    @classmethod
+    @contextmanager
+    def record(cls):
+        """Context manager activating a new recorder."""
+        recorder = TraceRecorder()
+        with cls._lock:
+            cls._recorders.append(recorder)
+        try:
+            yield recorder
+        finally:
+            with cls._lock:
+                cls._recorders.remove(recorder)
@@ -1,3 +1,12 @@
+from ._archive import ArchiveSerializer
+from ._backend import (
+    ArchiveBackend,
+    BackendRegistry,
+    DirectoryBackend,
+    SqliteBackend,
+    TarBackend,
+    ZipBackend,
+)
 from ._error import (
     YaxMissingParametersFileError,
     YaxMissingResultError,
@@ -5,13 +14,18 @@ from ._error import (
     YaxMissingVersionFileError,
     YaxNotArchiveFileError,
 )
-from ._tarfile import TarfileSerializer
 
 __all__ = [
-    "TarfileSerializer",
+    "ArchiveBackend",
+    "ArchiveSerializer",
+    "BackendRegistry",
+    "DirectoryBackend",
+    "SqliteBackend",
+    "TarBackend",
     "YaxMissingParametersFileError",
     "YaxMissingResultError",
     "YaxMissingResultFileError",
     "YaxMissingVersionFileError",
     "YaxNotArchiveFileError",
+    "ZipBackend",
 ]
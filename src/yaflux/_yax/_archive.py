@@ -0,0 +1,915 @@
+import itertools
+import json
+import os
+import pickle
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import IO, Any
+
+from .._stream import ChunkStream
+from .._trace import Tracer
+from ._backend import ArchiveBackend, BackendRegistry
+from ._chunked import (
+    ChunkSpec,
+    chunk_grid,
+    iter_chunks,
+    read_region,
+    resolve_chunk_shape,
+)
+from ._container import (
+    CONTAINER_FORMAT,
+    ItemPath,
+    assemble_container,
+    container_entry,
+    iter_entry_items,
+    iter_items,
+    select_items,
+    split_containers,
+)
+from ._error import (
+    YaxMissingResultError,
+    YaxMissingResultFileError,
+    YaxMissingVersionFileError,
+    YaxNotArchiveFileError,
+)
+from ._serializer import SerializerMetadata, SerializerRegistry
+
+
+@dataclass(frozen=True)
+class ReadOptions:
+    """Which part of a result to read, and how."""
+
+    # Columns of a tabular result to read, by default all columns
+    columns: list[str] | None = None
+
+    # Range of rows of a tabular result to read, by default all rows
+    rows: slice | None = None
+
+    # Basic index of an array result to read, by default the whole array
+    selection: Any = None
+
+    # Whether to open the result in backed mode, reading its data on demand
+    backed: bool = False
+
+    # Components of a composite result to read, by default all components
+    components: list[str] | None = None
+
+    @property
+    def projected(self) -> bool:
+        """Whether only some columns or rows are read."""
+        return self.columns is not None or self.rows is not None
+
+
+# Reads a whole result into memory
+_READ_ALL = ReadOptions()
+
+
+class ArchiveSerializer:
+    """Handles serialization of analysis objects to/from yaflux archive format.
+
+    Every archive stores the same members: a pickled metadata dictionary, the
+    pickled parameters, a JSON manifest, and one member per result (or one per
+    chunk of a streamed or chunked result, or per item of a container) under
+    the results directory. How the members
+    are stored is up to the `ArchiveBackend` picked from the extension of the
+    archive.
+    """
+
+    # Version of the archive format, bumped whenever archives may hold members
+    # of a new format or be stored by a new backend
+    VERSION = "0.4.0"
+    METADATA_NAME = "metadata.pkl"
+    PARAMETERS_NAME = "parameters.pkl"
+    MANIFEST_NAME = "manifest.json"
+    RESULTS_DIR = "results"
+    STREAM_FORMAT = "stream"
+    CHUNKED_FORMAT = "chunked"
+    CONTAINER_FORMAT = CONTAINER_FORMAT
+
+    @classmethod
+    def save(
+        cls,
+        filepath: str,
+        analysis: Any,
+        force: bool = False,
+        compress: bool = False,
+        workers: int | None = None,
+        backend: type[ArchiveBackend] | None = None,
+        chunks: dict[str, ChunkSpec] | None = None,
+    ) -> str:
+        """Save analysis to a yaflux archive.
+
+        Saving over an existing archive of a backend supporting updates only
+        rewrites the results whose version changed since the last save.
+
+        Parameters
+        ----------
+        filepath : str
+            Path of the archive.
+        analysis : Base
+            The analysis to save.
+        force : bool
+            Whether to overwrite (or update) an existing archive.
+        compress : bool
+            Whether to compress the archive. Backends storing members
+            uncompressed (e.g. `.yaxd` directories) compress the members of
+            formats supporting it instead, such as sparse matrix components.
+        workers : int | None
+            Number of threads serializing results. By default results are
+            serialized concurrently only for backends supporting concurrent
+            writes.
+        backend : type[ArchiveBackend] | None
+            Backend storing the archive, by default picked from the extension.
+        chunks : dict[str, int | tuple[int | None, ...]] | None
+            Chunk shapes of array results to store as a grid of chunks, by
+            result name. A None chunk size spans the whole dimension, and a
+            single integer only chunks the first dimension.
+
+        Returns
+        -------
+        str
+            The path the archive was written to.
+        """
+        backend = backend or BackendRegistry.for_path(filepath)
+        filepath = backend.resolve_filepath(filepath, compress)
+        if not force and os.path.exists(filepath):
+            raise FileExistsError(f"File already exists: '{filepath}'")
+
+        results = analysis._results._data
+        chunk_shapes = cls._resolve_chunk_shapes(results, chunks or {})
+        metadata = cls._create_metadata(analysis)
+        previous = cls._reusable_entries(filepath, backend, metadata, chunk_shapes)
+        if workers is None and not backend.CONCURRENT_WRITES:
+            workers = 1
+
+        with (
+            Tracer.span("save", "io", filepath=filepath),
+            backend(
+                filepath, "a" if previous is not None else "w", compress
+            ) as archive,
+        ):
+            # Remove the manifest first so an interrupted update is never
+            # mistaken for a complete archive
+            existing = set(archive.list_members()) if previous is not None else set()
+            if cls.MANIFEST_NAME in existing:
+                archive.remove_member(cls.MANIFEST_NAME)
+
+            entries = cls._write_results(
+                archive, results, previous or {}, workers, chunk_shapes
+            )
+            cls._remove_unused_members(archive, existing, entries)
+
+            archive.write_member(cls.METADATA_NAME, pickle.dumps(metadata))
+            archive.write_member(cls.PARAMETERS_NAME, pickle.dumps(analysis.parameters))
+            manifest = cls._create_manifest(metadata, entries)
+            archive.write_member(cls.MANIFEST_NAME, manifest.encode("utf-8"))
+
+        return filepath
+
+    @classmethod
+    def load(
+        cls,
+        filepath: str,
+        *,
+        no_results: bool = False,
+        select: list[str] | str | None = None,
+        exclude: list[str] | str | None = None,
+        columns: dict[str, list[str]] | None = None,
+        rows: dict[str, slice | tuple[int, int]] | None = None,
+        slices: dict[str, Any] | None = None,
+        backed: list[str] | str | None = None,
+        components: dict[str, list[str]] | None = None,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Load analysis from a yaflux archive.
+
+        `columns` and `rows` map result names to the columns and the range of
+        rows to read of them. Only serializers of tabular formats support them.
+        `slices` maps names of array results to the basic index to read of them,
+        only reading the chunks it covers for arrays stored in chunks. Results
+        named in `backed` are opened in backed mode, which only serializers of
+        formats with random access (e.g. AnnData) support. `components` maps
+        names of composite results (e.g. AnnData, or dicts, lists and tuples
+        stored as containers) to the components to read.
+        """
+        select = cls._normalize_input(select)
+        exclude = cls._normalize_input(exclude)
+        columns = columns or {}
+        slices = slices or {}
+        rows = {key: cls._normalize_rows(value) for key, value in (rows or {}).items()}
+        backed = set(cls._normalize_input(backed) or [])
+        components = {
+            key: cls._normalize_input(value)
+            for key, value in (components or {}).items()
+        }
+        backend = cls._archive_backend(filepath)
+
+        with (
+            Tracer.span("load", "io", filepath=filepath),
+            backend(filepath, "r") as archive,
+        ):
+            metadata = cls._read_metadata(archive)
+            manifest = cls._read_manifest(archive)
+            metadata["parameters"] = cls._read_parameters(archive)
+
+            if no_results:
+                return metadata, {}
+
+            to_load = cls._determine_results_to_load(
+                metadata["result_keys"], select, exclude
+            )
+            requested = set(columns) | set(rows) | set(slices) | set(components)
+            unloaded = (requested | backed) - to_load
+            if unloaded:
+                raise ValueError(
+                    f"Projection requested for unloaded results: {unloaded}"
+                )
+
+            results = {
+                key: cls._load_result(
+                    archive,
+                    key,
+                    manifest["results"][key],
+                    ReadOptions(
+                        columns=columns.get(key),
+                        rows=rows.get(key),
+                        selection=slices.get(key),
+                        backed=key in backed,
+                        components=components.get(key),
+                    ),
+                )
+                for key in to_load
+            }
+
+            return metadata, results
+
+    @classmethod
+    def read_manifest(cls, filepath: str) -> dict:
+        """Read only the manifest from a yaflux archive."""
+        with cls._archive_backend(filepath)(filepath, "r") as archive:
+            return cls._read_manifest(archive)
+
+    @classmethod
+    def is_yaflux_archive(cls, filepath: str) -> bool:
+        """Check if a path is a yaflux archive of any backend."""
+        return BackendRegistry.for_archive(filepath) is not None
+
+    @classmethod
+    def _archive_backend(cls, filepath: str) -> type[ArchiveBackend]:
+        """Get the backend of an existing archive."""
+        backend = BackendRegistry.for_archive(filepath)
+        if backend is None:
+            raise YaxNotArchiveFileError(
+                "Provided file is not a yax archive. "
+                "Please provide a valid yax archive."
+            )
+        return backend
+
+    @classmethod
+    def _create_metadata(cls, analysis: Any) -> dict:
+        """Create metadata dictionary for the analysis."""
+        return {
+            "version": cls.VERSION,
+            "parameters": analysis.parameters,
+            "completed_steps": list(analysis._completed_steps),
+            "step_metadata": analysis._results._metadata,
+            "result_keys": list(analysis._results._data.keys()),
+            "result_versions": dict(analysis._results._versions),
+            "step_ordering": analysis._step_ordering,
+            "timestamp": datetime.now().timestamp(),
+        }
+
+    @classmethod
+    def _create_manifest(cls, metadata: dict, entries: dict[str, dict]) -> str:
+        """Create a JSON manifest of the archive contents."""
+        manifest = {
+            "archive_info": {
+                "version": metadata["version"],
+                "created": datetime.fromtimestamp(metadata["timestamp"]).isoformat(),
+                "yaflux_format": cls.VERSION,
+            },
+            "analysis": {
+                "completed_steps": sorted(metadata["completed_steps"]),
+                "step_ordering": metadata["step_ordering"],
+                "parameters": str(metadata["parameters"]),
+            },
+            "results": entries,
+            "steps": {
+                step: {
+                    "creates": sorted(info.creates),
+                    "requires": sorted(info.requires),
+                    "elapsed": info.elapsed,
+                    "timestamp": datetime.fromtimestamp(info.timestamp).isoformat(),
+                    "process_id": info.process_id,
+                    "thread_id": info.thread_id,
+                }
+                for step, info in metadata["step_metadata"].items()
+            },
+        }
+        return json.dumps(manifest, indent=2)
+
+    @staticmethod
+    def _manifest_entry(
+        meta: SerializerMetadata, chunks: list[SerializerMetadata] | None = None
+    ) -> dict:
+        """Describe a serialized result (and the chunks of a stream) in the manifest."""
+        entry: dict[str, Any] = {
+            "type": meta.type_name,
+            "module": meta.module_name,
+            "format": meta.format,
+            "size_bytes": meta.size_bytes,
+        }
+        if chunks is not None:
+            entry["chunks"] = [
+                ArchiveSerializer._manifest_entry(chunk) for chunk in chunks
+            ]
+        return entry
+
+    @classmethod
+    def _resolve_chunk_shapes(
+        cls, results: dict[str, Any], chunks: dict[str, ChunkSpec]
+    ) -> dict[str, tuple[int, ...]]:
+        """Resolve the requested chunk shapes against the arrays to chunk."""
+        chunk_shapes = {}
+        for key, spec in chunks.items():
+            if key not in results:
+                raise YaxMissingResultError(f"Cannot chunk missing result: {key}")
+            array = results[key]
+            np = sys.modules.get("numpy")
+            if np is None or not isinstance(array, np.ndarray):
+                raise ValueError(f"Only numpy arrays can be chunked: {key}")
+            if array.dtype.hasobject or array.dtype.fields is not None:
+                raise ValueError(
+                    f"Arrays of object or structured dtype cannot be chunked: {key}"
+                )
+            chunk_shapes[key] = resolve_chunk_shape(array.shape, spec)
+        return chunk_shapes
+
+    @classmethod
+    def _reusable_entries(
+        cls,
+        filepath: str,
+        backend: type[ArchiveBackend],
+        metadata: dict,
+        chunk_shapes: dict[str, tuple[int, ...]],
+    ) -> dict[str, dict] | None:
+        """Find the manifest entries of results unchanged since the last save.
+
+        A result is unchanged if the archive holds the same version of it, in
+        the same chunk layout. Returns None if the archive cannot be updated in
+        place.
+        """
+        if not (backend.SUPPORTS_UPDATE and backend.is_archive(filepath)):
+            return None
+        versions = metadata["result_versions"]
+        try:
+            with backend(filepath, "r") as archive:
+                previous_versions = cls._read_metadata(archive).get(
+                    "result_versions", {}
+                )
+                previous_results = cls._read_manifest(archive)["results"]
+                members = set(archive.list_members())
+        except (KeyError, ValueError, pickle.UnpicklingError):
+            return None
+
+        return {
+            key: entry
+            for key, entry in previous_results.items()
+            if key in versions
+            and previous_versions.get(key) == versions[key]
+            and entry.get("chunk_shape") == cls._chunk_shape_entry(chunk_shapes, key)
+            and members.issuperset(cls._entry_paths(key, entry))
+        }
+
+    @staticmethod
+    def _chunk_shape_entry(
+        chunk_shapes: dict[str, tuple[int, ...]], key: str
+    ) -> list[int] | None:
+        """Chunk shape of a result as recorded in the manifest."""
+        chunk_shape = chunk_shapes.get(key)
+        return list(chunk_shape) if chunk_shape is not None else None
+
+    @classmethod
+    def _write_results(
+        cls,
+        archive: ArchiveBackend,
+        results: dict[str, Any],
+        previous: dict[str, dict],
+        workers: int | None,
+        chunk_shapes: dict[str, tuple[int, ...]],
+    ) -> dict[str, dict]:
+        """Write the changed results, returning the manifest entries of all results.
+
+        The items of containers are written as separate jobs, so they are
+        serialized concurrently like results.
+        """
+        changed = [key for key in results if key not in previous]
+        containers = {
+            key: split
+            for key in changed
+            if key not in chunk_shapes
+            and not isinstance(results[key], ChunkStream)
+            and (split := split_containers(results[key]))
+        }
+
+        # A job writes a whole result (without path) or an item of a container
+        jobs: list[tuple[str, ItemPath | None, Any]] = []
+        for key in changed:
+            if key in containers:
+                jobs.extend(
+                    (key, path, item)
+                    for path, item in iter_items(results[key], containers[key])
+                )
+            else:
+                jobs.append((key, None, results[key]))
+
+        # Serialization runs concurrently, writes only if the backend allows it
+        lock = None if archive.CONCURRENT_WRITES else threading.Lock()
+
+        def write(job: tuple[str, ItemPath | None, Any]) -> dict:
+            key, path, value = job
+            if path is not None:
+                return cls._write_item(archive, key, path, value, lock)
+            return cls._write_result(archive, key, value, lock, chunk_shapes.get(key))
+
+        if workers == 1:
+            written = [write(job) for job in jobs]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                written = list(pool.map(write, jobs))
+
+        job_entries = {
+            (key, path): entry
+            for (key, path, _), entry in zip(jobs, written, strict=True)
+        }
+        entries = dict(previous)
+        for key in changed:
+            if key in containers:
+                entries[key] = container_entry(
+                    results[key],
+                    containers[key],
+                    lambda path, key=key: job_entries[key, path],
+                )
+            else:
+                entries[key] = job_entries[key, None]
+
+        # Keep the order of the results in the manifest
+        return {key: entries[key] for key in results}
+
+    @classmethod
+    def _write_result(
+        cls,
+        archive: ArchiveBackend,
+        key: str,
+        value: Any,
+        lock: "threading.Lock | None",
+        chunk_shape: tuple[int, ...] | None = None,
+    ) -> dict:
+        """Write a single result, returning its manifest entry."""
+        if isinstance(value, ChunkStream):
+            chunks = cls._write_stream(archive, key, value, lock)
+            return cls._manifest_entry(cls._stream_metadata(chunks), chunks)
+        if chunk_shape is not None:
+            return cls._write_chunked(archive, key, value, chunk_shape, lock)
+
+        result, metadata = cls._serialize(key, value, archive.compress_members)
+        cls._write_member(archive, cls._result_path(key, metadata.format), result, lock)
+        return cls._manifest_entry(metadata)
+
+    @classmethod
+    def _write_stream(
+        cls,
+        archive: ArchiveBackend,
+        key: str,
+        stream: ChunkStream,
+        lock: "threading.Lock | None",
+    ) -> list[SerializerMetadata]:
+        """Write the chunks of a stream as they are produced.
+
+        Each chunk is stored as its own member under `results/{key}/` so only a
+        single chunk is held in memory at a time.
+        """
+        chunks = []
+        with Tracer.span(key, "serialize", stream=True):
+            for index, chunk in enumerate(stream):
+                result, metadata = cls._serialize(key, chunk, archive.compress_members)
+                cls._write_member(
+                    archive, cls._chunk_path(key, index, metadata.format), result, lock
+                )
+                chunks.append(metadata)
+        return chunks
+
+    @classmethod
+    def _write_chunked(
+        cls,
+        archive: ArchiveBackend,
+        key: str,
+        array: Any,
+        chunk_shape: tuple[int, ...],
+        lock: "threading.Lock | None",
+    ) -> dict:
+        """Write an array as a grid of chunks, returning its manifest entry.
+
+        Each chunk is stored as its own member under `results/{key}/`, named
+        after its position in the chunk grid, so a slice of the array can be
+        read from the chunks it covers.
+        """
+        chunks = []
+        with Tracer.span(key, "serialize", chunked=True):
+            for index, chunk in iter_chunks(array, chunk_shape):
+                result, metadata = cls._serialize(
+                    key, chunk.copy(order="C"), archive.compress_members
+                )
+                cls._write_member(
+                    archive,
+                    cls._grid_chunk_path(key, index, metadata.format),
+                    result,
+                    lock,
+                )
+                chunks.append(metadata)
+
+        entry = cls._manifest_entry(
+            SerializerMetadata(
+                format=cls.CHUNKED_FORMAT,
+                type_name=type(array).__name__,
+                module_name=type(array).__module__,
+                size_bytes=sum(chunk.size_bytes for chunk in chunks),
+            ),
+            chunks,
+        )
+        entry["shape"] = list(array.shape)
+        entry["dtype"] = array.dtype.str
+        entry["chunk_shape"] = list(chunk_shape)
+        return entry
+
+    @classmethod
+    def _write_item(
+        cls,
+        archive: ArchiveBackend,
+        key: str,
+        path: ItemPath,
+        value: Any,
+        lock: "threading.Lock | None",
+    ) -> dict:
+        """Write an item of a container result, returning its manifest entry."""
+        result, metadata = cls._serialize(key, value, archive.compress_members)
+        cls._write_member(
+            archive, cls._item_path(key, path, metadata.format), result, lock
+        )
+        return cls._manifest_entry(metadata)
+
+    @staticmethod
+    def _write_member(
+        archive: ArchiveBackend,
+        path: str,
+        data: bytes | str,
+        lock: "threading.Lock | None",
+    ) -> None:
+        """Write a member, holding the lock of backends without concurrent writes."""
+        if lock is None:
+            archive.write_member(path, data)
+            return
+        with lock:
+            archive.write_member(path, data)
+
+    @classmethod
+    def _remove_unused_members(
+        cls, archive: ArchiveBackend, existing: set[str], entries: dict[str, dict]
+    ) -> None:
+        """Remove result members of an updated archive left over from previous saves."""
+        used = {
+            path
+            for key, entry in entries.items()
+            for path in cls._entry_paths(key, entry)
+        }
+        for name in sorted(existing):
+            if name.startswith(f"{cls.RESULTS_DIR}/") and name not in used:
+                archive.remove_member(name)
+
+    @classmethod
+    def _stream_metadata(cls, chunks: list[SerializerMetadata]) -> SerializerMetadata:
+        """Describe a streamed result made of the given chunks."""
+        return SerializerMetadata(
+            format=cls.STREAM_FORMAT,
+            type_name=ChunkStream.__name__,
+            module_name=ChunkStream.__module__,
+            size_bytes=sum(chunk.size_bytes for chunk in chunks),
+        )
+
+    @staticmethod
+    def _serialize(
+        key: str, value: Any, compress: bool = False
+    ) -> tuple[bytes | str, SerializerMetadata]:
+        """Serialize a result with the first serializer able to handle it.
+
+        Results of formats supporting compression are compressed if `compress`.
+        """
+        with Tracer.span(key, "serialize"):
+            serializer = SerializerRegistry.get_serializer(value)
+            if compress:
+                return serializer.serialize_compressed(value)
+            return serializer.serialize(value)
+
+    @classmethod
+    def _result_path(cls, key: str, format: str) -> str:
+        """Path of a result relative to the root of the archive."""
+        return f"{cls.RESULTS_DIR}/{key}.{format}"
+
+    @classmethod
+    def _chunk_path(cls, key: str, index: int, format: str) -> str:
+        """Path of a chunk of a streamed result relative to the root of the archive."""
+        return f"{cls.RESULTS_DIR}/{key}/{index:08d}.{format}"
+
+    @classmethod
+    def _grid_chunk_path(cls, key: str, index: tuple[int, ...], format: str) -> str:
+        """Path of a chunk of a chunked array relative to the root of the archive."""
+        return f"{cls.RESULTS_DIR}/{key}/{'.'.join(map(str, index))}.{format}"
+
+    @classmethod
+    def _item_path(cls, key: str, path: ItemPath, format: str) -> str:
+        """Path of an item of a container result relative to the root of the archive."""
+        return f"{cls.RESULTS_DIR}/{key}/{'.'.join(map(str, path))}.{format}"
+
+    @staticmethod
+    def _grid_chunks(entry: dict) -> dict[tuple[int, ...], dict]:
+        """Map the positions in the chunk grid to the chunks of a chunked array."""
+        grid = chunk_grid(tuple(entry["shape"]), tuple(entry["chunk_shape"]))
+        positions = itertools.product(*(range(n) for n in grid))
+        return dict(zip(positions, entry["chunks"], strict=True))
+
+    @classmethod
+    def _entry_paths(cls, key: str, entry: dict) -> list[str]:
+        """Paths of the members storing a result described by a manifest entry."""
+        if entry["format"] == cls.CHUNKED_FORMAT:
+            return [
+                cls._grid_chunk_path(key, index, chunk["format"])
+                for index, chunk in cls._grid_chunks(entry).items()
+            ]
+        if entry["format"] == cls.STREAM_FORMAT:
+            return [
+                cls._chunk_path(key, index, chunk["format"])
+                for index, chunk in enumerate(entry["chunks"])
+            ]
+        if entry["format"] == cls.CONTAINER_FORMAT:
+            return [
+                cls._item_path(key, path, item["format"])
+                for path, item in iter_entry_items(entry)
+            ]
+        return [cls._result_path(key, entry["format"])]
+
+    @classmethod
+    def _read_metadata(cls, archive: ArchiveBackend) -> dict:
+        """Read metadata from the archive."""
+        try:
+            data = archive.read_member(cls.METADATA_NAME)
+        except KeyError as exc:
+            raise ValueError(
+                f"Invalid yaflux archive: missing {cls.METADATA_NAME}"
+            ) from exc
+
+        metadata = pickle.loads(data)
+        if "version" not in metadata:
+            raise YaxMissingVersionFileError(
+                "Invalid yaflux archive: missing version in metadata"
+            )
+
+        return metadata
+
+    @classmethod
+    def _read_manifest(cls, archive: ArchiveBackend) -> dict:
+        """Read manifest from the archive."""
+        try:
+            data = archive.read_member(cls.MANIFEST_NAME)
+        except KeyError as exc:
+            raise ValueError(
+                f"Invalid yaflux archive: missing {cls.MANIFEST_NAME}"
+            ) from exc
+        return json.loads(data.decode("utf-8"))
+
+    @classmethod
+    def _read_parameters(cls, archive: ArchiveBackend) -> Any:
+        """Read parameters from the archive."""
+        try:
+            return pickle.loads(archive.read_member(cls.PARAMETERS_NAME))
+        except KeyError:
+            return None
+
+    @classmethod
+    def _determine_results_to_load(
+        cls,
+        available_results: list[str],
+        select: list[str] | None,
+        exclude: list[str] | None,
+    ) -> set[str]:
+        """Determine which results should be loaded."""
+        if select is not None and exclude is not None:
+            raise ValueError("Cannot specify both select and exclude")
+
+        to_load = set(available_results)
+        if select is not None:
+            invalid = set(select) - set(available_results)
+            if invalid:
+                raise YaxMissingResultError(f"Requested results not found: {invalid}")
+            to_load = set(select)
+        elif exclude is not None:
+            to_load -= set(exclude)
+
+        return to_load
+
+    @classmethod
+    def _load_result(
+        cls,
+        archive: ArchiveBackend,
+        key: str,
+        entry: dict,
+        options: ReadOptions = _READ_ALL,
+    ) -> Any:
+        """Load a single result, lazily for streamed results."""
+        cls._check_read_options(key, entry, options)
+        selection = options.selection
+
+        if entry["format"] == cls.CHUNKED_FORMAT:
+            return cls._load_chunked(archive, key, entry, selection)
+
+        if entry["format"] == cls.CONTAINER_FORMAT:
+            return cls._load_container(archive, key, entry, options.components)
+
+        if entry["format"] == cls.STREAM_FORMAT:
+            return cls._load_stream(
+                type(archive), archive.filepath, key, entry, options
+            )
+
+        metadata = cls._serializer_metadata(entry)
+        with Tracer.span(key, "deserialize"):
+            result = cls._read_result(
+                archive, cls._result_path(key, metadata.format), metadata, options
+            )
+        # Arrays stored whole are read whole before slicing
+        return result if selection is None else result[selection]
+
+    @classmethod
+    def _check_read_options(cls, key: str, entry: dict, options: ReadOptions) -> None:
+        """Check that the read options can be combined and apply to a result."""
+        requested = [
+            name
+            for name, value in (
+                ("columns or rows", options.projected),
+                ("a slice", options.selection is not None),
+                ("backed mode", options.backed),
+                ("components", options.components is not None),
+            )
+            if value
+        ]
+        if len(requested) > 1:
+            raise ValueError(f"Cannot combine {' and '.join(requested)}: {key}")
+
+        if options.selection is not None and entry["type"] != "ndarray":
+            raise ValueError(f"Slices can only be read of array results: {key}")
+        if entry["format"] == cls.CHUNKED_FORMAT and requested not in ([], ["a slice"]):
+            raise ValueError(f"Chunked arrays can only be sliced: {key}")
+        if entry["format"] == cls.CONTAINER_FORMAT and requested not in (
+            [],
+            ["components"],
+        ):
+            raise ValueError(f"Only components can be read of containers: {key}")
+        if entry["format"] == cls.STREAM_FORMAT and options.backed:
+            raise ValueError(f"Streamed results cannot be opened backed: {key}")
+
+    @classmethod
+    def _load_chunked(
+        cls, archive: ArchiveBackend, key: str, entry: dict, selection: Any
+    ) -> Any:
+        """Load a chunked array, reading only the chunks covered by the selection."""
+        chunks = cls._grid_chunks(entry)
+
+        def read_chunk(index: tuple[int, ...]) -> Any:
+            metadata = cls._serializer_metadata(chunks[index])
+            return cls._read_result(
+                archive, cls._grid_chunk_path(key, index, metadata.format), metadata
+            )
+
+        with Tracer.span(key, "deserialize", chunked=True):
+            return read_region(
+                read_chunk,
+                tuple(entry["shape"]),
+                entry["dtype"],
+                tuple(entry["chunk_shape"]),
+                Ellipsis if selection is None else selection,
+            )
+
+    @classmethod
+    def _load_container(
+        cls,
+        archive: ArchiveBackend,
+        key: str,
+        entry: dict,
+        components: list[str] | None,
+    ) -> Any:
+        """Load a container result, reading only the items of the components."""
+        selected = select_items(entry, components) if components is not None else None
+
+        def read_item(path: ItemPath, item: dict) -> Any:
+            metadata = cls._serializer_metadata(item)
+            return cls._read_result(
+                archive, cls._item_path(key, path, metadata.format), metadata
+            )
+
+        with Tracer.span(key, "deserialize", container=True):
+            return assemble_container(entry, read_item, selected)
+
+    @classmethod
+    def _load_stream(
+        cls,
+        backend: type[ArchiveBackend],
+        filepath: str,
+        key: str,
+        entry: dict,
+        options: ReadOptions = _READ_ALL,
+    ) -> ChunkStream:
+        """Load a streamed result lazily, reading one chunk at a time.
+
+        The projection applies to every chunk as it is read.
+        """
+        chunks = entry["chunks"]
+
+        def read_chunks():
+            with backend(filepath, "r") as archive:
+                for index, chunk_meta in enumerate(chunks):
+                    metadata = cls._serializer_metadata(chunk_meta)
+                    yield cls._read_result(
+                        archive,
+                        cls._chunk_path(key, index, metadata.format),
+                        metadata,
+                        options,
+                    )
+
+        return ChunkStream(read_chunks)
+
+    @staticmethod
+    def _serializer_metadata(result_meta: dict) -> SerializerMetadata:
+        """Build serializer metadata from a manifest entry."""
+        return SerializerMetadata(
+            format=result_meta["format"],
+            type_name=result_meta["type"],
+            module_name=result_meta["module"],
+            size_bytes=result_meta["size_bytes"],
+        )
+
+    @classmethod
+    def _read_result(
+        cls,
+        archive: ArchiveBackend,
+        path: str,
+        metadata: SerializerMetadata,
+        options: ReadOptions = _READ_ALL,
+    ) -> Any:
+        """Deserialize a single result member of the archive."""
+        try:
+            result_file = archive.open_member(path)
+        except KeyError as exc:
+            raise YaxMissingResultFileError(f"Missing result file: {path}") from exc
+
+        with result_file:
+            return cls._deserialize(result_file, metadata, options)
+
+    @staticmethod
+    def _deserialize(
+        data: IO[bytes],
+        metadata: SerializerMetadata,
+        options: ReadOptions = _READ_ALL,
+    ) -> Any:
+        """Deserialize a result, or a projection of it, with its serializer."""
+        for serializer in SerializerRegistry._serializers:
+            if metadata.format != serializer.FORMAT:
+                continue
+            if options.backed:
+                return serializer.deserialize_backed(data, metadata)
+            if options.components is not None:
+                return serializer.deserialize_components(
+                    data, metadata, options.components
+                )
+            if options.projected:
+                return serializer.deserialize_projection(
+                    data, metadata, options.columns, options.rows
+                )
+            return serializer.deserialize(data, metadata)
+
+        raise ValueError(f"Unknown serialization format: {metadata.format}")
+
+    @staticmethod
+    def _normalize_rows(rows: slice | tuple[int, int]) -> slice:
+        """Normalize a row range to a slice."""
+        if isinstance(rows, tuple):
+            rows = slice(*rows)
+        if not isinstance(rows, slice) or rows.step not in (None, 1):
+            raise ValueError(f"Rows must be a contiguous slice or range: {rows!r}")
+        return rows
+
+    @staticmethod
+    def _normalize_input(options: list[str] | str | None) -> list[str] | None:
+        """Normalize input to a list."""
+        if isinstance(options, str):
+            return [options]
+        return options
@@ -0,0 +1,23 @@
+from ._base import ArchiveBackend, BackendRegistry
+from ._directory import DirectoryBackend
+from ._sqlite import SqliteBackend
+from ._tar import TarBackend
+from ._zip import ZipBackend
+
+__all__ = [
+    "ArchiveBackend",
+    "BackendRegistry",
+    "DirectoryBackend",
+    "SqliteBackend",
+    "TarBackend",
+    "ZipBackend",
+]
+
+# Register the backends
+#
+# The tar backend is registered first, so it is used for paths without the
+# extension of any backend.
+BackendRegistry.register(TarBackend)
+BackendRegistry.register(ZipBackend)
+BackendRegistry.register(DirectoryBackend)
+BackendRegistry.register(SqliteBackend)
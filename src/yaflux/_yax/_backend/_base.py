@@ -0,0 +1,167 @@
+import os
+from abc import ABC, abstractmethod
+from io import BytesIO
+from typing import IO, ClassVar, Literal
+
+BackendMode = Literal["r", "w", "a"]
+
+
+class ArchiveBackend(ABC):
+    """Storage of the named members of a yaflux archive.
+
+    Members are addressed by slash separated paths relative to the root of the
+    archive (e.g. `results/matrix.npy`).
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the archive.
+    mode : {"r", "w", "a"}
+        Read an archive, write a new archive (replacing any existing one), or
+        update an existing archive in place. Updates are only supported by
+        backends with `SUPPORTS_UPDATE`.
+    compress : bool
+        Whether to compress the members of a new archive. Backends storing
+        members uncompressed leave their compression to the serializers.
+    """
+
+    # Extensions identifying archives of this backend, the first one is the default
+    EXTENSIONS: ClassVar[tuple[str, ...]]
+
+    # Whether members can be written from several threads at once
+    CONCURRENT_WRITES: ClassVar[bool] = False
+
+    # Whether existing archives can be updated in place with mode "a"
+    SUPPORTS_UPDATE: ClassVar[bool] = False
+
+    # Whether compressed archives compress their members, otherwise members of
+    # formats supporting it are compressed by their serializer
+    COMPRESSES_MEMBERS: ClassVar[bool] = True
+
+    def __init__(self, filepath: str, mode: BackendMode = "r", compress: bool = False):
+        if mode == "a" and not self.SUPPORTS_UPDATE:
+            raise ValueError(f"{type(self).__name__} cannot update archives")
+        self.filepath = filepath
+        self.mode = mode
+        self.compress = compress
+
+    @property
+    def compress_members(self) -> bool:
+        """Whether serializers compress the members written to the archive."""
+        return self.compress and not self.COMPRESSES_MEMBERS
+
+    def __enter__(self) -> "ArchiveBackend":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if exc_type is None and self.mode != "r":
+                self.finalize()
+        finally:
+            self.close()
+
+    @classmethod
+    def matches(cls, filepath: str) -> bool:
+        """Check if a path has one of the extensions of this backend."""
+        return filepath.rstrip(os.sep).endswith(cls.EXTENSIONS)
+
+    @classmethod
+    def resolve_filepath(cls, filepath: str, compress: bool) -> str:
+        """Resolve the path an archive is written to."""
+        filepath = filepath.rstrip(os.sep)
+        if not cls.matches(filepath):
+            filepath += cls.EXTENSIONS[0]
+        return filepath
+
+    @classmethod
+    @abstractmethod
+    def is_archive(cls, filepath: str) -> bool:
+        """Check if a path is an archive of this backend."""
+
+    @abstractmethod
+    def list_members(self) -> list[str]:
+        """List the paths of all members of the archive."""
+
+    @abstractmethod
+    def read_member(self, name: str, offset: int = 0, size: int | None = None) -> bytes:
+        """Read a byte range of a member.
+
+        Parameters
+        ----------
+        name : str
+            Path of the member.
+        offset : int
+            Position of the first byte to read.
+        size : int | None
+            Number of bytes to read, or None to read to the end of the member.
+
+        Raises
+        ------
+        KeyError
+            If the member does not exist.
+        """
+
+    def open_member(self, name: str) -> IO[bytes]:
+        """Open a member as a readable binary file object.
+
+        Raises
+        ------
+        KeyError
+            If the member does not exist.
+        """
+        return BytesIO(self.read_member(name))
+
+    @abstractmethod
+    def write_member(self, name: str, data: bytes | str) -> None:
+        """Write a member.
+
+        Parameters
+        ----------
+        name : str
+            Path of the member.
+        data : bytes | str
+            Content of the member, or the path of a temporary file holding it.
+            Temporary files are consumed (moved or deleted) by the backend.
+        """
+
+    def remove_member(self, name: str) -> None:
+        """Remove a member from an archive opened for update."""
+        raise NotImplementedError(f"{type(self).__name__} cannot remove members")
+
+    def finalize(self) -> None:  # noqa: B027
+        """Complete an archive after all members were written."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release the resources of the archive."""
+
+
+class BackendRegistry:
+    """Registry of available archive backends."""
+
+    _backends: ClassVar[list[type[ArchiveBackend]]] = []
+
+    @classmethod
+    def register(cls, backend: type[ArchiveBackend]) -> None:
+        """Register a backend, taking precedence over those registered before."""
+        cls._backends.insert(0, backend)
+
+    @classmethod
+    def for_path(cls, filepath: str) -> type[ArchiveBackend]:
+        """Get the backend writing archives at a path.
+
+        Paths without the extension of any backend use the first registered
+        backend (the tar backend).
+        """
+        for backend in cls._backends:
+            if backend.matches(filepath):
+                return backend
+        return cls._backends[-1]
+
+    @classmethod
+    def for_archive(cls, filepath: str) -> type[ArchiveBackend] | None:
+        """Get the backend of an existing archive, or None if it is not one."""
+        for backend in cls._backends:
+            if backend.matches(filepath) and backend.is_archive(filepath):
+                return backend
+        return None
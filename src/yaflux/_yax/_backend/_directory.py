@@ -0,0 +1,84 @@
+import os
+import shutil
+from typing import IO
+
+from ._base import ArchiveBackend, BackendMode
+
+
+class DirectoryBackend(ArchiveBackend):
+    """Archive stored as an unpacked directory with one file per member.
+
+    Members are written concurrently, replaced atomically, and can be used in
+    place by other tools (e.g. `np.load(path, mmap_mode="r")`). Writing a new
+    archive over an existing directory first removes the directory.
+    """
+
+    EXTENSIONS = (".yaxd",)
+    CONCURRENT_WRITES = True
+    SUPPORTS_UPDATE = True
+    COMPRESSES_MEMBERS = False
+
+    def __init__(self, filepath: str, mode: BackendMode = "r", compress: bool = False):
+        super().__init__(filepath, mode, compress)
+        if mode == "w" and os.path.isdir(filepath):
+            shutil.rmtree(filepath)
+        if mode != "r":
+            os.makedirs(filepath, exist_ok=True)
+
+    @classmethod
+    def is_archive(cls, filepath: str) -> bool:
+        """Check if a path is a directory holding archive metadata."""
+        return os.path.isfile(os.path.join(filepath, "metadata.pkl"))
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.filepath, *name.split("/"))
+
+    def list_members(self) -> list[str]:
+        """List the paths of all files in the directory."""
+        members = []
+        for root, _, files in os.walk(self.filepath):
+            relative = os.path.relpath(root, self.filepath)
+            prefix = (
+                "" if relative == os.curdir else relative.replace(os.sep, "/") + "/"
+            )
+            members.extend(prefix + name for name in files)
+        return members
+
+    def read_member(self, name: str, offset: int = 0, size: int | None = None) -> bytes:
+        """Read a byte range of a file."""
+        with self.open_member(name) as member:
+            member.seek(offset)
+            return member.read() if size is None else member.read(size)
+
+    def open_member(self, name: str) -> IO[bytes]:
+        """Open a file of the directory."""
+        try:
+            return open(self._path(name), "rb")
+        except FileNotFoundError as exc:
+            raise KeyError(name) from exc
+
+    def write_member(self, name: str, data: bytes | str) -> None:
+        """Write a file, atomically replacing any existing one."""
+        target = self._path(name)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+
+        tmp_path = f"{target}.tmp"
+        if isinstance(data, str):
+            shutil.move(data, tmp_path)
+        else:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+        os.replace(tmp_path, target)
+
+    def remove_member(self, name: str) -> None:
+        """Remove a file and any directories left empty."""
+        path = self._path(name)
+        os.unlink(path)
+
+        parent = os.path.dirname(path)
+        while parent != self.filepath and not os.listdir(parent):
+            os.rmdir(parent)
+            parent = os.path.dirname(parent)
+
+    def close(self) -> None:
+        """Nothing to release for directories."""
@@ -0,0 +1,94 @@
+import os
+import sqlite3
+import threading
+
+from ._base import ArchiveBackend, BackendMode
+
+_SQLITE_HEADER = b"SQLite format 3\x00"
+
+
+class SqliteBackend(ArchiveBackend):
+    """Archive stored as blobs in a single SQLite database file.
+
+    Members are indexed by name, so reading one member does not scan the
+    archive. Efficient for archives of many small results. Members are
+    written in a single transaction committed when the archive is finalized.
+    """
+
+    EXTENSIONS = (".yax.sqlite",)
+    SUPPORTS_UPDATE = True
+    COMPRESSES_MEMBERS = False
+
+    def __init__(self, filepath: str, mode: BackendMode = "r", compress: bool = False):
+        super().__init__(filepath, mode, compress)
+        if mode == "w" and os.path.exists(filepath):
+            os.unlink(filepath)
+
+        # Writes are serialized by the archive serializer but may come from
+        # any of its threads
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(filepath, check_same_thread=False)
+        if mode != "r":
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS members (name TEXT PRIMARY KEY, data BLOB)"
+            )
+
+    @classmethod
+    def is_archive(cls, filepath: str) -> bool:
+        """Check if a path is an SQLite database."""
+        if not os.path.isfile(filepath):
+            return False
+        with open(filepath, "rb") as f:
+            return f.read(len(_SQLITE_HEADER)) == _SQLITE_HEADER
+
+    def list_members(self) -> list[str]:
+        """List the names of all members in the database."""
+        with self._lock:
+            rows = self._db.execute("SELECT name FROM members ORDER BY name")
+            return [name for (name,) in rows]
+
+    def read_member(self, name: str, offset: int = 0, size: int | None = None) -> bytes:
+        """Read a byte range of a member without loading the rest of the blob."""
+        with self._lock:
+            if size is None:
+                row = self._db.execute(
+                    "SELECT substr(data, ?) FROM members WHERE name = ?",
+                    (offset + 1, name),
+                ).fetchone()
+            else:
+                row = self._db.execute(
+                    "SELECT substr(data, ?, ?) FROM members WHERE name = ?",
+                    (offset + 1, size, name),
+                ).fetchone()
+        if row is None:
+            raise KeyError(name)
+        return bytes(row[0]) if row[0] is not None else b""
+
+    def write_member(self, name: str, data: bytes | str) -> None:
+        """Insert or replace a member."""
+        if isinstance(data, str):
+            with open(data, "rb") as f:
+                content = f.read()
+            os.unlink(data)
+        else:
+            content = data
+
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO members (name, data) VALUES (?, ?)",
+                (name, sqlite3.Binary(content)),
+            )
+
+    def remove_member(self, name: str) -> None:
+        """Delete a member."""
+        with self._lock:
+            self._db.execute("DELETE FROM members WHERE name = ?", (name,))
+
+    def finalize(self) -> None:
+        """Commit the written members."""
+        with self._lock:
+            self._db.commit()
+
+    def close(self) -> None:
+        """Close the database, discarding uncommitted members."""
+        self._db.close()
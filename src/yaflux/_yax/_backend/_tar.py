@@ -0,0 +1,72 @@
+import os
+import tarfile
+from io import BytesIO
+from typing import IO
+
+from ._base import ArchiveBackend, BackendMode
+
+
+class TarBackend(ArchiveBackend):
+    """Archive stored as a (optionally gzip compressed) tar file.
+
+    Tar files are written as a single sequential stream. Reading a member
+    requires scanning the headers preceding it, and compressed archives must
+    be decompressed up to the member.
+    """
+
+    EXTENSIONS = (".yax", ".yax.gz")
+    COMPRESSED_EXTENSION = ".yax.gz"
+
+    def __init__(self, filepath: str, mode: BackendMode = "r", compress: bool = False):
+        super().__init__(filepath, mode, compress)
+        compressed = compress or filepath.endswith(".gz")
+        mode_flag = "w" if mode == "w" else "r"
+        self._tar = tarfile.open(  # noqa: SIM115
+            filepath, f"{mode_flag}:gz" if compressed else mode_flag
+        )
+
+    @classmethod
+    def resolve_filepath(cls, filepath: str, compress: bool) -> str:
+        """Resolve the path of the archive, using `.yax.gz` for compressed archives."""
+        if filepath.endswith(cls.COMPRESSED_EXTENSION):
+            return filepath
+        if filepath.endswith(".yax"):
+            return filepath + ".gz" if compress else filepath
+        return filepath + (cls.COMPRESSED_EXTENSION if compress else ".yax")
+
+    @classmethod
+    def is_archive(cls, filepath: str) -> bool:
+        """Check if a path is a tar file."""
+        return os.path.isfile(filepath) and tarfile.is_tarfile(filepath)
+
+    def list_members(self) -> list[str]:
+        """List the paths of all files in the tar file."""
+        return [member.name for member in self._tar.getmembers() if member.isfile()]
+
+    def read_member(self, name: str, offset: int = 0, size: int | None = None) -> bytes:
+        """Read a byte range of a file in the tar file."""
+        with self.open_member(name) as member:
+            member.seek(offset)
+            return member.read() if size is None else member.read(size)
+
+    def open_member(self, name: str) -> IO[bytes]:
+        """Open a file in the tar file without extracting it."""
+        member = self._tar.extractfile(name)
+        if member is None:
+            raise KeyError(f"Not a file: {name}")
+        return member
+
+    def write_member(self, name: str, data: bytes | str) -> None:
+        """Append a member to the tar file."""
+        if isinstance(data, str):
+            self._tar.add(data, arcname=name)
+            os.unlink(data)
+            return
+
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        self._tar.addfile(info, BytesIO(data))
+
+    def close(self) -> None:
+        """Close the tar file."""
+        self._tar.close()
@@ -0,0 +1,56 @@
+import os
+import zipfile
+from typing import IO
+
+from ._base import ArchiveBackend, BackendMode
+
+
+class ZipBackend(ArchiveBackend):
+    """Archive stored as a zip file.
+
+    The central directory at the end of a zip file indexes every member, so
+    single members are read without scanning the archive. Members are stored
+    uncompressed unless `compress` is set.
+    """
+
+    EXTENSIONS = (".yax.zip",)
+
+    def __init__(self, filepath: str, mode: BackendMode = "r", compress: bool = False):
+        super().__init__(filepath, mode, compress)
+        self._zip = zipfile.ZipFile(
+            filepath,
+            "w" if mode == "w" else "r",
+            compression=zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED,
+            allowZip64=True,
+        )
+
+    @classmethod
+    def is_archive(cls, filepath: str) -> bool:
+        """Check if a path is a zip file."""
+        return os.path.isfile(filepath) and zipfile.is_zipfile(filepath)
+
+    def list_members(self) -> list[str]:
+        """List the paths of all members of the zip file."""
+        return self._zip.namelist()
+
+    def read_member(self, name: str, offset: int = 0, size: int | None = None) -> bytes:
+        """Read a byte range of a member of the zip file."""
+        with self.open_member(name) as member:
+            member.seek(offset)
+            return member.read() if size is None else member.read(size)
+
+    def open_member(self, name: str) -> IO[bytes]:
+        """Open a member of the zip file."""
+        return self._zip.open(name)
+
+    def write_member(self, name: str, data: bytes | str) -> None:
+        """Add a member to the zip file."""
+        if isinstance(data, str):
+            self._zip.write(data, arcname=name)
+            os.unlink(data)
+        else:
+            self._zip.writestr(name, data)
+
+    def close(self) -> None:
+        """Close the zip file, writing its central directory."""
+        self._zip.close()
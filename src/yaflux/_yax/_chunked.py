@@ -0,0 +1,165 @@
+import itertools
+import operator
+from collections.abc import Callable, Iterator
+from typing import Any
+
+# Chunk shapes requested per dimension, None spanning the whole dimension
+ChunkSpec = int | tuple[int | None, ...]
+
+
+def resolve_chunk_shape(shape: tuple[int, ...], chunks: ChunkSpec) -> tuple[int, ...]:
+    """Resolve a requested chunk shape against the shape of an array.
+
+    Parameters
+    ----------
+    shape : tuple[int, ...]
+        Shape of the array.
+    chunks : int | tuple[int | None, ...]
+        Chunk size along each dimension, where None spans the whole dimension.
+        A single integer chunks the first dimension only.
+
+    Returns
+    -------
+    tuple[int, ...]
+        Chunk size along each dimension.
+    """
+    if not shape:
+        raise ValueError("Cannot chunk a zero-dimensional array")
+    if isinstance(chunks, int):
+        chunks = (chunks,) + (None,) * (len(shape) - 1)
+    if len(chunks) != len(shape):
+        raise ValueError(
+            f"Chunk shape {chunks} does not match array dimensions {len(shape)}"
+        )
+
+    resolved = []
+    for size, chunk in zip(shape, chunks, strict=True):
+        if chunk is None:
+            chunk = max(size, 1)
+        if chunk < 1:
+            raise ValueError(f"Chunk sizes must be positive: {chunks}")
+        resolved.append(chunk)
+    return tuple(resolved)
+
+
+def chunk_grid(shape: tuple[int, ...], chunk_shape: tuple[int, ...]) -> tuple[int, ...]:
+    """Count the chunks along each dimension."""
+    return tuple(
+        -(-size // chunk) for size, chunk in zip(shape, chunk_shape, strict=True)
+    )
+
+
+def iter_chunks(
+    array: Any, chunk_shape: tuple[int, ...]
+) -> Iterator[tuple[tuple[int, ...], Any]]:
+    """Iterate over the chunks of an array in C order of the chunk grid."""
+    grid = chunk_grid(array.shape, chunk_shape)
+    for index in itertools.product(*(range(n) for n in grid)):
+        region = tuple(
+            slice(i * chunk, (i + 1) * chunk)
+            for i, chunk in zip(index, chunk_shape, strict=True)
+        )
+        yield index, array[region]
+
+
+def _normalize_selection(selection: Any, shape: tuple[int, ...]) -> list[Any]:
+    """Expand a basic index to one integer or slice per dimension."""
+    if not isinstance(selection, tuple):
+        selection = (selection,)
+
+    if any(item is Ellipsis for item in selection):
+        position = next(i for i, item in enumerate(selection) if item is Ellipsis)
+        fill = (slice(None),) * (len(shape) - len(selection) + 1)
+        selection = selection[:position] + fill + selection[position + 1 :]
+    selection = selection + (slice(None),) * (len(shape) - len(selection))
+
+    if len(selection) != len(shape):
+        raise IndexError(
+            f"Too many indices for array: array is {len(shape)}-dimensional, "
+            f"but {len(selection)} were indexed"
+        )
+    normalized = []
+    for item in selection:
+        if isinstance(item, slice):
+            normalized.append(item)
+            continue
+        try:
+            if isinstance(item, bool):
+                raise TypeError
+            normalized.append(operator.index(item))
+        except TypeError as exc:
+            raise IndexError(
+                "Only integers, slices and ellipsis are supported when reading "
+                f"chunked arrays, got {type(item).__name__}"
+            ) from exc
+    return normalized
+
+
+def read_region(
+    read_chunk: Callable[[tuple[int, ...]], Any],
+    shape: tuple[int, ...],
+    dtype: Any,
+    chunk_shape: tuple[int, ...],
+    selection: Any,
+) -> Any:
+    """Read a basic selection of a chunked array, reading only the chunks it covers.
+
+    Parameters
+    ----------
+    read_chunk : Callable[[tuple[int, ...]], ndarray]
+        Reads the chunk at an index of the chunk grid.
+    shape : tuple[int, ...]
+        Shape of the array.
+    dtype : numpy.dtype
+        Data type of the array.
+    chunk_shape : tuple[int, ...]
+        Chunk size along each dimension.
+    selection : Any
+        Integers, slices and ellipsis indexing the array, as in `array[selection]`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The selected values, as if the whole array had been indexed.
+    """
+    import numpy as np
+
+    # Bounding box of the selection and the selection relative to it
+    bounds, relative = [], []
+    for item, size in zip(_normalize_selection(selection, shape), shape, strict=True):
+        if isinstance(item, int):
+            position = item + size if item < 0 else item
+            if not 0 <= position < size:
+                raise IndexError(f"Index {item} is out of bounds for size {size}")
+            bounds.append((position, position + 1))
+            relative.append(0)
+            continue
+
+        selected = range(*item.indices(size))
+        if len(selected) == 0:
+            bounds.append((0, 0))
+            relative.append(slice(0, 0))
+            continue
+        low, high = min(selected), max(selected) + 1
+        stop = selected.stop - low
+        bounds.append((low, high))
+        relative.append(
+            slice(selected.start - low, stop if stop >= 0 else None, selected.step)
+        )
+
+    region = np.empty(tuple(high - low for low, high in bounds), dtype=dtype)
+    if region.size:
+        chunk_ranges = [
+            range(low // chunk, (high - 1) // chunk + 1)
+            for (low, high), chunk in zip(bounds, chunk_shape, strict=True)
+        ]
+        for index in itertools.product(*chunk_ranges):
+            chunk = read_chunk(index)
+            source, target = [], []
+            for i, (low, high), size in zip(index, bounds, chunk_shape, strict=True):
+                start, stop = max(low, i * size), min(high, (i + 1) * size)
+                source.append(slice(start - i * size, stop - i * size))
+                target.append(slice(start - low, stop - low))
+            region[tuple(target)] = chunk[tuple(source)]
+
+    return region[tuple(relative)]
@@ -0,0 +1,233 @@
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from ._serializer import PickleSerializer, SerializerRegistry
+
+# Format of the manifest entries of containers stored as separate items
+CONTAINER_FORMAT = "container"
+
+# Types never handled by a dedicated serializer, skipped when walking containers
+_SCALAR_TYPES = frozenset((type(None), bool, int, float, complex, str, bytes))
+
+# Position of an item in a container, as the index of the item at each level
+ItemPath = tuple[int, ...]
+
+
+class _CycleError(Exception):
+    """Raised when a container contains itself."""
+
+
+def split_containers(value: Any) -> set[int]:
+    """Find the containers of a result to store as separately serialized items.
+
+    A dict with string keys, a list or a tuple is split if any of its items is
+    split or has a dedicated (non-pickle) serializer. Other containers are
+    serialized whole, as a single item (e.g. a large list of integers by the
+    column serializer).
+
+    Parameters
+    ----------
+    value : Any
+        The result to store.
+
+    Returns
+    -------
+    set[int]
+        Ids of the containers to split, empty if the result is not split
+        (including results containing themselves).
+    """
+    split: set[int] = set()
+    if _children(value) is None:
+        return split
+    try:
+        _find_containers(value, split, set())
+    except (_CycleError, RecursionError):
+        return set()
+    return split
+
+
+def iter_items(
+    value: Any, split: set[int], path: ItemPath = ()
+) -> Iterator[tuple[ItemPath, Any]]:
+    """Iterate over the items of a split container to serialize separately."""
+    for index, child in enumerate(_children(value) or []):
+        if id(child) in split:
+            yield from iter_items(child, split, (*path, index))
+        else:
+            yield (*path, index), child
+
+
+def container_entry(
+    value: Any,
+    split: set[int],
+    item_entry: Callable[[ItemPath], dict],
+    path: ItemPath = (),
+) -> dict:
+    """Describe the structure of a split container in the manifest.
+
+    Parameters
+    ----------
+    value : Any
+        The split container.
+    split : set[int]
+        Ids of the containers to split, from `split_containers`.
+    item_entry : Callable[[ItemPath], dict]
+        Manifest entry of the separately serialized item at a path.
+    path : ItemPath
+        Path of the container in the result.
+
+    Returns
+    -------
+    dict
+        Manifest entry of the container, nesting the entries of its items.
+    """
+    items = [
+        container_entry(child, split, item_entry, (*path, index))
+        if id(child) in split
+        else item_entry((*path, index))
+        for index, child in enumerate(_children(value) or [])
+    ]
+    entry: dict[str, Any] = {
+        "type": type(value).__name__,
+        "module": type(value).__module__,
+        "format": CONTAINER_FORMAT,
+        "size_bytes": sum(item["size_bytes"] for item in items),
+    }
+    if isinstance(value, dict):
+        entry["keys"] = list(value)
+    entry["items"] = items
+    return entry
+
+
+def iter_entry_items(
+    entry: dict, path: ItemPath = ()
+) -> Iterator[tuple[ItemPath, dict]]:
+    """Iterate over the manifest entries of the items of a container."""
+    for index, item in enumerate(entry["items"]):
+        if item["format"] == CONTAINER_FORMAT:
+            yield from iter_entry_items(item, (*path, index))
+        else:
+            yield (*path, index), item
+
+
+def select_items(entry: dict, components: list[str]) -> set[ItemPath]:
+    """Resolve components of a container to the paths of its items.
+
+    Components are `/` separated keys of dicts and indices of lists and tuples,
+    e.g. `samples/a` or `folds/0`.
+    """
+    selected = set()
+    for component in components:
+        node: dict | None = entry
+        path: ItemPath = ()
+        for part in component.split("/"):
+            index = _item_index(node, part)
+            if node is None or index is None:
+                raise ValueError(f"Item not found in container result: {component}")
+            path = (*path, index)
+            item = node["items"][index]
+            node = item if item["format"] == CONTAINER_FORMAT else None
+        selected.add(path)
+    return selected
+
+
+def assemble_container(
+    entry: dict,
+    read_item: Callable[[ItemPath, dict], Any],
+    selected: set[ItemPath] | None = None,
+    path: ItemPath = (),
+) -> Any:
+    """Rebuild a container from its separately serialized items.
+
+    Parameters
+    ----------
+    entry : dict
+        Manifest entry of the container.
+    read_item : Callable[[ItemPath, dict], Any]
+        Reads the item at a path, described by its manifest entry.
+    selected : set[ItemPath] | None
+        Paths of the items to read (along with the items they contain), by
+        default all items. Containers only hold the selected items.
+    path : ItemPath
+        Path of the container in the result.
+
+    Returns
+    -------
+    Any
+        The dict, list or tuple holding the items read.
+    """
+    indices = []
+    values = []
+    for index, item in enumerate(entry["items"]):
+        item_path = (*path, index)
+        item_selected = selected
+        if selected is not None:
+            if any(item_path[: len(s)] == s for s in selected):
+                item_selected = None
+            elif not any(s[: len(item_path)] == item_path for s in selected):
+                continue
+
+        if item["format"] == CONTAINER_FORMAT:
+            value = assemble_container(item, read_item, item_selected, item_path)
+        else:
+            value = read_item(item_path, item)
+        indices.append(index)
+        values.append(value)
+
+    if "keys" in entry:
+        return {
+            entry["keys"][index]: value
+            for index, value in zip(indices, values, strict=True)
+        }
+    return tuple(values) if entry["type"] == "tuple" else values
+
+
+def _children(value: Any) -> Any:
+    """Items of a container that can be split, in order, or None."""
+    if type(value) is dict:
+        if not all(type(key) is str for key in value):
+            return None
+        return value.values()
+    if type(value) in (list, tuple):
+        return value
+    return None
+
+
+def _find_containers(value: Any, split: set[int], active: set[int]) -> None:
+    """Collect the containers to split among a container and those it contains."""
+    if id(value) in active:
+        raise _CycleError
+    active.add(id(value))
+    found = False
+    # Containers of scalars (e.g. long lists of numbers) are not walked
+    if not _SCALAR_TYPES.issuperset(map(type, _children(value))):
+        for child in _children(value):
+            # Every child is visited to find the containers nested in it
+            found = _stored_apart(child, split, active) or found
+    active.discard(id(value))
+
+    if found:
+        split.add(id(value))
+
+
+def _stored_apart(value: Any, split: set[int], active: set[int]) -> bool:
+    """Whether an item is split or stored by a dedicated serializer."""
+    if type(value) in _SCALAR_TYPES:
+        return False
+    if _children(value) is not None:
+        _find_containers(value, split, active)
+        if id(value) in split:
+            return True
+    # Containers of primitives may be stored whole by a dedicated serializer
+    return SerializerRegistry.get_serializer(value) is not PickleSerializer
+
+
+def _item_index(node: dict | None, part: str) -> int | None:
+    """Index of the item of a container named by a component, or None."""
+    if node is None:
+        return None
+    if "keys" in node:
+        return node["keys"].index(part) if part in node["keys"] else None
+    if part.isdigit() and int(part) < len(node["items"]):
+        return int(part)
+    return None
@@ -1,41 +1,45 @@
-import importlib.util
-
 from ._base import SerializerMetadata, SerializerRegistry
 from ._formats import (
     AnnDataSerializer,
+    ArrowIPCSerializer,
+    ArrowTableSerializer,
+    ColumnSerializer,
     NumpySerializer,
     PandasSerializer,
+    PandasSeriesSerializer,
     PickleSerializer,
+    PolarsSerializer,
+    SparseSerializer,
 )
 
 __all__ = [
     "AnnDataSerializer",
+    "ArrowIPCSerializer",
+    "ArrowTableSerializer",
+    "ColumnSerializer",
     "NumpySerializer",
     "PandasSerializer",
+    "PandasSeriesSerializer",
     "PickleSerializer",
+    "PolarsSerializer",
     "SerializerMetadata",
     "SerializerRegistry",
+    "SparseSerializer",
 ]
 
 # Register the serializers
-try:
-    importlib.util.find_spec("anndata")
-    SerializerRegistry.register(AnnDataSerializer)
-except ImportError:
-    pass  # Anndata is not installed
-
-try:
-    importlib.util.find_spec("numpy")
-    SerializerRegistry.register(NumpySerializer)
-except ImportError:
-    pass  # Numpy is not installed
-
-try:
-    importlib.util.find_spec("pandas")
-    importlib.util.find_spec("pyarrow")
-    SerializerRegistry.register(PandasSerializer)
-except ImportError:
-    pass
+#
+# Optional packages are never imported here: each serializer only recognizes
+# objects from packages that were already imported, and imports its package
+# when it is first used to write or read a result.
+SerializerRegistry.register(AnnDataSerializer)
+SerializerRegistry.register(NumpySerializer)
+SerializerRegistry.register(PandasSerializer)
+SerializerRegistry.register(PandasSeriesSerializer)
+SerializerRegistry.register(ArrowTableSerializer)
+SerializerRegistry.register(PolarsSerializer)
+SerializerRegistry.register(SparseSerializer)
+SerializerRegistry.register(ColumnSerializer)
 
 # Always register the pickle serializer last as a fallback
 SerializerRegistry.register(PickleSerializer)
@@ -1,3 +1,4 @@
+import io
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import IO, Any, ClassVar, TypeVar
@@ -32,12 +33,86 @@ class Serializer(ABC):
         """Serialize object to bytes with metadata."""
         pass
 
+    @classmethod
+    def serialize_compressed(cls, data: Any) -> tuple[bytes | str, SerializerMetadata]:
+        """Serialize object to bytes, compressed if the format supports it.
+
+        Serializers of formats storing compressed parts override this. Others
+        serialize the object as it is.
+        """
+        return cls.serialize(data)
+
     @classmethod
     @abstractmethod
     def deserialize(cls, data: IO[bytes], metadata: SerializerMetadata) -> Any:
         """Deserialize object from bytes using metadata."""
         pass
 
+    @classmethod
+    def deserialize_projection(
+        cls,
+        data: IO[bytes],
+        metadata: SerializerMetadata,
+        columns: list[str] | None = None,
+        rows: slice | None = None,
+    ) -> Any:
+        """Deserialize only some columns and rows of a tabular object.
+
+        Serializers of tabular formats override this to avoid reading the parts
+        of the object that were not requested.
+
+        Parameters
+        ----------
+        data : IO[bytes]
+            Seekable file object of the serialized object.
+        metadata : SerializerMetadata
+            Metadata of the serialized object.
+        columns : list[str] | None
+            Names of the columns to read, by default all columns.
+        rows : slice | None
+            Contiguous range of the rows to read, by default all rows.
+        """
+        raise ValueError(
+            f"Serialization format '{cls.FORMAT}' does not support "
+            "column or row projection"
+        )
+
+    @classmethod
+    def deserialize_backed(cls, data: IO[bytes], metadata: SerializerMetadata) -> Any:
+        """Open an object in backed mode, reading its data on demand.
+
+        Serializers of formats with random access override this to avoid
+        loading the object into memory.
+        """
+        raise ValueError(
+            f"Serialization format '{cls.FORMAT}' does not support backed mode"
+        )
+
+    @classmethod
+    def deserialize_components(
+        cls, data: IO[bytes], metadata: SerializerMetadata, components: list[str]
+    ) -> Any:
+        """Deserialize only some components of a composite object.
+
+        Serializers of formats storing the components of an object separately
+        override this to avoid reading the components that were not requested.
+        """
+        raise ValueError(
+            f"Serialization format '{cls.FORMAT}' does not support loading components"
+        )
+
+    @staticmethod
+    def _file_path(data: IO[bytes]) -> str | None:
+        """Get the path of a file object reading a file of the file system.
+
+        Members of archives storing results as files (e.g. `.yaxd` directories)
+        can be opened by path, e.g. to memory map them.
+        """
+        raw = getattr(data, "raw", data)
+        if isinstance(raw, io.FileIO) and isinstance(raw.name, str):
+            return raw.name
+        return None
+
 
 class SerializerRegistry:
     """Registry of available serializers."""
@@ -1,11 +1,20 @@
 from ._anndata import AnnDataSerializer
+from ._arrow import ArrowIPCSerializer, ArrowTableSerializer, PolarsSerializer
+from ._column import ColumnSerializer
 from ._numpy import NumpySerializer
-from ._pandas import PandasSerializer
+from ._pandas import PandasSerializer, PandasSeriesSerializer
 from ._pickle import PickleSerializer
+from ._sparse import SparseSerializer
 
 __all__ = [
     "AnnDataSerializer",
+    "ArrowIPCSerializer",
+    "ArrowTableSerializer",
+    "ColumnSerializer",
     "NumpySerializer",
     "PandasSerializer",
+    "PandasSeriesSerializer",
     "PickleSerializer",
+    "PolarsSerializer",
+    "SparseSerializer",
 ]
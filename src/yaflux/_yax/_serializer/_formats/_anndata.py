@@ -1,4 +1,5 @@
 import os
+import sys
 import tempfile
 from typing import IO, Any
 
@@ -15,15 +16,17 @@ class AnnDataSerializer(Serializer):
 
     FORMAT = "h5ad"
 
+    # Top-level components of an AnnData object which can be loaded separately
+    COMPONENTS = frozenset(
+        {"X", "obs", "var", "obsm", "varm", "obsp", "varp", "layers", "uns"}
+    )
+
     @classmethod
     def can_serialize(cls, obj: Any) -> bool:
         """Check if object is an AnnData instance."""
-        try:
-            import anndata as ad
-
-            return isinstance(obj, ad.AnnData)
-        except ImportError:
-            return False
+        # Instances can only exist if anndata was already imported
+        ad = sys.modules.get("anndata")
+        return ad is not None and isinstance(obj, ad.AnnData)
 
     @classmethod
     def serialize(cls, data: Any) -> tuple[str, SerializerMetadata]:
@@ -61,7 +64,12 @@ class AnnDataSerializer(Serializer):
 
     @classmethod
     def deserialize(cls, data: IO[bytes], metadata: SerializerMetadata) -> Any:
-        """Deserialize bytes back into an AnnData object."""
+        """Deserialize an AnnData object directly from the archive member.
+
+        h5ad is read with random access, which the file objects of archive
+        members support, so the member is never copied to a temporary file.
+        Members stored as files (e.g. in `.yaxd` archives) are read by path.
+        """
         try:
             import anndata as ad
         except ImportError as e:
@@ -70,20 +78,120 @@ class AnnDataSerializer(Serializer):
                 "Install with: pip install yaflux[anndata]"
             ) from e
 
-        with tempfile.NamedTemporaryFile(suffix=".h5ad") as tmp:
-            try:
-                # Write to a tmp file
-                #
-                # h5ad reads with random access so buffers are inefficient
-                tmp.write(data.read())
-                tmp.flush()
+        try:
+            return ad.read_h5ad(cls._file_path(data) or data)
+        except Exception as e:
+            raise ValueError(f"Failed to deserialize AnnData: {e!s}") from e
 
-                # Read from the tmp file
-                return ad.read_h5ad(tmp.name)
+    @classmethod
+    def deserialize_backed(cls, data: IO[bytes], metadata: SerializerMetadata) -> Any:
+        """Open an AnnData object in read-only backed mode.
 
-            except Exception as e:
-                raise ValueError(f"Failed to deserialize AnnData: {e!s}") from e
+        The data matrix stays on disk and is read on demand, which requires the
+        member to be stored as a file (e.g. in `.yaxd` archives).
+        """
+        try:
+            import anndata as ad
+        except ImportError as e:
+            raise ImportError(
+                "anndata package is required for AnnData deserialization. "
+                "Install with: pip install yaflux[anndata]"
+            ) from e
 
-            finally:
-                # Close the tmp file
-                tmp.close()
+        path = cls._file_path(data)
+        if path is None:
+            raise ValueError(
+                "Backed AnnData requires an archive storing results as files, "
+                "such as a .yaxd directory archive"
+            )
+        return ad.read_h5ad(path, backed="r")
+
+    @classmethod
+    def deserialize_components(
+        cls, data: IO[bytes], metadata: SerializerMetadata, components: list[str]
+    ) -> Any:
+        """Deserialize only some components of an AnnData object.
+
+        Components are paths of the h5ad file such as "X", "obs",
+        "obs/cell_type", "obsm/X_umap" or "layers/counts". Only the requested
+        HDF5 groups are read, plus the observation and variable names, and the
+        returned AnnData holds nothing else.
+        """
+        try:
+            import anndata as ad
+            import h5py
+        except ImportError as e:
+            raise ImportError(
+                "anndata package is required for AnnData deserialization. "
+                "Install with: pip install yaflux[anndata]"
+            ) from e
+
+        for component in components:
+            top, _, key = component.partition("/")
+            if top not in cls.COMPONENTS or (key and top == "X"):
+                raise ValueError(
+                    f"Invalid AnnData component '{component}', expected one of "
+                    f"{sorted(cls.COMPONENTS)} optionally followed by '/<key>'"
+                )
+
+        with h5py.File(cls._file_path(data) or data, "r") as file:
+            missing = [component for component in components if component not in file]
+            if missing:
+                raise ValueError(f"Components not found in AnnData: {missing}")
+
+            fields: dict[str, Any] = {}
+            for top in ("obs", "var"):
+                columns = cls._requested_keys(components, top)
+                fields[top] = cls._read_dataframe(file[top], columns)
+            if "X" in components:
+                fields["X"] = cls._read_elem(file["X"])
+            for top in cls.COMPONENTS - {"X", "obs", "var"}:
+                keys = cls._requested_keys(components, top)
+                if keys == []:
+                    continue
+                group = file[top]
+                fields[top] = {
+                    name: cls._read_elem(group[name])
+                    for name in (group if keys is None else keys)
+                }
+
+        return ad.AnnData(**fields)
+
+    @staticmethod
+    def _read_elem(elem: Any) -> Any:
+        """Read an element of an h5ad file with the readers of anndata."""
+        import anndata as ad
+
+        # `anndata.io` only exists since anndata 0.11
+        io_module = getattr(ad, "io", None)
+        if io_module is not None and hasattr(io_module, "read_elem"):
+            return io_module.read_elem(elem)
+        return ad.experimental.read_elem(elem)
+
+    @staticmethod
+    def _requested_keys(components: list[str], top: str) -> list[str] | None:
+        """Get the keys requested of a component, or None for all of them."""
+        if top in components:
+            return None
+        return [
+            component.partition("/")[2]
+            for component in components
+            if component.startswith(f"{top}/")
+        ]
+
+    @classmethod
+    def _read_dataframe(cls, group: Any, columns: list[str] | None) -> Any:
+        """Read the index and the given columns of a dataframe group."""
+        import pandas as pd
+
+        if columns is None:
+            return cls._read_elem(group)
+
+        index_key = group.attrs["_index"]
+        index = pd.Index(cls._read_elem(group[index_key]))
+        if index_key != "_index":
+            index.name = index_key
+        return pd.DataFrame(
+            {column: cls._read_elem(group[column]) for column in columns},
+            index=index,
+        )
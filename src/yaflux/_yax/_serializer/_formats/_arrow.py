@@ -0,0 +1,281 @@
+import os
+import sys
+import tempfile
+from abc import abstractmethod
+from typing import IO, Any, ClassVar
+
+from .._base import Serializer, SerializerMetadata
+
+
+class ArrowIPCSerializer(Serializer):
+    """Base class of serializers storing objects as Arrow IPC files.
+
+    Subclasses convert their objects to and from Arrow tables. Tables are
+    written in record batches of a fixed number of rows, so a projection only
+    reads the buffers of the requested columns from the batches overlapping the
+    requested rows. Members stored as files (e.g. in `.yaxd` archives) are
+    memory mapped instead of read.
+    """
+
+    # Rows per record batch, the unit in which row ranges are read
+    BATCH_ROWS = 65_536
+
+    # Schema metadata keys recording the batch layout of the file
+    BATCH_ROWS_KEY = b"yaflux.batch_rows"
+    NUM_ROWS_KEY = b"yaflux.num_rows"
+
+    # Name of the serialized objects in error messages
+    DESCRIPTION: ClassVar[str] = "Arrow table"
+
+    # Optional dependencies required by the serializer
+    EXTRA: ClassVar[str] = "arrow"
+
+    @classmethod
+    @abstractmethod
+    def to_table(cls, data: Any) -> Any:
+        """Convert an object to an Arrow table."""
+        pass
+
+    @classmethod
+    @abstractmethod
+    def from_table(
+        cls, table: Any, metadata: SerializerMetadata, rows: tuple[int, int] | None
+    ) -> Any:
+        """Convert an Arrow table back to an object.
+
+        `rows` is the range of rows the table was read from, if not all rows.
+        """
+        pass
+
+    @classmethod
+    def serialize(cls, data: Any) -> tuple[str, SerializerMetadata]:
+        """Serialize an object to an Arrow IPC file."""
+        pa = cls._import_pyarrow("serialization")
+
+        # Write the table in fixed size batches, recording the layout so row
+        # ranges can be read batch by batch
+        table = cls.to_table(data).combine_chunks()
+        table = table.replace_schema_metadata(
+            {
+                **(table.schema.metadata or {}),
+                cls.BATCH_ROWS_KEY: str(cls.BATCH_ROWS).encode(),
+                cls.NUM_ROWS_KEY: str(table.num_rows).encode(),
+            }
+        )
+
+        # Create a temporary file that will persist until explicitly deleted,
+        # once the table is converted so a failed conversion leaves no file
+        tmp = tempfile.NamedTemporaryFile(suffix=f".{cls.FORMAT}", delete=False)  # noqa
+        tmp.close()
+        try:
+            with pa.OSFile(tmp.name, "wb") as sink:  # noqa
+                with pa.RecordBatchFileWriter(sink, table.schema) as writer:
+                    writer.write_table(table, max_chunksize=cls.BATCH_ROWS)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+
+        metadata = SerializerMetadata(
+            format=cls.FORMAT,
+            type_name=type(data).__name__,
+            module_name=type(data).__module__,
+            size_bytes=os.path.getsize(tmp.name),
+        )
+
+        return tmp.name, metadata
+
+    @classmethod
+    def deserialize(cls, data: IO[bytes], metadata: SerializerMetadata) -> Any:
+        """Deserialize an object from an Arrow IPC file."""
+        pa = cls._import_pyarrow("deserialization")
+
+        # Without random access the member is read at once, which Arrow then
+        # slices into the buffers of the table without copying
+        path = cls._file_path(data)
+        source = pa.memory_map(path) if path else pa.BufferReader(data.read())
+        try:
+            table = pa.ipc.open_file(source).read_all()
+            return cls.from_table(table, metadata, None)
+        except Exception as e:
+            raise ValueError(f"Failed to deserialize {cls.DESCRIPTION}: {e!s}") from e
+
+    @classmethod
+    def deserialize_projection(
+        cls,
+        data: IO[bytes],
+        metadata: SerializerMetadata,
+        columns: list[str] | None = None,
+        rows: slice | None = None,
+    ) -> Any:
+        """Deserialize only some columns and rows of a table.
+
+        Only the buffers of the requested columns are read, and only from the
+        record batches overlapping the requested rows. The pandas index of the
+        table, if any, is always read.
+        """
+        pa = cls._import_pyarrow("deserialization")
+
+        path = cls._file_path(data)
+        source = pa.memory_map(path) if path else data
+        schema = pa.ipc.open_file(source).schema
+        options = pa.ipc.IpcReadOptions(
+            included_fields=cls._field_indices(schema, columns)
+        )
+        try:
+            reader = pa.ipc.open_file(source, options=options)
+            if rows is None:
+                return cls.from_table(reader.read_all(), metadata, None)
+            table, row_range = cls._read_rows(reader, schema, rows)
+            return cls.from_table(table, metadata, row_range)
+        except Exception as e:
+            raise ValueError(f"Failed to deserialize {cls.DESCRIPTION}: {e!s}") from e
+
+    @classmethod
+    def _import_pyarrow(cls, action: str) -> Any:
+        """Import pyarrow, explaining which extra provides it if missing."""
+        try:
+            import pyarrow as pa
+            import pyarrow.ipc
+        except ImportError as e:
+            raise ImportError(
+                f"pyarrow is required for {cls.DESCRIPTION} {action}. "
+                f"Install with: pip install yaflux[{cls.EXTRA}]"
+            ) from e
+        return pa
+
+    @classmethod
+    def _field_indices(cls, schema: Any, columns: list[str] | None) -> list[int]:
+        """Find the fields storing the requested columns and the pandas index."""
+        if columns is None:
+            return list(range(len(schema)))
+
+        missing = [column for column in columns if str(column) not in schema.names]
+        if missing:
+            raise ValueError(f"Columns not found in {cls.DESCRIPTION}: {missing}")
+
+        index_columns = [
+            column
+            for column in (schema.pandas_metadata or {}).get("index_columns", [])
+            if isinstance(column, str)
+        ]
+        return [
+            schema.get_field_index(name)
+            for name in schema.names
+            if name in index_columns or name in {str(c) for c in columns}
+        ]
+
+    @classmethod
+    def _read_rows(
+        cls, reader: Any, schema: Any, rows: slice
+    ) -> tuple[Any, tuple[int, int]]:
+        """Read a range of rows, skipping the record batches outside of it."""
+        import pyarrow as pa
+
+        layout = schema.metadata or {}
+        if cls.BATCH_ROWS_KEY in layout:
+            batch_rows = int(layout[cls.BATCH_ROWS_KEY])
+            start, stop, _ = rows.indices(int(layout[cls.NUM_ROWS_KEY]))
+            first = start // batch_rows
+            last = min(-(-stop // batch_rows), reader.num_record_batches)
+            batches = [reader.get_batch(i) for i in range(first, last)]
+            table = pa.Table.from_batches(batches, schema=reader.schema)
+            offset = first * batch_rows
+        else:
+            # Archives written before the batch layout was recorded
+            table = reader.read_all()
+            start, stop, _ = rows.indices(table.num_rows)
+            offset = 0
+
+        table = table.slice(start - offset, max(stop - start, 0))
+        return table, (start, stop)
+
+
+class ArrowTableSerializer(ArrowIPCSerializer):
+    """Serializer for pyarrow Tables and RecordBatches.
+
+    This serializer is only active if pyarrow is installed.
+    Install optional dependency with:
+        pip install yaflux[arrow]
+    """
+
+    FORMAT = "arrow_table"
+    DESCRIPTION = "Arrow table"
+    EXTRA = "arrow"
+
+    @classmethod
+    def can_serialize(cls, obj: Any) -> bool:
+        """Check if object is a pyarrow Table or RecordBatch."""
+        # Instances can only exist if pyarrow was already imported
+        pa = sys.modules.get("pyarrow")
+        return pa is not None and isinstance(obj, pa.Table | pa.RecordBatch)
+
+    @classmethod
+    def to_table(cls, data: Any) -> Any:
+        """Wrap a RecordBatch in a Table, Tables are written as they are."""
+        import pyarrow as pa
+
+        if isinstance(data, pa.RecordBatch):
+            return pa.Table.from_batches([data])
+        return data
+
+    @classmethod
+    def from_table(
+        cls, table: Any, metadata: SerializerMetadata, rows: tuple[int, int] | None
+    ) -> Any:
+        """Strip the layout metadata, returning a RecordBatch if one was written."""
+        import pyarrow as pa
+
+        schema_metadata = {
+            key: value
+            for key, value in (table.schema.metadata or {}).items()
+            if key not in (cls.BATCH_ROWS_KEY, cls.NUM_ROWS_KEY)
+        }
+        table = table.replace_schema_metadata(schema_metadata or None)
+        if metadata.type_name == "RecordBatch":
+            batches = table.combine_chunks().to_batches()
+            if not batches:
+                return pa.RecordBatch.from_pylist([], schema=table.schema)
+            return batches[0]
+        return table
+
+
+class PolarsSerializer(ArrowIPCSerializer):
+    """Serializer for polars DataFrames using Apache Arrow.
+
+    DataFrames are converted to and from Arrow without copying their data.
+
+    This serializer is only active if polars and pyarrow are installed.
+    Install optional dependencies with:
+        pip install yaflux[polars]
+    """
+
+    FORMAT = "arrow_polars"
+    DESCRIPTION = "polars DataFrame"
+    EXTRA = "polars"
+
+    @classmethod
+    def can_serialize(cls, obj: Any) -> bool:
+        """Check if object is a polars DataFrame."""
+        # Instances can only exist if polars was already imported
+        pl = sys.modules.get("polars")
+        return pl is not None and isinstance(obj, pl.DataFrame)
+
+    @classmethod
+    def to_table(cls, data: Any) -> Any:
+        """Convert a polars DataFrame to an Arrow table."""
+        return data.to_arrow()
+
+    @classmethod
+    def from_table(
+        cls, table: Any, metadata: SerializerMetadata, rows: tuple[int, int] | None
+    ) -> Any:
+        """Convert an Arrow table to a polars DataFrame."""
+        try:
+            import polars as pl
+        except ImportError as e:
+            raise ImportError(
+                "polars is required for polars DataFrame deserialization. "
+                "Install with: pip install yaflux[polars]"
+            ) from e
+
+        return pl.from_arrow(table, rechunk=False)
@@ -0,0 +1,200 @@
+import array
+import itertools
+import json
+import struct
+import sys
+from typing import IO, Any
+
+from .._base import Serializer, SerializerMetadata
+
+# Array typecodes of the integer widths stored in columns with their ranges,
+# from narrowest to widest. Pickle stores wider integers in about as many bytes.
+_INT_RANGES = (("b", -(2**7), 2**7 - 1), ("h", -(2**15), 2**15 - 1))
+
+# Booleans are packed 8 to a byte, least significant bit first
+_UNPACKED_BITS = [
+    tuple(bool(byte >> bit & 1) for bit in range(8)) for byte in range(256)
+]
+_PACKED_BYTES = {bytes(bits): byte for byte, bits in enumerate(_UNPACKED_BITS)}
+
+
+def _narrowest_typecode(low: int, high: int) -> str | None:
+    """Typecode of the narrowest integer width holding a range, or None."""
+    for typecode, type_low, type_high in _INT_RANGES:
+        if type_low <= low and high <= type_high:
+            return typecode
+    return None
+
+
+class ColumnSerializer(Serializer):
+    """Serializer for large lists of booleans, small integers and strings.
+
+    A list whose items are all `bool`, `int` (fitting in 16 bits) or `str` is
+    stored as a single column: booleans packed in bits, integers in the
+    narrowest width holding them, strings joined together (or, for strings
+    repeating a few distinct values, as codes into those values). Only lists
+    stored in fewer bytes than pickled are claimed: smaller lists, floats,
+    wider integers and bytes are pickled.
+
+    This serializer only uses the standard library.
+    """
+
+    FORMAT = "column"
+
+    # Identifies the file format, followed by the length of the header
+    MAGIC = b"YAXCOL01"
+
+    # Minimum number of items of a list to store
+    MIN_LENGTH = 1024
+
+    # Separator of the strings of a column, used unless a string contains it
+    SEPARATOR = "\0"
+
+    # Number of strings sampled to decide whether to encode their distinct values
+    SAMPLE_SIZE = 4096
+
+    @classmethod
+    def can_serialize(cls, obj: Any) -> bool:
+        """Check if object is a large list of booleans, small integers or strings."""
+        return (
+            type(obj) is list
+            and len(obj) >= cls.MIN_LENGTH
+            and cls._kind(obj) is not None
+        )
+
+    @classmethod
+    def serialize(cls, data: Any) -> tuple[bytes, SerializerMetadata]:
+        """Serialize a list to a header and a buffer of its values."""
+        kind = cls._kind(data) if type(data) is list else None
+        if kind is None:
+            raise TypeError("Data must be a list of bool, small int or str")
+
+        header: dict[str, Any] = {
+            "kind": kind,
+            "type": type(data).__name__,
+            "length": len(data),
+            "byteorder": sys.byteorder,
+        }
+        if kind == "bool":
+            payload = cls._pack_bits(data)
+        elif kind == "str":
+            payload = cls._join(data, header)
+        else:
+            # The kind of integers is the typecode of their narrowest width
+            header["kind"] = "int"
+            header["typecode"] = kind
+            payload = array.array(kind, data).tobytes()
+
+        encoded = json.dumps(header).encode("utf-8")
+        result = cls.MAGIC + struct.pack("<Q", len(encoded)) + encoded + payload
+
+        metadata = SerializerMetadata(
+            format=cls.FORMAT,
+            type_name=type(data).__name__,
+            module_name=type(data).__module__,
+            size_bytes=len(result),
+        )
+        return result, metadata
+
+    @classmethod
+    def deserialize(cls, data: IO[bytes], metadata: SerializerMetadata) -> Any:
+        """Deserialize a list from its header and buffer."""
+        prefix = data.read(len(cls.MAGIC) + 8)
+        if prefix[: len(cls.MAGIC)] != cls.MAGIC:
+            raise ValueError("Failed to deserialize column: invalid header")
+        (length,) = struct.unpack("<Q", prefix[len(cls.MAGIC) :])
+        header = json.loads(data.read(length).decode("utf-8"))
+        payload = data.read()
+
+        kind = header["kind"]
+        if kind == "bool":
+            bits = itertools.chain.from_iterable(
+                map(_UNPACKED_BITS.__getitem__, payload)
+            )
+            return list(itertools.islice(bits, header["length"]))
+        if kind == "int":
+            values = array.array(header["typecode"], payload)
+            if header["byteorder"] != sys.byteorder:
+                values.byteswap()
+            return values.tolist()
+        return cls._split(payload, header)
+
+    @staticmethod
+    def _kind(values: list) -> str | None:
+        """Kind of the values of a list stored as a column, or None.
+
+        The kind of integers is the typecode of the narrowest width holding
+        them, found from their range so they are only converted once.
+        """
+        types = set(map(type, values))
+        if len(types) != 1:
+            return None
+        value_type = types.pop()
+        if value_type is bool:
+            return "bool"
+        if value_type is str:
+            return "str"
+        if value_type is int:
+            return _narrowest_typecode(min(values), max(values))
+        return None
+
+    @staticmethod
+    def _pack_bits(values: list[bool]) -> bytes:
+        """Pack booleans in bits, padding the last byte with zeros."""
+        unpacked = bytes(values) + bytes(-len(values) % 8)
+        return bytes(
+            _PACKED_BYTES[unpacked[i : i + 8]] for i in range(0, len(unpacked), 8)
+        )
+
+    @classmethod
+    def _join(cls, values: list[str], header: dict) -> bytes:
+        """Join strings into a buffer, recording how to split it.
+
+        Strings are joined with a separator unless one contains it. Otherwise
+        the offsets of the strings precede their content.
+        """
+        # Only strings repeating in a sample are worth hashing to find their
+        # distinct values
+        sample = values[:: max(len(values) // cls.SAMPLE_SIZE, 1)]
+        if len(set(sample)) * 2 <= len(sample):
+            categories = dict.fromkeys(values)
+            if len(categories) * 2 <= len(values):
+                return cls._encode_categories(values, categories, header)
+        joined = cls.SEPARATOR.join(values)
+        if joined.count(cls.SEPARATOR) == len(values) - 1:
+            header["separated"] = True
+            return joined.encode("utf-8", "surrogatepass")
+        content = "".join(values).encode("utf-8", "surrogatepass")
+
+        offsets = array.array("q", itertools.accumulate(map(len, values), initial=0))
+        header["offsets_bytes"] = len(offsets) * offsets.itemsize
+        return offsets.tobytes() + content
+
+    @classmethod
+    def _encode_categories(
+        cls, values: list[str], categories: dict[str, None], header: dict
+    ) -> bytes:
+        """Encode strings as codes into their distinct values."""
+        header["categories"] = list(categories)
+        codes = {category: code for code, category in enumerate(categories)}
+        typecode = _narrowest_typecode(0, len(categories) - 1) or "i"
+        encoded = array.array(typecode, map(codes.__getitem__, values))
+        header["typecode"] = typecode
+        return encoded.tobytes()
+
+    @classmethod
+    def _split(cls, payload: bytes, header: dict) -> list:
+        """Split a buffer back into the strings joined in it."""
+        if "categories" in header:
+            codes = array.array(header["typecode"], payload)
+            if header["byteorder"] != sys.byteorder:
+                codes.byteswap()
+            return list(map(header["categories"].__getitem__, codes))
+        if header.get("separated"):
+            return payload.decode("utf-8", "surrogatepass").split(cls.SEPARATOR)
+
+        offsets = array.array("q", payload[: header["offsets_bytes"]])
+        if header["byteorder"] != sys.byteorder:
+            offsets.byteswap()
+        content = payload[header["offsets_bytes"] :].decode("utf-8", "surrogatepass")
+        return [content[start:stop] for start, stop in itertools.pairwise(offsets)]
@@ -1,4 +1,5 @@
 import os
+import sys
 import tempfile
 from typing import IO, Any
 
@@ -18,12 +19,9 @@ class NumpySerializer(Serializer):
     @classmethod
     def can_serialize(cls, obj: Any) -> bool:
         """Check if object is an ndarray instance."""
-        try:
-            import numpy as np
-
-            return isinstance(obj, np.ndarray)
-        except ImportError:
-            return False
+        # Instances can only exist if numpy was already imported
+        np = sys.modules.get("numpy")
+        return np is not None and isinstance(obj, np.ndarray)
 
     @classmethod
     def serialize(cls, data: Any) -> tuple[str, SerializerMetadata]:
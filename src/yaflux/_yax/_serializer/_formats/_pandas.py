@@ -1,11 +1,62 @@
-import os
-import tempfile
-from typing import IO, Any
+import json
+import sys
+from typing import Any
+
+from .._base import SerializerMetadata
+from ._arrow import ArrowIPCSerializer
+
+# Inferred types of object values Arrow converts to a column of a single type
+_ARROW_INFERRED_TYPES = frozenset(
+    (
+        "empty",
+        "string",
+        "bytes",
+        "integer",
+        "floating",
+        "mixed-integer-float",
+        "decimal",
+        "boolean",
+        "datetime",
+        "date",
+        "time",
+        "timedelta",
+    )
+)
+
+
+def _arrow_compatible(pd: Any, values: Any) -> bool:
+    """Check if Arrow can convert the values of a Series or an Index.
+
+    Values of the object dtype (e.g. mixing strings and dicts) may not convert
+    to a column of a single type, in which case they are pickled instead.
+    """
+    if isinstance(values, pd.MultiIndex):
+        return all(_arrow_compatible(pd, level) for level in values.levels)
+    if not pd.api.types.is_object_dtype(values.dtype):
+        return True
+    return pd.api.types.infer_dtype(values, skipna=True) in _ARROW_INFERRED_TYPES
+
 
-from .._base import Serializer, SerializerMetadata
+def _restore_range_index(frame: Any, schema: Any, rows: tuple[int, int] | None) -> None:
+    """Slice a range index to the rows read of a table.
+
+    A range index is stored as metadata rather than as a column, so pyarrow
+    cannot rebuild it for a subset of the rows.
+    """
+    if rows is None:
+        return
 
+    import pandas as pd
 
-class PandasSerializer(Serializer):
+    for index in (schema.pandas_metadata or {}).get("index_columns", []):
+        if isinstance(index, dict) and index.get("kind") == "range":
+            full = pd.RangeIndex(
+                index["start"], index["stop"], index["step"], name=index["name"]
+            )
+            frame.index = full[rows[0] : rows[1]]
+
+
+class PandasSerializer(ArrowIPCSerializer):
     """Serializer for Pandas DataFrames using Apache Arrow.
 
     This serializer is only active if pandas and pyarrow are installed.
@@ -14,74 +65,122 @@ class PandasSerializer(Serializer):
     """
 
     FORMAT = "arrow"
+    DESCRIPTION = "DataFrame"
+    EXTRA = "pandas"
 
     @classmethod
     def can_serialize(cls, obj: Any) -> bool:
-        """Check if object is a pandas DataFrame."""
-        try:
-            import pandas as pd
-
-            return isinstance(obj, pd.DataFrame)
-        except ImportError:
+        """Check if object is a pandas DataFrame Arrow can convert."""
+        # Instances can only exist if pandas was already imported
+        pd = sys.modules.get("pandas")
+        if pd is None or not isinstance(obj, pd.DataFrame):
             return False
+        return _arrow_compatible(pd, obj.index) and all(
+            _arrow_compatible(pd, obj.iloc[:, position])
+            for position, dtype in enumerate(obj.dtypes)
+            if pd.api.types.is_object_dtype(dtype)
+        )
 
     @classmethod
-    def serialize(cls, data: Any) -> tuple[str, SerializerMetadata]:
-        """Serialize DataFrame to Arrow format."""
-        try:
-            import pandas as pd
-            import pyarrow as pa
-        except ImportError as e:
-            raise ImportError(
-                "pandas and pyarrow packages are required for DataFrame serialization. "
-                "Install with: pip install yaflux[pandas]"
-            ) from e
+    def to_table(cls, data: Any) -> Any:
+        """Convert a DataFrame to an Arrow table."""
+        import pandas as pd
+        import pyarrow as pa
 
         if not isinstance(data, pd.DataFrame):
             raise TypeError("Data must be a pandas DataFrame")
+        return pa.Table.from_pandas(data)
 
-        # Create a temporary file that will persist until explicitly deleted
-        tmp = tempfile.NamedTemporaryFile(suffix=f".{cls.FORMAT}", delete=False)  # noqa
+    @classmethod
+    def from_table(
+        cls, table: Any, metadata: SerializerMetadata, rows: tuple[int, int] | None
+    ) -> Any:
+        """Convert an Arrow table back to a DataFrame."""
+        frame = table.to_pandas()
+        _restore_range_index(frame, table.schema, rows)
+        return frame
 
-        # Convert DataFrame to Arrow Table and write to file
-        table = pa.Table.from_pandas(data)
-        with pa.OSFile(tmp.name, "wb") as sink:  # noqa
-            with pa.RecordBatchFileWriter(sink, table.schema) as writer:
-                writer.write_table(table)
 
-        # Get file size for metadata
-        size = os.path.getsize(tmp.name)
+class PandasSeriesSerializer(ArrowIPCSerializer):
+    """Serializer for pandas Series and Index objects using Apache Arrow.
 
-        # Create metadata
-        metadata = SerializerMetadata(
-            format=cls.FORMAT,
-            type_name=type(data).__name__,
-            module_name=type(data).__module__,
-            size_bytes=size,
-        )
+    A Series is stored as a table of a single column along with its index, and
+    an Index as a table of its levels.
 
-        return tmp.name, metadata
+    This serializer is only active if pandas and pyarrow are installed.
+    Install optional dependencies with:
+        pip install yaflux[pandas]
+    """
+
+    FORMAT = "arrow_series"
+    DESCRIPTION = "Series"
+    EXTRA = "pandas"
+
+    # Schema metadata key marking a Series without a name
+    UNNAMED_KEY = b"yaflux.unnamed"
+
+    # Schema metadata key recording the start, stop and step of a RangeIndex
+    RANGE_KEY = b"yaflux.range"
+
+    @classmethod
+    def can_serialize(cls, obj: Any) -> bool:
+        """Check if object is a pandas Series or Index Arrow can convert."""
+        # Instances can only exist if pandas was already imported
+        pd = sys.modules.get("pandas")
+        if pd is None or not isinstance(obj, pd.Series | pd.Index):
+            return False
+        if isinstance(obj, pd.Series):
+            return _arrow_compatible(pd, obj.index) and _arrow_compatible(pd, obj)
+        return _arrow_compatible(pd, obj)
+
+    @classmethod
+    def to_table(cls, data: Any) -> Any:
+        """Convert a Series or an Index to an Arrow table."""
+        import pandas as pd
+        import pyarrow as pa
+
+        if isinstance(data, pd.Index):
+            # The index is stored as columns so the table has its rows
+            table = pa.Table.from_pandas(pd.DataFrame(index=data), preserve_index=True)
+            if isinstance(data, pd.RangeIndex):
+                bounds = json.dumps([data.start, data.stop, data.step]).encode()
+                table = table.replace_schema_metadata(
+                    {**table.schema.metadata, cls.RANGE_KEY: bounds}
+                )
+            return table
+
+        table = pa.Table.from_pandas(data.to_frame())
+        if data.name is None:
+            table = table.replace_schema_metadata(
+                {**table.schema.metadata, cls.UNNAMED_KEY: b"1"}
+            )
+        return table
+
+    @classmethod
+    def from_table(
+        cls, table: Any, metadata: SerializerMetadata, rows: tuple[int, int] | None
+    ) -> Any:
+        """Convert an Arrow table back to a Series or an Index."""
+        import pandas as pd
+
+        frame = table.to_pandas()
+        _restore_range_index(frame, table.schema, rows)
+        if metadata.type_name != "Series":
+            schema_metadata = table.schema.metadata or {}
+            if cls.RANGE_KEY not in schema_metadata:
+                return frame.index
+            start, stop, step = json.loads(schema_metadata[cls.RANGE_KEY])
+            index = pd.RangeIndex(start, stop, step, name=frame.index.name)
+            return index if rows is None else index[rows[0] : rows[1]]
+
+        series = frame.iloc[:, 0]
+        if cls.UNNAMED_KEY in (table.schema.metadata or {}):
+            series.name = None
+        return series
 
     @classmethod
-    def deserialize(cls, data: IO[bytes], metadata: SerializerMetadata) -> Any:
-        """Deserialize bytes back into a DataFrame."""
-        try:
-            from io import BytesIO
-
-            import pyarrow as pa
-        except ImportError as e:
-            raise ImportError(
-                "pandas and pyarrow are required for DataFrame deserialization. "
-                "Install with: pip install yaflux[pandas]"
-            ) from e
-
-        buffer = BytesIO(data.read())
-        try:
-            # Read Arrow Table from buffer and convert to DataFrame
-            reader = pa.ipc.RecordBatchFileReader(buffer)
-            table = reader.read_all()
-            return table.to_pandas()
-        except Exception as e:
-            raise ValueError(f"Failed to deserialize DataFrame: {e!s}") from e
-        finally:
-            buffer.close()
+    def _field_indices(cls, schema: Any, columns: list[str] | None) -> list[int]:
+        """Reject column projections, which do not apply to a Series."""
+        if columns is not None:
+            raise ValueError("Columns cannot be selected of a Series or an Index")
+        return super()._field_indices(schema, columns)
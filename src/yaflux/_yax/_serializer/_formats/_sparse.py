@@ -0,0 +1,236 @@
+import json
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from typing import IO, Any, ClassVar
+
+from .._base import Serializer, SerializerMetadata
+
+
+class SparseSerializer(Serializer):
+    """Serializer for scipy sparse matrices and arrays in CSR, CSC or COO format.
+
+    The components of the matrix (e.g. `data`, `indices` and `indptr`) are
+    stored as raw buffers behind a small JSON header, each aligned so it can be
+    memory mapped. In compressed archives of backends storing members
+    uncompressed (e.g. `.yaxd` directories), each component is compressed
+    separately unless that does not make it smaller. Other sparse formats are
+    pickled.
+
+    This serializer is only active if scipy is installed.
+    Install optional dependency with:
+        pip install yaflux[scipy]
+    """
+
+    FORMAT = "sparse"
+
+    # Identifies the file format, followed by the length of the header
+    MAGIC = b"YAXSPRS1"
+
+    # Alignment of the component buffers in bytes
+    ALIGNMENT = 64
+
+    # zlib level compressing each component of compressed matrices
+    COMPRESSION_LEVEL: ClassVar[int] = 6
+
+    @classmethod
+    def can_serialize(cls, obj: Any) -> bool:
+        """Check if object is a CSR, CSC or COO sparse matrix."""
+        # Instances can only exist if scipy was already imported
+        sp = sys.modules.get("scipy.sparse")
+        return (
+            sp is not None
+            and sp.issparse(obj)
+            and obj.format in ("csr", "csc", "coo")
+            and not obj.dtype.hasobject
+        )
+
+    @classmethod
+    def serialize(cls, data: Any) -> tuple[str, SerializerMetadata]:
+        """Serialize a sparse matrix to a header and its component buffers."""
+        return cls._serialize(data, None)
+
+    @classmethod
+    def serialize_compressed(cls, data: Any) -> tuple[str, SerializerMetadata]:
+        """Serialize a sparse matrix, compressing each of its components."""
+        return cls._serialize(data, cls.COMPRESSION_LEVEL)
+
+    @classmethod
+    def _serialize(cls, data: Any, level: int | None) -> tuple[str, SerializerMetadata]:
+        """Serialize a sparse matrix, compressing its components at a zlib level."""
+        try:
+            import numpy as np
+            import scipy.sparse as sp
+        except ImportError as e:
+            raise ImportError(
+                "scipy package is required for sparse matrix serialization. "
+                "Install with: pip install yaflux[scipy]"
+            ) from e
+
+        if not sp.issparse(data):
+            raise TypeError("Data must be a scipy sparse matrix")
+
+        header: dict[str, Any] = {
+            "class": type(data).__name__,
+            "shape": list(data.shape),
+            "components": {},
+        }
+        buffers = []
+        offset = 0
+        for name, array in cls._components(data):
+            array = np.ascontiguousarray(array)
+            buffer: Any = memoryview(array.view(np.uint8))
+            compression = None
+            if level is not None:
+                compressed = zlib.compress(buffer, level)
+                if len(compressed) < buffer.nbytes:
+                    buffer, compression = compressed, "zlib"
+
+            nbytes = len(buffer)
+            header["components"][name] = {
+                "dtype": array.dtype.str,
+                "length": len(array),
+                "offset": offset,
+                "nbytes": nbytes,
+                "compression": compression,
+            }
+            buffers.append(buffer)
+            offset = cls._align(offset + nbytes)
+
+        # Create a temporary file that will persist until explicitly deleted
+        tmp = tempfile.NamedTemporaryFile(suffix=f".{cls.FORMAT}", delete=False)  # noqa
+        with tmp:
+            encoded = json.dumps(header).encode("utf-8")
+            tmp.write(cls.MAGIC + struct.pack("<Q", len(encoded)) + encoded)
+            start = cls._align(tmp.tell())
+            for buffer, entry in zip(
+                buffers, header["components"].values(), strict=True
+            ):
+                tmp.write(b"\0" * (start + entry["offset"] - tmp.tell()))
+                tmp.write(buffer)
+
+        metadata = SerializerMetadata(
+            format=cls.FORMAT,
+            type_name=type(data).__name__,
+            module_name=type(data).__module__,
+            size_bytes=os.path.getsize(tmp.name),
+        )
+
+        return tmp.name, metadata
+
+    @classmethod
+    def deserialize(cls, data: IO[bytes], metadata: SerializerMetadata) -> Any:
+        """Deserialize a sparse matrix, reading each component into its array."""
+        header, start = cls._read_header(data)
+        try:
+            components = {
+                name: cls._read_component(data, start, entry)
+                for name, entry in header["components"].items()
+            }
+            return cls._build(header, components)
+        except Exception as e:
+            raise ValueError(f"Failed to deserialize sparse matrix: {e!s}") from e
+
+    @classmethod
+    def deserialize_backed(cls, data: IO[bytes], metadata: SerializerMetadata) -> Any:
+        """Deserialize a sparse matrix with memory mapped (read-only) components.
+
+        Memory mapping requires the member to be stored as a file (e.g. in
+        `.yaxd` archives). Compressed components are read into memory.
+        """
+        import numpy as np
+
+        path = cls._file_path(data)
+        if path is None:
+            raise ValueError(
+                "Memory mapped sparse matrices require an archive storing results "
+                "as files, such as a .yaxd directory archive"
+            )
+
+        header, start = cls._read_header(data)
+        components = {}
+        for name, entry in header["components"].items():
+            if entry["compression"] is not None or entry["length"] == 0:
+                components[name] = cls._read_component(data, start, entry)
+                continue
+            components[name] = np.memmap(
+                path,
+                dtype=np.dtype(entry["dtype"]),
+                mode="r",
+                offset=start + entry["offset"],
+                shape=(entry["length"],),
+            )
+        return cls._build(header, components)
+
+    @staticmethod
+    def _components(data: Any) -> list[tuple[str, Any]]:
+        """List the named arrays storing a sparse matrix."""
+        if data.format == "coo":
+            coords = data.coords if hasattr(data, "coords") else (data.row, data.col)
+            return [("data", data.data)] + [
+                (f"coords{axis}", coord) for axis, coord in enumerate(coords)
+            ]
+        return [("data", data.data), ("indices", data.indices), ("indptr", data.indptr)]
+
+    @staticmethod
+    def _build(header: dict, components: dict[str, Any]) -> Any:
+        """Build a sparse matrix from its components without copying them."""
+        try:
+            import scipy.sparse as sp
+        except ImportError as e:
+            raise ImportError(
+                "scipy package is required for sparse matrix deserialization. "
+                "Install with: pip install yaflux[scipy]"
+            ) from e
+
+        matrix_class = getattr(sp, header["class"])
+        shape = tuple(header["shape"])
+        if "indptr" not in components:
+            coords = tuple(
+                components[f"coords{axis}"] for axis in range(len(components) - 1)
+            )
+            return matrix_class((components["data"], coords), shape=shape, copy=False)
+
+        # The constructor may cast the indices, so the buffers are assigned
+        matrix = matrix_class(shape, dtype=components["data"].dtype)
+        matrix.data = components["data"]
+        matrix.indices = components["indices"]
+        matrix.indptr = components["indptr"]
+        return matrix
+
+    @classmethod
+    def _read_header(cls, data: IO[bytes]) -> tuple[dict, int]:
+        """Read the header, returning it with the offset of the first component."""
+        prefix = data.read(len(cls.MAGIC) + 8)
+        if prefix[: len(cls.MAGIC)] != cls.MAGIC:
+            raise ValueError("Failed to deserialize sparse matrix: invalid header")
+        (length,) = struct.unpack("<Q", prefix[len(cls.MAGIC) :])
+        header = json.loads(data.read(length).decode("utf-8"))
+        return header, cls._align(len(prefix) + length)
+
+    @staticmethod
+    def _read_component(data: IO[bytes], start: int, entry: dict) -> Any:
+        """Read a component into a new array."""
+        import numpy as np
+
+        array = np.empty(entry["length"], dtype=np.dtype(entry["dtype"]))
+        view = memoryview(array.view(np.uint8))
+        data.seek(start + entry["offset"])
+        if entry["compression"] == "zlib":
+            view[:] = zlib.decompress(data.read(entry["nbytes"]))
+            return array
+
+        position = 0
+        while position < len(view):
+            count = data.readinto(view[position:])  # type: ignore
+            if not count:
+                raise ValueError("Sparse matrix component is truncated")
+            position += count
+        return array
+
+    @classmethod
+    def _align(cls, offset: int) -> int:
+        """Round an offset up to the alignment of the component buffers."""
+        return -(-offset // cls.ALIGNMENT) * cls.ALIGNMENT
@@ -1,3 +1,6 @@
+import yaflux as yf
+
+
 def _assert_out_of_order(analysis, step):
     """Tests for out of order execution of analysis steps."""
     try:
@@ -12,3 +15,18 @@ def _assert_in_order(analysis, step):
     """Tests for in order execution of analysis steps."""
     step()
     assert step.__name__ in analysis.completed_steps
+
+
+def _save_result(tmp_path, value, name="result.yax", **kwargs):
+    """Save an analysis holding a single result, named `value`."""
+
+    class Analysis(yf.Base):
+        @yf.step(creates="value")
+        def create_value(self):
+            return value
+
+    analysis = Analysis()
+    analysis.execute()
+    path = str(tmp_path / name)
+    analysis.save(path, **kwargs)
+    return path
@@ -0,0 +1,28 @@
+import os
+
+import pytest
+
+# The disk cache of step summaries is disabled (by an empty directory) so tests
+# never write to the cache of the user running them
+_CACHE_DIR = "YAFLUX_CACHE_DIR"
+
+
+def pytest_configure(config):
+    # Steps defined at module level are summarized while tests are collected,
+    # before any fixture runs
+    config._yaflux_cache_dir = os.environ.get(_CACHE_DIR)
+    os.environ[_CACHE_DIR] = ""
+
+
+def pytest_unconfigure(config):
+    previous = getattr(config, "_yaflux_cache_dir", None)
+    if previous is None:
+        os.environ.pop(_CACHE_DIR, None)
+    else:
+        os.environ[_CACHE_DIR] = previous
+
+
+@pytest.fixture(autouse=True)
+def disable_summary_cache(monkeypatch):
+    """Disable the disk cache of step summaries for every test."""
+    monkeypatch.setenv(_CACHE_DIR, "")
@@ -0,0 +1,113 @@
+import pytest
+
+import yaflux as yf
+from yaflux._ast import _summary, summarize_step
+from yaflux._ast._cache import SummaryCache
+
+
+def sample_step(self):
+    self.results.other = 1
+    return self.results.data + self.parameters.alpha
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("YAFLUX_CACHE_DIR", str(tmp_path))
+    SummaryCache.clear_memory()
+    yield tmp_path
+    SummaryCache.clear_memory()
+
+
+def test_single_pass_summary(cache_dir):
+    summary = summarize_step(sample_step)
+    assert summary.results == ["data", "other"]
+    assert summary.assignments == ["self.results.other"]
+    assert summary.parameters == ["alpha"]
+
+
+def test_disk_cache_skips_parsing(cache_dir, monkeypatch):
+    expected = summarize_step(sample_step)
+    assert list(cache_dir.glob("*/*.json"))
+
+    # A new process only has the disk cache
+    SummaryCache.clear_memory()
+
+    def fail(func):
+        raise AssertionError("cached steps must not be parsed")
+
+    monkeypatch.setattr(_summary, "get_function_node", fail)
+    assert summarize_step(sample_step) == expected
+
+
+def test_changed_step_is_parsed(cache_dir):
+    def first(self):
+        return self.results.a
+
+    def second(self):
+        return self.results.b
+
+    assert SummaryCache.key(first) != SummaryCache.key(second)
+    assert summarize_step(first).results == ["a"]
+    assert summarize_step(second).results == ["b"]
+
+
+def test_disabled_disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("YAFLUX_CACHE_DIR", "")
+    SummaryCache.clear_memory()
+    assert SummaryCache.directory() is None
+    assert summarize_step(sample_step).parameters == ["alpha"]
+
+
+def test_lazy_validation(monkeypatch):
+    monkeypatch.setenv("YAFLUX_VALIDATE", "lazy")
+
+    # Decorating an invalid step does not raise
+    class LazyAnalysis(yf.Base):
+        @yf.step(creates="out")
+        def bad_step(self) -> int:
+            return self.results.undeclared
+
+    # Parameters are not inferred without eager validation
+    assert LazyAnalysis.bad_step.parameters is None
+
+    analysis = LazyAnalysis()
+    with pytest.raises(yf.AstUndeclaredUsageError):
+        analysis.bad_step()
+
+
+def test_lazy_validation_of_valid_step(monkeypatch):
+    monkeypatch.setenv("YAFLUX_VALIDATE", "lazy")
+
+    class LazyAnalysis(yf.Base):
+        @yf.step(creates="out")
+        def good_step(self) -> int:
+            return 1
+
+        @yf.map_step(over="out_list", creates="mapped")
+        def bad_map(self, item: int) -> int:
+            return item + self.results.undeclared
+
+    analysis = LazyAnalysis()
+    analysis.good_step()
+    assert analysis.results.out == 1
+
+
+def test_validation_off(monkeypatch):
+    monkeypatch.setenv("YAFLUX_VALIDATE", "off")
+
+    class UncheckedAnalysis(yf.Base):
+        @yf.step(creates="out", requires="data")
+        def unchecked(self) -> int:
+            return 1
+
+    assert UncheckedAnalysis.unchecked.parameters is None
+
+
+def test_invalid_validation_mode(monkeypatch):
+    monkeypatch.setenv("YAFLUX_VALIDATE", "sometimes")
+    with pytest.raises(ValueError, match="YAFLUX_VALIDATE"):
+
+        class BadAnalysis(yf.Base):
+            @yf.step(creates="out")
+            def step(self) -> int:
+                return 1
@@ -0,0 +1,124 @@
+import asyncio
+import time
+
+import pytest
+
+import yaflux as yf
+from yaflux._results import ResultsLock
+
+DELAY = 0.1
+
+
+class IOAnalysis(yf.Base):
+    @yf.step(creates="config")
+    def load_config(self) -> dict:
+        return {"scale": 2}
+
+    @yf.step(creates="remote_a", requires="config")
+    async def fetch_a(self) -> int:
+        await asyncio.sleep(DELAY)
+        return 1 * self.results.config["scale"]
+
+    @yf.step(creates="remote_b", requires="config")
+    async def fetch_b(self) -> int:
+        await asyncio.sleep(DELAY)
+        return 2 * self.results.config["scale"]
+
+    @yf.step(creates="total", requires=["remote_a", "remote_b"])
+    def combine(self) -> int:
+        return self.results.remote_a + self.results.remote_b
+
+
+def test_async_step_direct():
+    analysis = IOAnalysis()
+    analysis.load_config()
+    assert asyncio.run(analysis.fetch_a()) == 2
+    assert "fetch_a" in analysis.completed_steps
+    assert analysis.get_step_metadata("fetch_a").elapsed >= DELAY
+
+
+def test_execute_async_concurrent():
+    analysis = IOAnalysis()
+    start = time.time()
+    asyncio.run(analysis.execute_async())
+    elapsed = time.time() - start
+
+    assert analysis.results.total == 6
+    assert set(analysis.completed_steps) == set(analysis.available_steps)
+
+    # Both fetches overlap on the event loop
+    assert elapsed < 2 * DELAY
+    a = analysis.get_step_metadata("fetch_a")
+    b = analysis.get_step_metadata("fetch_b")
+    assert a.thread_id == b.thread_id
+    assert abs(a.timestamp - b.timestamp) < DELAY
+
+
+def test_execute_async_target():
+    analysis = IOAnalysis()
+    result = asyncio.run(analysis.execute_async(target_step="fetch_b"))
+    assert result == 4
+    assert "total" not in analysis.completed_steps
+
+
+def test_execute_sync_with_async_steps():
+    analysis = IOAnalysis()
+    analysis.execute_all()
+    assert analysis.results.total == 6
+
+    analysis = IOAnalysis()
+    analysis.execute_all(workers=2)
+    assert analysis.results.total == 6
+
+
+def test_execute_async_skips_completed():
+    analysis = IOAnalysis()
+    asyncio.run(analysis.execute_async())
+    timestamp = analysis.get_step_metadata("fetch_a").timestamp
+    asyncio.run(analysis.execute_async())
+    assert analysis.get_step_metadata("fetch_a").timestamp == timestamp
+
+
+def test_execute_async_error():
+    class FailingAnalysis(yf.Base):
+        @yf.step(creates="a")
+        async def step_a(self) -> int:
+            raise RuntimeError("failed")
+
+        @yf.step(creates="b", requires="a")
+        def step_b(self) -> int:
+            return self.results.a
+
+    analysis = FailingAnalysis()
+    with pytest.raises(RuntimeError):
+        asyncio.run(analysis.execute_async())
+    assert analysis.completed_steps == []
+
+
+def test_async_lock_isolation():
+    """Mutation permissions do not leak between concurrent tasks."""
+    observed = []
+
+    async def mutating():
+        with ResultsLock.allow_mutation({"x"}):
+            await asyncio.sleep(DELAY / 10)
+            observed.append(("mutating", ResultsLock.can_mutate_key("x")))
+
+    async def reading():
+        await asyncio.sleep(0)
+        observed.append(("reading", ResultsLock.can_mutate_key("x")))
+
+    async def main():
+        await asyncio.gather(mutating(), reading())
+
+    asyncio.run(main())
+    assert sorted(observed) == [("mutating", True), ("reading", False)]
+
+
+def test_async_ast_validation():
+    with pytest.raises(yf.AstUndeclaredUsageError):
+
+        class BadAnalysis(yf.Base):
+            @yf.step(creates="out")
+            async def bad(self) -> int:
+                return self.results.undeclared
@@ -0,0 +1,71 @@
+import pytest
+
+import yaflux as yf
+
+
+class BranchedAnalysis(yf.Base):
+    @yf.step(creates="root")
+    def load(self) -> int:
+        return 1
+
+    @yf.step(creates="long_a", requires="root")
+    def long_a(self) -> int:
+        return self.results.root
+
+    @yf.step(creates="long_b", requires="long_a")
+    def long_b(self) -> int:
+        return self.results.long_a
+
+    @yf.step(creates="short", requires="root")
+    def short(self) -> int:
+        return self.results.root
+
+    @yf.step(creates="merged", requires=["long_b", "short"])
+    def merge(self) -> int:
+        return self.results.long_b + self.results.short
+
+
+DURATIONS = {
+    "load": 1.0,
+    "long_a": 10.0,
+    "long_b": 10.0,
+    "short": 2.0,
+    "merge": 1.0,
+}
+
+
+def test_critical_path():
+    analysis = BranchedAnalysis()
+    cp = analysis.critical_path(DURATIONS)
+
+    assert cp.path == ["load", "long_a", "long_b", "merge"]
+    assert cp.length == pytest.approx(22.0)
+    assert cp.total == pytest.approx(24.0)
+    assert cp.speedup == pytest.approx(24.0 / 22.0)
+
+
+def test_critical_path_slack():
+    analysis = BranchedAnalysis()
+    cp = analysis.critical_path(DURATIONS)
+
+    for step in cp.path:
+        assert cp.slack[step] == pytest.approx(0.0)
+    assert cp.slack["short"] == pytest.approx(18.0)
+
+
+def test_critical_path_from_metadata():
+    analysis = BranchedAnalysis()
+    analysis.execute_all()
+    cp = analysis.critical_path()
+
+    assert cp.path[0] == "load"
+    assert cp.path[-1] == "merge"
+    elapsed = sum(analysis.get_step_metadata(step).elapsed for step in cp.path)
+    assert cp.length == pytest.approx(elapsed)
+
+
+def test_critical_path_empty():
+    analysis = BranchedAnalysis()
+    cp = analysis.critical_path()
+    assert cp.length == 0.0
+    assert cp.speedup == 1.0
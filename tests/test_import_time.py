@@ -0,0 +1,64 @@
+import subprocess
+import sys
+
+import pytest
+
+# Generous bound on `import yaflux` so the check is stable on slow machines
+IMPORT_TIME_TARGET = 0.5
+
+OPTIONAL_MODULES = [
+    "anndata",
+    "asyncio",
+    "graphviz",
+    "multiprocessing",
+    "numpy",
+    "pandas",
+    "polars",
+    "pyarrow",
+    "scipy",
+    "tarfile",
+]
+
+
+def _run(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+def test_import_loads_only_the_core():
+    loaded = _run(
+        "import sys, yaflux; "
+        f"print(','.join(m for m in {OPTIONAL_MODULES!r} if m in sys.modules))"
+    )
+    assert loaded == ""
+
+
+def test_lazy_attributes():
+    code = (
+        "import sys, yaflux; "
+        "assert 'yaflux._loaders' not in sys.modules; "
+        "assert callable(yaflux.load); "
+        "assert issubclass(yaflux.YaxNotArchiveFileError, Exception); "
+        "assert 'load' in dir(yaflux); "
+        "print('ok')"
+    )
+    assert _run(code) == "ok"
+
+    import yaflux as yf
+
+    with pytest.raises(AttributeError):
+        yf.not_an_attribute  # noqa: B018
+
+
+def test_import_time():
+    code = (
+        "import time; start = time.perf_counter(); import yaflux; "
+        "print(time.perf_counter() - start)"
+    )
+    # The fastest of a few runs excludes noise from the machine
+    elapsed = min(float(_run(code)) for _ in range(3))
+    assert elapsed < IMPORT_TIME_TARGET
@@ -0,0 +1,179 @@
+import pytest
+
+import yaflux as yf
+
+
+class PipelineAnalysis(yf.Base):
+    @yf.step(creates="raw")
+    def load_raw(self) -> list[int]:
+        return list(self.parameters["data"])
+
+    @yf.step(creates="reference")
+    def load_reference(self) -> int:
+        return 100
+
+    @yf.step(creates="clean", requires="raw")
+    def clean(self) -> list[int]:
+        return [x for x in self.results.raw if x >= 0]
+
+    @yf.step(creates="total", requires="clean")
+    def total(self) -> int:
+        return sum(self.results.clean)
+
+    @yf.step(creates="scaled", requires="reference")
+    def scale(self) -> int:
+        return self.results.reference * 2
+
+    @yf.step(creates="report", requires=["total", "scaled"])
+    def report(self) -> str:
+        return f"{self.results.total}/{self.results.scaled}"
+
+
+def versions(analysis: yf.Base) -> dict[str, str]:
+    return {
+        step: analysis.get_step_metadata(step).version
+        for step in analysis.completed_steps
+    }
+
+
+def test_no_stale_steps_after_execution():
+    analysis = PipelineAnalysis(parameters={"data": [1, -2, 3]})
+    analysis.execute_all()
+    assert analysis.stale_steps() == []
+
+
+def test_default_mode_skips_stale_steps():
+    analysis = PipelineAnalysis(parameters={"data": [1, -2, 3]})
+    analysis.execute_all()
+
+    analysis.parameters["data"] = [10, 20]
+    analysis.load_raw(force=True)
+    analysis.execute_all()
+    assert analysis.results.total == 4
+
+
+def test_incremental_reruns_downstream_cone():
+    analysis = PipelineAnalysis(parameters={"data": [1, -2, 3]})
+    analysis.execute_all()
+    before = versions(analysis)
+
+    analysis.parameters["data"] = [10, 20]
+    analysis.load_raw(force=True)
+    assert analysis.stale_steps() == ["clean", "total", "report"]
+
+    analysis.execute_all(mode="incremental")
+    after = versions(analysis)
+    rerun = {step for step in before if before[step] != after[step]}
+
+    assert rerun == {"load_raw", "clean", "total", "report"}
+    assert analysis.results.report == "30/200"
+    assert analysis.stale_steps() == []
+
+
+def test_incremental_with_target_step():
+    analysis = PipelineAnalysis(parameters={"data": [1, 2]})
+    analysis.execute_all()
+    analysis.parameters["data"] = [5]
+    analysis.load_raw(force=True)
+
+    analysis.execute(target_step="total", mode="incremental")
+    assert analysis.results.total == 5
+    assert "report" in analysis.stale_steps()
+
+
+def test_incremental_parallel():
+    analysis = PipelineAnalysis(parameters={"data": [1, 2]})
+    analysis.execute_all()
+    analysis.parameters["data"] = [7]
+    analysis.load_raw(force=True)
+
+    analysis.execute_all(mode="incremental", workers=2)
+    assert analysis.results.report == "7/200"
+
+
+class MutationAnalysis(yf.Base):
+    @yf.step(creates="offset")
+    def load_offset(self) -> int:
+        return self.parameters["offset"]
+
+    @yf.step(creates="values")
+    def load_values(self) -> list[int]:
+        return [1, 2, 3]
+
+    @yf.step(mutates="values", requires="offset", creates="_shifted")
+    def shift(self):
+        for i in range(len(self.results.values)):
+            self.results.values[i] += self.results.offset
+
+    @yf.step(creates="total", requires=["values", "_shifted"])
+    def total(self) -> int:
+        return sum(self.results.values)
+
+
+def test_incremental_reapplies_mutation_on_fresh_input():
+    analysis = MutationAnalysis(parameters={"offset": 1})
+    analysis.execute_all()
+    assert analysis.results.total == 9
+
+    analysis.parameters["offset"] = 10
+    analysis.load_offset(force=True)
+
+    # The mutated result is recreated so the new offset is applied only once
+    assert set(analysis.stale_steps()) == {"load_values", "shift", "total"}
+    analysis.execute_all(mode="incremental")
+    assert analysis.results.values == [11, 12, 13]
+    assert analysis.results.total == 36
+
+
+def test_stale_steps_after_load(tmp_path):
+    analysis = PipelineAnalysis(parameters={"data": [1, 2]})
+    analysis.execute_all()
+    path = str(tmp_path / "pipeline.yax")
+    analysis.save(path)
+
+    loaded = PipelineAnalysis.load(path)
+    assert loaded.stale_steps() == []
+    loaded.load_reference(force=True)
+    assert loaded.stale_steps() == ["scale", "report"]
+
+
+def test_unknown_mode():
+    analysis = PipelineAnalysis(parameters={"data": [1]})
+    with pytest.raises(ValueError, match="Unknown execution mode"):
+        analysis.execute_all(mode="eager")  # type: ignore
+
+
+class ReadThenMutateAnalysis(yf.Base):
+    @yf.step(creates="x")
+    def make(self) -> list[int]:
+        return list(self.parameters["data"])
+
+    @yf.step(creates="_read", requires="x")
+    def read(self) -> None:
+        assert self.results.x is not None
+
+    @yf.step(mutates="x", requires="_read")
+    def mut(self) -> None:
+        self.results.x.append(0)
+
+
+def test_mutation_after_read_is_not_stale():
+    analysis = ReadThenMutateAnalysis(parameters={"data": [1, 2]})
+    analysis.execute_all()
+    assert analysis.stale_steps() == []
+
+    before = versions(analysis)
+    analysis.execute_all(mode="incremental")
+    assert versions(analysis) == before
+    assert analysis.results.x == [1, 2, 0]
+
+
+def test_read_then_mutate_reruns_on_change():
+    analysis = ReadThenMutateAnalysis(parameters={"data": [1, 2]})
+    analysis.execute_all()
+
+    analysis.parameters["data"] = [3]
+    assert analysis.stale_steps() == ["make", "read", "mut"]
+    analysis.execute_all(mode="incremental")
+    assert analysis.results.x == [3, 0]
+    assert analysis.stale_steps() == []
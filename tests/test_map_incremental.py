@@ -0,0 +1,126 @@
+import inspect
+
+import numpy as np
+
+import yaflux as yf
+from yaflux._map._step import _source_fingerprint
+
+
+def build_analysis(samples: dict[str, list[int]], calls: list):
+    class IncrementalAnalysis(yf.Base):
+        @yf.step(creates="samples")
+        def load_samples(self) -> dict[str, list[int]]:
+            return {key: list(values) for key, values in samples.items()}
+
+        @yf.step(creates="offset")
+        def load_offset(self) -> int:
+            return self.parameters["offset"]
+
+        @yf.map_step(over="samples", creates="sums", requires="offset")
+        def sum_sample(self, sample: list[int], key: str) -> int:
+            calls.append(key)
+            return sum(sample) + self.results.offset
+
+        @yf.map_step(over="samples", creates="totals", incremental=False)
+        def total_sample(self, sample: list[int], key: str) -> int:
+            calls.append(f"total:{key}")
+            return sum(sample)
+
+    return IncrementalAnalysis(parameters={"offset": 0})
+
+
+def test_only_changed_partitions_recompute():
+    samples = {"a": [1, 2], "b": [3], "c": [4, 5]}
+    calls = []
+    analysis = build_analysis(samples, calls)
+    analysis.load_samples()
+    analysis.load_offset()
+    analysis.sum_sample()
+    assert sorted(calls) == ["a", "b", "c"]
+
+    # Change a single sample and re-execute
+    samples["b"] = [30]
+    calls.clear()
+    analysis.load_samples(force=True)
+    analysis.sum_sample(force=True)
+
+    assert calls == ["b"]
+    assert analysis.results.sums == {"a": 3, "b": 30, "c": 9}
+
+    partitions = analysis.get_step_metadata("sum_sample").partitions
+    assert partitions["a"]["reused"] and partitions["c"]["reused"]
+    assert not partitions["b"]["reused"]
+
+
+def test_shared_inputs_invalidate_all_partitions():
+    samples = {"a": [1], "b": [2]}
+    calls = []
+    analysis = build_analysis(samples, calls)
+    analysis.load_samples()
+    analysis.load_offset()
+    analysis.sum_sample()
+
+    analysis.parameters["offset"] = 10
+    calls.clear()
+    analysis.load_offset(force=True)
+    analysis.sum_sample(force=True)
+
+    assert sorted(calls) == ["a", "b"]
+    assert analysis.results.sums == {"a": 11, "b": 12}
+
+
+def test_incremental_opt_out():
+    samples = {"a": [1], "b": [2]}
+    calls = []
+    analysis = build_analysis(samples, calls)
+    analysis.load_samples()
+    analysis.total_sample()
+    calls.clear()
+    analysis.total_sample(force=True)
+    assert sorted(calls) == ["total:a", "total:b"]
+
+
+def test_incremental_array_after_load(tmp_path):
+    data = {"matrix": np.arange(6).reshape(3, 2)}
+    calls = []
+
+    class ArrayAnalysis(yf.Base):
+        @yf.step(creates="matrix")
+        def load_matrix(self) -> np.ndarray:
+            return data["matrix"].copy()
+
+        @yf.map_step(over="matrix", creates="scaled")
+        def scale(self, row: np.ndarray, key: int) -> np.ndarray:
+            calls.append(key)
+            return row * 2
+
+    analysis = ArrayAnalysis()
+    analysis.execute_all()
+    path = str(tmp_path / "analysis.yax")
+    analysis.save(path)
+
+    # Reuse works from the results and metadata restored from an archive
+    loaded = ArrayAnalysis.load(path)
+    data["matrix"][1] = [10, 11]
+    calls.clear()
+    loaded.load_matrix(force=True)
+    loaded.scale(force=True)
+
+    assert calls == [1]
+    assert loaded.results.scaled.tolist() == [[0, 2], [20, 22], [8, 10]]
+
+
+def test_body_fingerprint_does_not_read_source(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("source read while defining a map step")
+
+    monkeypatch.setattr(inspect, "getsource", fail)
+
+    def double(self, item: int) -> int:
+        return sum(x * 2 for x in [item])
+
+    def triple(self, item: int) -> int:
+        return sum(x * 3 for x in [item])
+
+    assert _source_fingerprint(double) == _source_fingerprint(double)
+    assert _source_fingerprint(double) != _source_fingerprint(triple)
@@ -0,0 +1,161 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import yaflux as yf
+
+
+class SampleAnalysis(yf.Base):
+    @yf.step(creates="samples")
+    def load_samples(self) -> dict[str, list[int]]:
+        return {"a": [1, 2, 3], "b": [4, 5], "c": [6]}
+
+    @yf.step(creates="chunks")
+    def load_chunks(self) -> list[list[int]]:
+        return [[1, 2], [3, 4], [5, 6]]
+
+    @yf.step(creates="scale")
+    def load_scale(self) -> int:
+        return 10
+
+    @yf.map_step(over="samples", creates="sample_sums")
+    def sum_sample(self, sample: list[int]) -> int:
+        return sum(sample)
+
+    @yf.map_step(over="chunks", creates="scaled_chunks", requires="scale")
+    def scale_chunk(self, chunk: list[int]) -> list[int]:
+        return [x * self.results.scale for x in chunk]
+
+    @yf.map_step(over="samples", creates="labels", executor="serial")
+    def label_sample(self, sample: list[int], key: str) -> str:
+        return f"{key}:{len(sample)}"
+
+    @yf.map_step(over="chunks", creates="chunk_total", gather=sum)
+    def sum_chunk(self, chunk: list[int]) -> int:
+        return sum(chunk)
+
+    @yf.map_step(over="samples", creates="process_sums", executor="process", workers=2)
+    def sum_in_process(self, sample: list[int]) -> int:
+        return sum(sample) * self.parameters["factor"]
+
+
+def test_map_dict():
+    analysis = SampleAnalysis(parameters={"factor": 2})
+    analysis.execute(target_step="sum_sample")
+    assert analysis.results.sample_sums == {"a": 6, "b": 9, "c": 6}
+
+
+def test_map_list_with_requires():
+    analysis = SampleAnalysis(parameters={"factor": 2})
+    analysis.execute_all()
+    assert analysis.results.scaled_chunks == [[10, 20], [30, 40], [50, 60]]
+    assert analysis.get_step_info("scale_chunk")["requires"] == ["chunks", "scale"]
+
+
+def test_map_key_and_gather():
+    analysis = SampleAnalysis(parameters={"factor": 2})
+    analysis.execute_all()
+    assert analysis.results.labels == {"a": "a:3", "b": "b:2", "c": "c:1"}
+    assert analysis.results.chunk_total == 21
+
+
+def test_map_process_pool():
+    analysis = SampleAnalysis(parameters={"factor": 2})
+    analysis.execute_all()
+    assert analysis.results.process_sums == {"a": 12, "b": 18, "c": 12}
+
+
+def test_map_partition_metadata():
+    analysis = SampleAnalysis(parameters={"factor": 2})
+    analysis.execute_all()
+    metadata = analysis.get_step_metadata("sum_sample")
+    assert metadata.creates == ["sample_sums"]
+    assert metadata.requires == ["samples"]
+    assert set(metadata.partitions) == {"a", "b", "c"}
+    for timing in metadata.partitions.values():
+        assert timing["timestamp"] >= metadata.timestamp
+        assert timing["elapsed"] <= metadata.elapsed
+    assert analysis.get_step_metadata("load_samples").partitions is None
+
+
+def test_map_skips_existing():
+    analysis = SampleAnalysis(parameters={"factor": 2})
+    analysis.execute_all()
+    timestamp = analysis.get_step_metadata("sum_sample").timestamp
+    analysis.sum_sample()
+    assert analysis.get_step_metadata("sum_sample").timestamp == timestamp
+
+
+def test_map_threads():
+    threads = set()
+
+    class ThreadedAnalysis(yf.Base):
+        @yf.step(creates="items")
+        def load(self) -> list[int]:
+            return list(range(16))
+
+        @yf.map_step(over="items", creates="doubled", workers=4)
+        def double(self, item: int) -> int:
+            threads.add(threading.get_ident())
+            return item * 2
+
+    analysis = ThreadedAnalysis()
+    analysis.execute_all()
+    assert analysis.results.doubled == [i * 2 for i in range(16)]
+    assert threading.get_ident() not in threads
+
+
+def test_map_array_and_dataframe():
+    class TabularAnalysis(yf.Base):
+        @yf.step(creates="matrix")
+        def load_matrix(self) -> np.ndarray:
+            return np.arange(12).reshape(3, 4)
+
+        @yf.step(creates="table")
+        def load_table(self) -> pd.DataFrame:
+            return pd.DataFrame({"group": ["x", "y", "x"], "value": [1, 2, 3]})
+
+        @yf.map_step(over="matrix", creates="row_sums")
+        def sum_row(self, row: np.ndarray) -> int:
+            return int(row.sum())
+
+        @yf.map_step(over="matrix", creates="normalized", axis=1)
+        def normalize_column(self, column: np.ndarray) -> np.ndarray:
+            return column / column.sum()
+
+        @yf.map_step(over="table", creates="group_totals", groupby="group")
+        def total_group(self, group: pd.DataFrame) -> int:
+            return int(group["value"].sum())
+
+    analysis = TabularAnalysis()
+    analysis.execute_all()
+    assert analysis.results.row_sums.tolist() == [6, 22, 38]
+    assert analysis.results.normalized.shape == (3, 4)
+    assert np.allclose(analysis.results.normalized.sum(axis=0), 1.0)
+    assert analysis.results.group_totals == {"x": 4, "y": 2}
+
+
+def test_map_undeclared_usage():
+    with pytest.raises(yf.AstUndeclaredUsageError):
+
+        class BadAnalysis(yf.Base):
+            @yf.map_step(over="items", creates="out")
+            def bad(self, item: int) -> int:
+                return item + self.results.other
+
+
+def test_map_dataframe_requires_groupby():
+    class UngroupedAnalysis(yf.Base):
+        @yf.step(creates="table")
+        def load_table(self) -> pd.DataFrame:
+            return pd.DataFrame({"value": [1, 2, 3]})
+
+        @yf.map_step(over="table", creates="out")
+        def process(self, part: pd.DataFrame) -> int:
+            return len(part)
+
+    analysis = UngroupedAnalysis()
+    with pytest.raises(TypeError):
+        analysis.execute_all()
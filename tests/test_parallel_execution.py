@@ -0,0 +1,164 @@
+import threading
+import time
+
+import pytest
+
+import yaflux as yf
+
+DELAY = 0.05
+
+
+class HeterogeneousAnalysis(yf.Base):
+    @yf.step(creates="root")
+    def root(self) -> int:
+        return 1
+
+    @yf.step(creates="short_a", requires="root")
+    def short_a(self) -> int:
+        time.sleep(DELAY)
+        return self.results.root
+
+    @yf.step(creates="short_b", requires="root")
+    def short_b(self) -> int:
+        time.sleep(DELAY)
+        return self.results.root
+
+    @yf.step(creates="short_c", requires="root")
+    def short_c(self) -> int:
+        time.sleep(DELAY)
+        return self.results.root
+
+    @yf.step(creates="long_a", requires="root")
+    def long_a(self) -> int:
+        time.sleep(DELAY)
+        return self.results.root
+
+    @yf.step(creates="long_b", requires="long_a")
+    def long_b(self) -> int:
+        time.sleep(DELAY)
+        return self.results.long_a
+
+    @yf.step(creates="long_c", requires="long_b")
+    def long_c(self) -> int:
+        time.sleep(DELAY)
+        return self.results.long_b
+
+
+HISTORY = {
+    "root": 0.0,
+    "short_a": DELAY,
+    "short_b": DELAY,
+    "short_c": DELAY,
+    "long_a": DELAY,
+    "long_b": DELAY,
+    "long_c": DELAY,
+}
+
+
+def _start(analysis, step):
+    return analysis.get_step_metadata(step).timestamp
+
+
+def test_parallel_execution():
+    analysis = HeterogeneousAnalysis()
+    analysis.execute_all(workers=4)
+
+    assert set(analysis.completed_steps) == set(analysis.available_steps)
+    assert analysis.results.long_c == 1
+
+    # Independent steps ran on multiple threads
+    threads = {
+        analysis.get_step_metadata(s).thread_id for s in analysis.completed_steps
+    }
+    assert len(threads) > 1
+    assert threading.get_ident() not in threads
+
+
+def test_critical_path_first():
+    analysis = HeterogeneousAnalysis()
+    analysis.execute_all(workers=2, durations=HISTORY)
+
+    # The long chain is started before the second short step
+    assert _start(analysis, "long_a") < _start(analysis, "short_b")
+    assert _start(analysis, "long_a") < _start(analysis, "short_c")
+
+    # Makespan is the length of the long chain
+    cp = analysis.critical_path()
+    assert cp.length == pytest.approx(3 * DELAY, abs=DELAY / 2)
+    end = max(_start(analysis, s) + m.elapsed for s, m in _metadata(analysis))
+    assert end - _start(analysis, "root") < 4 * DELAY
+
+
+def _metadata(analysis):
+    return [(s, analysis.get_step_metadata(s)) for s in analysis.completed_steps]
+
+
+def test_parallel_target_step():
+    analysis = HeterogeneousAnalysis()
+    result = analysis.execute(target_step="long_b", workers=2)
+    assert result == 1
+    assert "long_b" in analysis.completed_steps
+    assert "long_c" not in analysis.completed_steps
+
+
+def test_parallel_skips_completed():
+    analysis = HeterogeneousAnalysis()
+    analysis.execute_all(workers=2)
+    timestamp = _start(analysis, "long_a")
+    analysis.execute_all(workers=2)
+    assert _start(analysis, "long_a") == timestamp
+
+
+def test_parallel_error():
+    class FailingAnalysis(yf.Base):
+        @yf.step(creates="a")
+        def step_a(self) -> int:
+            return 1
+
+        @yf.step(creates="b", requires="a")
+        def step_b(self) -> int:
+            raise RuntimeError(f"failed {self.results.a}")
+
+        @yf.step(creates="c", requires="b")
+        def step_c(self) -> int:
+            return self.results.b
+
+    analysis = FailingAnalysis()
+    with pytest.raises(RuntimeError):
+        analysis.execute_all(workers=2)
+    assert "step_c" not in analysis.completed_steps
+
+
+def test_parallel_mutation_is_exclusive():
+    running = []
+    overlaps = []
+
+    class MutatingAnalysis(yf.Base):
+        @yf.step(creates="data")
+        def load(self) -> list[int]:
+            return [1, 2, 3]
+
+        @yf.step(creates="prep")
+        def prep(self) -> int:
+            return 1
+
+        @yf.step(creates="prep_more", requires="prep")
+        def prep_more(self) -> int:
+            return self.results.prep
+
+        @yf.step(creates="_mutated", mutates="data")
+        def mutate(self):
+            running.append("mutate")
+            time.sleep(DELAY)
+            self.results.data[0] = 10
+            running.remove("mutate")
+
+        # Ready as soon as `prep_more` finishes while `mutate` is still running
+        @yf.step(creates="total", requires=["data", "prep_more"])
+        def total(self) -> int:
+            overlaps.extend(running)
+            return sum(self.results.data) + self.results.prep_more
+
+    analysis = MutatingAnalysis()
+    analysis.execute_all(workers=2)
+    assert overlaps == []
@@ -0,0 +1,236 @@
+import os
+import pickle
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+import yaflux as yf
+from yaflux._fingerprint import fingerprint
+
+
+def helper(parameters):
+    return parameters
+
+
+class ParameterAnalysis(yf.Base):
+    @yf.step(creates="attrs")
+    def by_attribute(self) -> int:
+        return self.parameters.alpha + self.parameters.beta.gamma
+
+    @yf.step(creates="keys")
+    def by_key(self) -> int:
+        return self.parameters["alpha"] * self.parameters.get("scale", 1)
+
+    @yf.step(creates="none")
+    def no_parameters(self) -> int:
+        return 1
+
+    @yf.step(creates="dynamic")
+    def dynamic_key(self) -> int:
+        name = "alpha"
+        return self.parameters[name]
+
+    @yf.step(creates="whole")
+    def whole(self) -> int:
+        return helper(self.parameters)
+
+    @yf.step(creates="items")
+    def items(self) -> int:
+        return len(self.parameters.items())
+
+    @yf.step(creates="dynamic_get")
+    def dynamic_get(self) -> int:
+        name = "alpha"
+        return self.parameters.get(name)
+
+    @yf.step(creates="method")
+    def method(self) -> int:
+        return self.parameters.setdefault("alpha", 1)
+
+    @yf.step(creates="helper_method")
+    def helper_method(self) -> int:
+        return self._scale()
+
+    @yf.step(creates="passes_self")
+    def passes_self(self) -> int:
+        return helper(self).parameters["alpha"]
+
+    @yf.step(creates="declared", parameters=["alpha"])
+    def declared(self) -> int:
+        return helper(self.parameters)["alpha"]
+
+    @yf.map_step(over="attrs_list", creates="mapped")
+    def mapped(self, item: int) -> int:
+        return item * self.parameters["scale"]
+
+    def _scale(self) -> int:
+        return self.parameters["scale"]
+
+
+def test_infer_attribute_access():
+    assert ParameterAnalysis.by_attribute.parameters == ["alpha", "beta"]
+
+
+def test_infer_key_access():
+    assert ParameterAnalysis.by_key.parameters == ["alpha", "scale"]
+
+
+def test_infer_no_parameters():
+    assert ParameterAnalysis.no_parameters.parameters == []
+
+
+def test_dynamic_access_depends_on_all():
+    assert ParameterAnalysis.dynamic_key.parameters is None
+    assert ParameterAnalysis.whole.parameters is None
+    assert ParameterAnalysis.items.parameters is None
+    assert ParameterAnalysis.dynamic_get.parameters is None
+    assert ParameterAnalysis.method.parameters is None
+    assert ParameterAnalysis.helper_method.parameters is None
+    assert ParameterAnalysis.passes_self.parameters is None
+
+
+def test_declared_parameters_take_precedence():
+    assert ParameterAnalysis.declared.parameters == ["alpha"]
+
+
+def test_map_step_inference():
+    assert ParameterAnalysis.mapped.parameters == ["scale"]
+
+
+def test_step_info_includes_parameters():
+    analysis = ParameterAnalysis(parameters=SimpleNamespace(alpha=1))
+    assert analysis.get_step_info("by_key")["parameters"] == ["alpha", "scale"]
+
+
+class StaleAnalysis(yf.Base):
+    @yf.step(creates="data")
+    def load_data(self) -> list[int]:
+        return list(range(self.parameters["n"]))
+
+    @yf.step(creates="scaled", requires="data")
+    def scale(self) -> list[int]:
+        return [x * self.parameters["factor"] for x in self.results.data]
+
+    @yf.step(creates="label")
+    def label(self) -> str:
+        return self.parameters["name"]
+
+
+def test_parameter_change_invalidates_readers_only():
+    analysis = StaleAnalysis(parameters={"n": 3, "factor": 2, "name": "a"})
+    analysis.execute_all()
+    assert analysis.stale_steps() == []
+
+    analysis.parameters["factor"] = 3
+    assert analysis.stale_steps() == ["scale"]
+
+    analysis.execute_all(mode="incremental")
+    assert analysis.results.scaled == [0, 3, 6]
+    assert analysis.stale_steps() == []
+
+    analysis.parameters["n"] = 2
+    assert analysis.stale_steps() == ["load_data", "scale"]
+
+
+def test_sweep_uses_inferred_parameters():
+    calls = []
+
+    class SweepAnalysis(yf.Base):
+        @yf.step(creates="data")
+        def load_data(self) -> list[int]:
+            calls.append(self.parameters["n"])
+            return list(range(self.parameters["n"]))
+
+        @yf.step(creates="total", requires="data")
+        def total(self) -> int:
+            return sum(self.results.data) * self.parameters["factor"]
+
+    grid = [{"n": 4, "factor": factor} for factor in range(5)]
+    analyses = yf.sweep(SweepAnalysis, grid)
+    assert calls == [4]
+    assert [a.results.total for a in analyses] == [6 * f for f in range(5)]
+
+
+class DynamicGetAnalysis(yf.Base):
+    @yf.step(creates="value")
+    def read_value(self) -> int:
+        name = "alpha"
+        return self.parameters.get(name)
+
+
+def test_dynamic_get_in_sweep():
+    analyses = yf.sweep(DynamicGetAnalysis, [{"alpha": 1}, {"alpha": 2}])
+    assert [a.results.value for a in analyses] == [1, 2]
+
+
+def test_dynamic_get_is_stale_on_any_change():
+    analysis = DynamicGetAnalysis(parameters={"alpha": 1})
+    analysis.execute_all()
+    assert analysis.stale_steps() == []
+
+    analysis.parameters["alpha"] = 2
+    assert analysis.stale_steps() == ["read_value"]
+
+
+def test_namespace_arrays_are_not_pickled(monkeypatch):
+    np = pytest.importorskip("numpy")
+    parameters = SimpleNamespace(alpha=np.arange(1000), beta=SimpleNamespace(gamma=1))
+    expected = fingerprint(parameters)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("parameters pickled while fingerprinting")
+
+    monkeypatch.setattr(pickle, "dumps", fail)
+    assert fingerprint(parameters) == expected
+    parameters.alpha[0] = -1
+    assert fingerprint(parameters) != expected
+
+
+class HelperAnalysis(yf.Base):
+    @yf.step(creates="value")
+    def read_value(self) -> int:
+        return self._scaled(10)
+
+    def _scaled(self, value: int) -> int:
+        return value * self.parameters["scale"]
+
+
+def test_helper_method_in_sweep():
+    analyses = yf.sweep(HelperAnalysis, [{"scale": 1}, {"scale": 2}])
+    assert [a.results.value for a in analyses] == [10, 20]
+
+
+def test_helper_method_is_stale_on_change():
+    analysis = HelperAnalysis(parameters={"scale": 1})
+    analysis.execute_all()
+    analysis.parameters["scale"] = 2
+    assert analysis.stale_steps() == ["read_value"]
+
+    analysis.execute_all(mode="incremental")
+    assert analysis.results.value == 20
+
+
+def test_dict_fingerprint_ignores_order():
+    assert fingerprint({"a": 1, "b": [2]}) == fingerprint({"b": [2], "a": 1})
+    assert fingerprint({"a": 1, "b": 2}) != fingerprint({"a": 2, "b": 1})
+
+
+def test_set_fingerprint_ignores_hash_seed():
+    code = (
+        "from yaflux._fingerprint import fingerprint; "
+        "print(fingerprint({'a': {'x', 'y', 'z'}, 'b': frozenset(['u', 'v'])}))"
+    )
+    digests = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+        ).stdout
+        for seed in ("1", "2", "3")
+    }
+    assert len(digests) == 1
+    assert fingerprint({1, 2}) != fingerprint(frozenset({1, 2}))
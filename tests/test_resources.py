@@ -0,0 +1,115 @@
+import threading
+import time
+
+import pytest
+
+import yaflux as yf
+from yaflux._resources import Resources, parse_memory
+
+DELAY = 0.05
+
+
+def test_parse_memory():
+    assert parse_memory(1024) == 1024
+    assert parse_memory("512MB") == 512 * 1024**2
+    assert parse_memory("16GB") == 16 * 1024**3
+    assert parse_memory("1.5 GiB") == int(1.5 * 1024**3)
+    with pytest.raises(ValueError):
+        parse_memory("16 parsecs")
+    with pytest.raises(ValueError):
+        parse_memory(-1)
+
+
+def test_parse_resources():
+    resources = Resources.parse({"cpus": 4, "memory": "16GB"})
+    assert resources.cpus == 4
+    assert resources.memory == 16 * 1024**3
+    assert Resources.parse(None) == Resources(cpus=1, memory=0)
+    with pytest.raises(ValueError):
+        Resources.parse({"gpus": 1})
+
+
+def _tracking_analysis():
+    lock = threading.Lock()
+    active = set()
+    overlaps = []
+
+    def enter(name):
+        with lock:
+            overlaps.append((name, frozenset(active)))
+            active.add(name)
+        time.sleep(DELAY)
+        with lock:
+            active.remove(name)
+
+    class HeavyAnalysis(yf.Base):
+        @yf.step(creates="heavy_a", resources={"cpus": 2, "memory": "12GB"})
+        def heavy_a(self) -> int:
+            enter("heavy_a")
+            return 1
+
+        @yf.step(creates="heavy_b", resources={"cpus": 2, "memory": "12GB"})
+        def heavy_b(self) -> int:
+            enter("heavy_b")
+            return 1
+
+        @yf.step(creates="light_a", resources={"memory": "1GB"})
+        def light_a(self) -> int:
+            enter("light_a")
+            return 1
+
+        @yf.step(creates="light_b")
+        def light_b(self) -> int:
+            enter("light_b")
+            return 1
+
+    return HeavyAnalysis(), overlaps
+
+
+def test_step_resources_declared():
+    analysis, _ = _tracking_analysis()
+    info = analysis.get_step_info("heavy_a")
+    assert info["resources"] == Resources(cpus=2, memory=12 * 1024**3)
+    assert analysis.get_step_info("light_b")["resources"] is None
+
+
+def test_resource_constrained_execution():
+    analysis, overlaps = _tracking_analysis()
+    analysis.execute_all(workers=4, resources={"cpus": 8, "memory": "16GB"})
+
+    assert len(analysis.completed_steps) == 4
+    for name, others in overlaps:
+        if name.startswith("heavy"):
+            assert not any(other.startswith("heavy") for other in others)
+
+    # Light steps still overlap with heavy ones
+    assert any(others for _, others in overlaps)
+
+
+def test_resource_unconstrained_execution():
+    analysis, overlaps = _tracking_analysis()
+    analysis.execute_all(workers=4)
+    assert any(
+        name.startswith("heavy") and any(o.startswith("heavy") for o in others)
+        for name, others in overlaps
+    )
+
+
+def test_measured_requirements():
+    analysis, overlaps = _tracking_analysis()
+    analysis.execute_all(
+        workers=4,
+        resources={"memory": "16GB"},
+        requirements={"light_b": {"memory": "15.5GB"}},
+    )
+    for name, others in overlaps:
+        if name == "light_b":
+            assert not others
+        else:
+            assert "light_b" not in others
+
+
+def test_oversized_step():
+    analysis, _ = _tracking_analysis()
+    with pytest.raises(yf.ExecutorResourceError):
+        analysis.execute_all(workers=4, resources={"cpus": 1})
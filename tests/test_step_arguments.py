@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+import yaflux as yf
+from yaflux._arguments import MAX_ARGUMENT_LENGTH, summarize_argument
+
+
+class ArgumentAnalysis(yf.Base):
+    @yf.step(creates="total")
+    def total(self, values, scale: float = 1.0) -> float:
+        return float(np.sum(values)) * scale
+
+    @yf.step(creates="uncaptured", capture_args=False)
+    def uncaptured(self, values) -> int:
+        return len(values)
+
+
+def test_scalars_are_kept():
+    assert summarize_argument("hello") == "hello"
+    assert summarize_argument(3) == "3"
+    assert summarize_argument(None) == "None"
+
+
+def test_long_values_are_truncated():
+    assert len(summarize_argument("x" * 10_000)) == MAX_ARGUMENT_LENGTH
+    assert len(summarize_argument(list(range(10_000)))) <= MAX_ARGUMENT_LENGTH
+    assert summarize_argument(list(range(10_000))).endswith("...]")
+
+
+def test_array_summary():
+    array = np.arange(12, dtype=np.int64).reshape(3, 4)
+    summary = summarize_argument(array)
+    assert summary.startswith("ndarray(shape=(3, 4), dtype=int64, fingerprint=")
+
+    # Equal content gives equal summaries
+    assert summary == summarize_argument(array.copy())
+    assert summary != summarize_argument(array + 1)
+
+
+def test_large_array_is_not_fingerprinted():
+    summary = summarize_argument(np.zeros(1_000_000))
+    assert summary == "ndarray(shape=(1000000,), dtype=float64)"
+
+
+def test_frame_summary():
+    frame = pd.DataFrame({"a": [1, 2, 3], "b": [4.0, 5.0, 6.0]})
+    assert summarize_argument(frame).startswith("DataFrame(shape=(3, 2), ")
+    assert summarize_argument(frame["a"]).startswith("Series(shape=(3,), dtype=int64, ")
+
+
+def test_nested_arrays_are_summarized():
+    summary = summarize_argument({"x": np.zeros(1_000_000)})
+    assert summary == "{'x': ndarray(shape=(1000000,), dtype=float64)}"
+
+
+def test_step_metadata_arguments():
+    analysis = ArgumentAnalysis()
+    analysis.total(np.ones(1_000_000), scale=2.0)
+
+    metadata = analysis.get_step_metadata("total")
+    assert metadata.args == ["ndarray(shape=(1000000,), dtype=float64)"]
+    assert metadata.kwargs == {"scale": "2.0"}
+
+
+def test_capture_opt_out():
+    analysis = ArgumentAnalysis()
+    analysis.uncaptured(list(range(100)))
+
+    metadata = analysis.get_step_metadata("uncaptured")
+    assert metadata.args == []
+    assert metadata.kwargs == {}
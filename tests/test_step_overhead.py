@@ -0,0 +1,88 @@
+import inspect
+import os
+import time
+
+import pytest
+
+import yaflux as yf
+import yaflux._step
+
+# Bound on the framework overhead of a step call in seconds. The measured floor
+# is about 11us for both skipped and completed calls, and grows with the load of
+# the machine, so the bound is only checked when benchmarks are requested with
+# YAFLUX_BENCHMARK=1.
+STEP_OVERHEAD_TARGET = 30e-6
+BENCHMARK = os.environ.get("YAFLUX_BENCHMARK") == "1"
+
+
+class TinyAnalysis(yf.Base):
+    @yf.step(creates="_done")
+    def tiny(self):
+        return None
+
+    @yf.step(creates="value", requires="_done")
+    def tiny_result(self, offset: int = 0) -> int:
+        return offset
+
+
+def _per_call(func, n: int = 2000, repeat: int = 5) -> float:
+    """Fastest mean duration of a call over a few batches."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(n):
+            func()
+        timings.append((time.perf_counter() - start) / n)
+    return min(timings)
+
+
+def _raw_tiny():
+    return None
+
+
+def test_step_overhead():
+    analysis = TinyAnalysis()
+    analysis.tiny()
+
+    overhead = _per_call(analysis.tiny) - _per_call(_raw_tiny)
+    print(f"step overhead: {overhead * 1e6:.1f}us")
+
+
+@pytest.mark.skipif(not BENCHMARK, reason="set YAFLUX_BENCHMARK=1 to run")
+def test_step_overhead_target():
+    analysis = TinyAnalysis()
+    analysis.tiny()
+
+    overhead = _per_call(analysis.tiny) - _per_call(_raw_tiny)
+    assert overhead < STEP_OVERHEAD_TARGET
+
+
+def test_signature_is_not_inspected_per_call(monkeypatch):
+    analysis = TinyAnalysis()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("signature inspected during a step call")
+
+    monkeypatch.setattr(inspect, "signature", fail)
+    analysis.tiny()
+    assert analysis.tiny_result(offset=3, unused=1) == 3
+    assert analysis.get_step_metadata("tiny_result").kwargs == {"offset": "3"}
+
+
+def test_repeated_calls_are_ordered_once():
+    analysis = TinyAnalysis()
+    for _ in range(3):
+        analysis.tiny()
+    assert analysis._step_ordering == ["tiny"]
+
+
+def test_skipped_steps_do_not_fingerprint_parameters(monkeypatch):
+    analysis = TinyAnalysis()
+    analysis.tiny()
+    analysis.tiny_result()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("parameters fingerprinted for a skipped step")
+
+    monkeypatch.setattr(yaflux._step, "fingerprint_parameters", fail)
+    assert analysis.tiny_result() == {"value": 0}
@@ -0,0 +1,107 @@
+import tarfile
+import time
+
+import numpy as np
+import pytest
+
+import yaflux as yf
+
+
+class StreamAnalysis(yf.Base):
+    @yf.step(creates="blocks", buffer_size=2)
+    def read_blocks(self):
+        for i in range(self.parameters["n_blocks"]):
+            yield np.full(4, i)
+
+    @yf.step(creates="scaled", requires="blocks")
+    def scale_blocks(self):
+        for block in self.results.blocks:
+            yield block * self.parameters["scale"]
+
+    @yf.step(creates="total", requires="scaled")
+    def sum_blocks(self) -> int:
+        return int(sum(block.sum() for block in self.results.scaled))
+
+
+def test_streaming_chain():
+    analysis = StreamAnalysis(parameters={"n_blocks": 5, "scale": 2})
+    analysis.execute_all()
+
+    assert isinstance(analysis.results.blocks, yf.ChunkStream)
+    assert isinstance(analysis.results.scaled, yf.ChunkStream)
+    assert analysis.results.total == 4 * 2 * sum(range(5))
+
+
+def test_stream_is_replayable():
+    analysis = StreamAnalysis(parameters={"n_blocks": 3, "scale": 1})
+    analysis.execute(target_step="scale_blocks")
+
+    first = [block.tolist() for block in analysis.results.scaled]
+    second = [block.tolist() for block in analysis.results.scaled.collect()]
+    assert first == second == [[0] * 4, [1] * 4, [2] * 4]
+
+
+def test_stream_buffer_is_bounded():
+    produced = []
+
+    def chunks():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    stream = yf.ChunkStream(chunks, buffer_size=2)
+    iterator = iter(stream)
+    assert next(iterator) == 0
+
+    # The producer can only run ahead of the consumer by the buffer size
+    time.sleep(0.2)
+    assert len(produced) <= 4
+    iterator.close()
+
+
+def test_stream_producer_error():
+    def chunks():
+        yield 1
+        raise RuntimeError("bad chunk")
+
+    stream = yf.ChunkStream(chunks)
+    with pytest.raises(RuntimeError, match="bad chunk"):
+        stream.collect()
+
+
+def test_streaming_step_must_create_one_result():
+    with pytest.raises(ValueError, match="exactly one result"):
+
+        class BadAnalysis(yf.Base):
+            @yf.step(creates=["a", "b"])
+            def stream(self):
+                yield 1
+
+
+def test_streaming_step_cannot_mutate():
+    with pytest.raises(ValueError, match="cannot mutate"):
+
+        class BadAnalysis(yf.Base):
+            @yf.step(creates="a", mutates="b")
+            def stream(self):
+                yield self.results.b
+
+
+def test_stream_save_load(tmp_path):
+    analysis = StreamAnalysis(parameters={"n_blocks": 4, "scale": 3})
+    analysis.execute_all()
+
+    path = str(tmp_path / "stream.yax")
+    analysis.save(path)
+
+    # Chunks are stored as separate archive members
+    with tarfile.open(path) as tar:
+        names = tar.getnames()
+    assert "results/scaled/00000000.npy" in names
+    assert "results/scaled/00000003.npy" in names
+
+    loaded = yf.load(path)
+    blocks = loaded.results.scaled
+    assert isinstance(blocks, yf.ChunkStream)
+    assert [b.tolist() for b in blocks] == [[3 * i] * 4 for i in range(4)]
+    assert loaded.results.total == analysis.results.total
@@ -0,0 +1,120 @@
+import threading
+from collections import Counter
+from types import SimpleNamespace
+
+import yaflux as yf
+
+CALLS = Counter()
+LOCK = threading.Lock()
+
+
+def record(name: str):
+    with LOCK:
+        CALLS[name] += 1
+
+
+class SweepAnalysis(yf.Base):
+    @yf.step(creates="data", parameters="dataset")
+    def load_data(self) -> list[int]:
+        record("load_data")
+        return list(range(self.parameters["dataset"]))
+
+    @yf.step(creates="filtered", requires="data", parameters="threshold")
+    def filter_data(self) -> list[int]:
+        record("filter_data")
+        return [x for x in self.results.data if x >= self.parameters["threshold"]]
+
+    @yf.step(creates="scaled", requires="filtered", parameters=["scale"])
+    def scale_data(self) -> list[int]:
+        record("scale_data")
+        return [x * self.parameters["scale"] for x in self.results.filtered]
+
+    @yf.step(creates="summary", requires="scaled")
+    def summarize(self) -> int:
+        record("summarize")
+        return sum(self.results.scaled)
+
+
+def grid() -> list[dict]:
+    return [
+        {"dataset": 10, "threshold": threshold, "scale": scale}
+        for threshold in (2, 5)
+        for scale in (1, 2, 3)
+    ]
+
+
+def expected(params: dict) -> int:
+    return sum(
+        x * params["scale"]
+        for x in range(params["dataset"])
+        if x >= params["threshold"]
+    )
+
+
+def test_sweep_dedupes_shared_steps():
+    CALLS.clear()
+    analyses = yf.sweep(SweepAnalysis, grid())
+
+    assert [a.results.summary for a in analyses] == [expected(p) for p in grid()]
+    assert CALLS["load_data"] == 1
+    assert CALLS["filter_data"] == 2
+    assert CALLS["scale_data"] == 6
+    # summarize reads no parameters but its input differs in every variant
+    assert CALLS["summarize"] == 6
+
+    for analysis in analyses:
+        assert set(analysis.completed_steps) == set(analysis.available_steps)
+        assert analysis.stale_steps() == []
+
+
+def test_sweep_parallel():
+    CALLS.clear()
+    analyses = yf.sweep(SweepAnalysis, grid(), workers=4)
+    assert [a.results.summary for a in analyses] == [expected(p) for p in grid()]
+    assert CALLS["load_data"] == 1
+
+
+def test_sweep_target_step():
+    CALLS.clear()
+    analyses = yf.sweep(SweepAnalysis, grid(), target_step="filter_data")
+    assert "summarize" not in CALLS
+    assert analyses[0].results.filtered == list(range(2, 10))
+
+
+def test_sweep_attribute_parameters():
+    CALLS.clear()
+    params = [SimpleNamespace(dataset=4, threshold=0, scale=s) for s in (1, 2)]
+
+    class NamespaceAnalysis(yf.Base):
+        @yf.step(creates="data", parameters="dataset")
+        def load_data(self) -> list[int]:
+            record("ns_load")
+            return list(range(self.parameters.dataset))
+
+        @yf.step(creates="total", requires="data", parameters="scale")
+        def total(self) -> int:
+            return sum(self.results.data) * self.parameters.scale
+
+    analyses = yf.sweep(NamespaceAnalysis, params)
+    assert [a.results.total for a in analyses] == [6, 12]
+    assert CALLS["ns_load"] == 1
+
+
+def test_sweep_isolates_mutations():
+    class MutatingAnalysis(yf.Base):
+        @yf.step(creates="values", parameters=[])
+        def load_values(self) -> list[int]:
+            return [1, 2, 3]
+
+        @yf.step(mutates="values", creates="_shifted", parameters="offset")
+        def shift(self):
+            for i in range(len(self.results.values)):
+                self.results.values[i] += self.parameters["offset"]
+
+    analyses = yf.sweep(MutatingAnalysis, [{"offset": 1}, {"offset": 10}])
+    assert analyses[0].results.values == [2, 3, 4]
+    assert analyses[1].results.values == [11, 12, 13]
+
+
+def test_sweep_empty():
+    assert yf.sweep(SweepAnalysis, []) == []
@@ -0,0 +1,98 @@
+import json
+import os
+import threading
+
+import yaflux as yf
+
+OUTPUT_PATH = "trace_tmp.yax"
+TRACE_PATH = "trace_tmp.json"
+
+
+class TracedAnalysis(yf.Base):
+    @yf.step(creates="res_a")
+    def step_a(self) -> int:
+        return 42
+
+    @yf.step(creates="res_b", requires="res_a")
+    def step_b(self) -> list[int]:
+        return [self.results.res_a] * 10
+
+
+def _complete_events(trace: dict) -> list[dict]:
+    return [e for e in trace["traceEvents"] if e["ph"] == "X"]
+
+
+def test_trace_steps():
+    analysis = TracedAnalysis()
+    with yf.trace() as recorder:
+        analysis.execute_all()
+
+    names = [e.name for e in recorder.events if e.category == "step"]
+    assert names == ["step_a", "step_b"]
+
+    trace = recorder.to_chrome_trace()
+    events = _complete_events(trace)
+    assert len(events) == 2
+    for event in events:
+        assert event["tid"] == threading.get_ident()
+        assert event["pid"] == os.getpid()
+        assert event["dur"] >= 0
+
+    # Lanes are named with metadata events
+    lanes = [e for e in trace["traceEvents"] if e["ph"] == "M"]
+    assert {e["name"] for e in lanes} == {"process_name", "thread_name"}
+
+
+def test_trace_inactive():
+    analysis = TracedAnalysis()
+    with yf.trace() as recorder:
+        pass
+    analysis.execute_all()
+    assert recorder.events == []
+
+
+def test_trace_save_and_load():
+    analysis = TracedAnalysis()
+    try:
+        with yf.trace() as recorder:
+            analysis.execute_all()
+            analysis.save(OUTPUT_PATH, force=True)
+            yf.load(OUTPUT_PATH)
+
+        categories = [e.category for e in recorder.events]
+        assert categories.count("io") == 2
+        assert categories.count("serialize") == 2
+        assert categories.count("deserialize") == 2
+
+        # Serialization spans are nested within the save span
+        save = next(e for e in recorder.events if e.name == "save")
+        for event in recorder.events:
+            if event.category == "serialize":
+                assert event.start >= save.start
+                assert event.start + event.elapsed <= save.start + save.elapsed
+
+        recorder.save(TRACE_PATH)
+        with open(TRACE_PATH) as f:
+            assert json.load(f) == json.loads(json.dumps(recorder.to_chrome_trace()))
+    finally:
+        for path in (OUTPUT_PATH, TRACE_PATH):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def test_trace_from_archive():
+    analysis = TracedAnalysis()
+    analysis.execute_all()
+    try:
+        analysis.save(OUTPUT_PATH, force=True)
+        trace = yf.load_trace(OUTPUT_PATH)
+    finally:
+        if os.path.exists(OUTPUT_PATH):
+            os.remove(OUTPUT_PATH)
+
+    events = _complete_events(trace)
+    assert {e["name"] for e in events} == {"step_a", "step_b"}
+    for event in events:
+        metadata = analysis.get_step_metadata(event["name"])
+        assert event["tid"] == metadata.thread_id
+        assert abs(event["dur"] - metadata.elapsed * 1e6) < 1
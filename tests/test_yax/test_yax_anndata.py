@@ -1,7 +1,10 @@
 import os
+import tempfile
 
 import anndata as ad
 import numpy as np
+import pandas as pd
+import pytest
 
 import yaflux as yf
 from yaflux._yax._serializer import SerializerRegistry
@@ -71,3 +74,162 @@ def test_serde_without_anndata():
         SerializerRegistry._serializers = original_serializers
         if os.path.exists(OUTPUT):
             os.remove(OUTPUT)
+
+
+@pytest.mark.parametrize("extension", [".yax", ".yax.gz", ".yax.zip", ".yaxd"])
+def test_load_anndata_without_temporary_files(tmp_path, monkeypatch, extension):
+    analysis = Analysis()
+    analysis.execute()
+    path = str(tmp_path / f"adata{extension}")
+    analysis.save(path)
+
+    def no_temporary_file(*args, **kwargs):
+        raise AssertionError("AnnData should be read directly from the archive")
+
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", no_temporary_file)
+    loaded = yf.load(path)
+    np.testing.assert_array_equal(loaded.results.adata.X, analysis.results.adata.X)
+
+
+def test_load_anndata_backed(tmp_path):
+    analysis = Analysis()
+    analysis.execute()
+    path = str(tmp_path / "adata.yaxd")
+    analysis.save(path)
+
+    loaded = yf.load(path, backed="adata")
+    adata = loaded.results.adata
+    assert adata.isbacked
+    assert os.path.samefile(adata.filename, tmp_path / "adata.yaxd/results/adata.h5ad")
+    np.testing.assert_array_equal(adata.X[:10], analysis.results.adata.X[:10])
+    adata.file.close()
+
+
+def test_load_anndata_backed_requires_files(tmp_path):
+    analysis = Analysis()
+    analysis.execute()
+    path = str(tmp_path / "adata.yax")
+    analysis.save(path)
+
+    with pytest.raises(ValueError, match="directory archive"):
+        yf.load(path, backed="adata")
+
+
+def test_load_backed_unsupported_format(tmp_path):
+    class ListAnalysis(yf.Base):
+        @yf.step(creates="values")
+        def create_values(self) -> list[int]:
+            return [1, 2, 3]
+
+    analysis = ListAnalysis()
+    analysis.execute()
+    path = str(tmp_path / "values.yaxd")
+    analysis.save(path)
+
+    with pytest.raises(ValueError, match="does not support backed mode"):
+        yf.load(path, backed=["values"])
+
+
+class AnnotatedAnalysis(yf.Base):
+    @yf.step(creates="adata")
+    def create_anndata(self) -> ad.AnnData:
+        rng = np.random.default_rng(0)
+        adata = ad.AnnData(
+            X=rng.random((N_CELLS, N_GENES)),
+            obs=pd.DataFrame(
+                {
+                    "cell_type": pd.Categorical(["a", "b"] * (N_CELLS // 2)),
+                    "n_genes": np.arange(N_CELLS),
+                },
+                index=pd.Index([f"cell_{i}" for i in range(N_CELLS)], name="cell"),
+            ),
+            var=pd.DataFrame(index=[f"gene_{i}" for i in range(N_GENES)]),
+        )
+        adata.obsm["X_umap"] = rng.random((N_CELLS, 2))
+        adata.obsm["X_pca"] = rng.random((N_CELLS, 10))
+        adata.layers["counts"] = np.ones((N_CELLS, N_GENES))
+        adata.uns["params"] = {"resolution": 1.0}
+        return adata
+
+
+@pytest.fixture
+def annotated(tmp_path):
+    analysis = AnnotatedAnalysis()
+    analysis.execute()
+    path = str(tmp_path / "annotated.yax")
+    analysis.save(path)
+    return analysis.results.adata, path
+
+
+def test_load_anndata_components(annotated):
+    adata, path = annotated
+    loaded = yf.load(path, components={"adata": ["obs", "obsm/X_umap"]}).results.adata
+
+    assert loaded.shape == adata.shape
+    assert loaded.X is None
+    assert list(loaded.obsm) == ["X_umap"]
+    assert not loaded.layers
+    assert not loaded.uns
+    pd.testing.assert_frame_equal(loaded.obs, adata.obs)
+    np.testing.assert_array_equal(loaded.obsm["X_umap"], adata.obsm["X_umap"])
+    assert loaded.var_names.equals(adata.var_names)
+
+
+def test_load_anndata_component_keys(annotated):
+    adata, path = annotated
+    loaded = yf.load(
+        path, components={"adata": ["X", "obs/cell_type", "layers", "uns"]}
+    ).results.adata
+
+    np.testing.assert_array_equal(loaded.X, adata.X)
+    assert list(loaded.obs.columns) == ["cell_type"]
+    assert loaded.obs.index.name == "cell"
+    pd.testing.assert_series_equal(loaded.obs["cell_type"], adata.obs["cell_type"])
+    np.testing.assert_array_equal(loaded.layers["counts"], adata.layers["counts"])
+    assert loaded.uns["params"]["resolution"] == 1.0
+    assert not loaded.obsm
+
+
+def test_load_anndata_components_reads_only_requested(annotated, monkeypatch):
+    _, path = annotated
+    read = []
+    read_elem = ad.io.read_elem
+
+    def tracking_read_elem(elem):
+        read.append(elem.name)
+        return read_elem(elem)
+
+    monkeypatch.setattr(ad.io, "read_elem", tracking_read_elem)
+    yf.load(path, components={"adata": ["obsm/X_umap"]})
+    assert sorted(read) == ["/obs/cell", "/obsm/X_umap", "/var/_index"]
+
+
+@pytest.mark.parametrize(
+    ("components", "match"),
+    [(["obsm/missing"], "not found"), (["raw"], "Invalid AnnData component")],
+)
+def test_load_anndata_invalid_components(annotated, components, match):
+    _, path = annotated
+    with pytest.raises(ValueError, match=match):
+        yf.load(path, components={"adata": components})
+
+
+def test_load_components_cannot_combine_with_backed(annotated):
+    _, path = annotated
+    with pytest.raises(ValueError, match="Cannot combine"):
+        yf.load(path, components={"adata": ["obs"]}, backed="adata")
+
+
+def test_load_components_unsupported_format(tmp_path):
+    class ListAnalysis(yf.Base):
+        @yf.step(creates="values")
+        def create_values(self) -> list[int]:
+            return [1, 2, 3]
+
+    analysis = ListAnalysis()
+    analysis.execute()
+    path = str(tmp_path / "values.yax")
+    analysis.save(path)
+
+    with pytest.raises(ValueError, match="does not support loading components"):
+        yf.load(path, components={"values": ["obs"]})
@@ -0,0 +1,218 @@
+import tempfile
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+from _utils import _save_result
+
+import yaflux as yf
+from yaflux._yax import ArchiveSerializer
+from yaflux._yax._serializer._formats import (
+    ArrowTableSerializer,
+    PandasSeriesSerializer,
+    PickleSerializer,
+    PolarsSerializer,
+)
+
+N_ROWS = 200
+
+
+def _table() -> pa.Table:
+    rng = np.random.default_rng(0)
+    return pa.table(
+        {
+            "a": np.arange(N_ROWS),
+            "b": rng.normal(size=N_ROWS),
+            "c": [f"row{i}" for i in range(N_ROWS)],
+        },
+        metadata={b"source": b"test"},
+    )
+
+
+def _format(path):
+    return ArchiveSerializer.read_manifest(path)["results"]["value"]["format"]
+
+
+@pytest.fixture
+def small_batches(monkeypatch):
+    for serializer in (ArrowTableSerializer, PandasSeriesSerializer, PolarsSerializer):
+        monkeypatch.setattr(serializer, "BATCH_ROWS", 64)
+
+
+def test_arrow_table_roundtrip(tmp_path):
+    value = _table()
+    path = _save_result(tmp_path, value)
+    assert _format(path) == ArrowTableSerializer.FORMAT
+
+    loaded = yf.load(path).results.value
+    assert isinstance(loaded, pa.Table)
+    assert loaded.equals(value)
+    assert loaded.schema.metadata == value.schema.metadata
+
+
+def test_record_batch_roundtrip(tmp_path):
+    value = _table().to_batches()[0]
+    loaded = yf.load(_save_result(tmp_path, value)).results.value
+    assert isinstance(loaded, pa.RecordBatch)
+    assert loaded.equals(value)
+
+
+def test_empty_record_batch_roundtrip(tmp_path):
+    value = pa.RecordBatch.from_pylist([], schema=_table().schema)
+    loaded = yf.load(_save_result(tmp_path, value)).results.value
+    assert isinstance(loaded, pa.RecordBatch)
+    assert loaded.num_rows == 0
+    assert loaded.schema.names == value.schema.names
+
+
+def test_polars_roundtrip(tmp_path):
+    value = pl.from_arrow(_table())
+    path = _save_result(tmp_path, value)
+    assert _format(path) == PolarsSerializer.FORMAT
+
+    loaded = yf.load(path).results.value
+    assert isinstance(loaded, pl.DataFrame)
+    assert loaded.equals(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pd.Series(np.arange(10.0), name="score"),
+        pd.Series(np.arange(10), index=[f"cell{i}" for i in range(10)]),
+        pd.Series(["x", "y", None], name="label", dtype="string"),
+        pd.Series(pd.Categorical(["a", "b", "a"]), name="group"),
+    ],
+    ids=["named", "unnamed", "string", "categorical"],
+)
+def test_series_roundtrip(tmp_path, value):
+    path = _save_result(tmp_path, value)
+    assert _format(path) == PandasSeriesSerializer.FORMAT
+    pd.testing.assert_series_equal(yf.load(path).results.value, value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pd.RangeIndex(5, 25, 2, name="position"),
+        pd.Index([f"gene{i}" for i in range(10)], name="gene"),
+        pd.MultiIndex.from_product([["a", "b"], [1, 2]], names=["x", "y"]),
+    ],
+    ids=["range", "labels", "multi"],
+)
+def test_index_roundtrip(tmp_path, value):
+    path = _save_result(tmp_path, value)
+    assert _format(path) == PandasSeriesSerializer.FORMAT
+    pd.testing.assert_index_equal(yf.load(path).results.value, value, exact=True)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        pd.Series([{"a": 1}, {"b": 2}, "x"], name="mixed"),
+        pd.DataFrame({"a": [1, 2, 3], "b": [{"a": 1}, "x", 2]}),
+        pd.Index([1, "a", (2, 3)], name="mixed"),
+    ],
+    ids=["series", "frame", "index"],
+)
+def test_mixed_objects_are_pickled(tmp_path, value):
+    path = _save_result(tmp_path, value)
+    assert _format(path) == PickleSerializer.FORMAT
+
+    loaded = yf.load(path).results.value
+    if isinstance(value, pd.Index):
+        pd.testing.assert_index_equal(loaded, value, exact=True)
+    elif isinstance(value, pd.Series):
+        pd.testing.assert_series_equal(loaded, value)
+    else:
+        pd.testing.assert_frame_equal(loaded, value)
+
+
+def test_failed_conversion_leaves_no_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    with pytest.raises(pa.ArrowInvalid):
+        PandasSeriesSerializer.serialize(pd.Series([{"a": 1}, {"b": 2}, "x"]))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_arrow_table_projection(tmp_path, small_batches):
+    value = _table()
+    path = _save_result(tmp_path, value)
+
+    loaded = yf.load(path, columns={"value": ["c", "a"]}).results.value
+    assert loaded.equals(value.select(["a", "c"]))
+
+    loaded = yf.load(path, rows={"value": slice(50, 150)}).results.value
+    assert loaded.equals(value.slice(50, 100))
+
+
+def test_polars_projection(tmp_path, small_batches):
+    value = pl.from_arrow(_table())
+    path = _save_result(tmp_path, value)
+
+    loaded = yf.load(
+        path, columns={"value": ["b"]}, rows={"value": slice(10, 140)}
+    ).results.value
+    assert isinstance(loaded, pl.DataFrame)
+    assert loaded.equals(value.select("b").slice(10, 130))
+
+
+def test_projection_reads_overlapping_batches(tmp_path, small_batches, monkeypatch):
+    path = _save_result(tmp_path, _table())
+
+    read = []
+    get_batch = pa.ipc.RecordBatchFileReader.get_batch
+
+    def tracked(self, i):
+        read.append(i)
+        return get_batch(self, i)
+
+    monkeypatch.setattr(pa.ipc.RecordBatchFileReader, "get_batch", tracked)
+    yf.load(path, rows={"value": slice(70, 100)})
+    assert read == [1]
+
+
+def test_series_row_projection(tmp_path, small_batches):
+    value = pd.Series(np.arange(N_ROWS), name="count")
+    path = _save_result(tmp_path, value)
+
+    loaded = yf.load(path, rows={"value": slice(100, 180)}).results.value
+    pd.testing.assert_series_equal(loaded, value.iloc[100:180])
+
+
+@pytest.mark.parametrize(
+    "value",
+    [pd.Index([f"gene{i}" for i in range(N_ROWS)]), pd.RangeIndex(0, 3 * N_ROWS, 3)],
+    ids=["labels", "range"],
+)
+def test_index_row_projection(tmp_path, small_batches, value):
+    path = _save_result(tmp_path, value)
+
+    loaded = yf.load(path, rows={"value": slice(-10, None)}).results.value
+    pd.testing.assert_index_equal(loaded, value[-10:], exact=True)
+
+
+def test_series_rejects_columns(tmp_path):
+    path = _save_result(tmp_path, pd.Series(np.arange(10), name="count"))
+    with pytest.raises(ValueError, match="Series or an Index"):
+        yf.load(path, columns={"value": ["count"]})
+
+
+def test_missing_columns(tmp_path):
+    path = _save_result(tmp_path, _table())
+    with pytest.raises(ValueError, match="Columns not found in Arrow table"):
+        yf.load(path, columns={"value": ["missing"]})
+
+
+def test_directory_archive_is_memory_mapped(tmp_path):
+    value = _table()
+    path = _save_result(tmp_path, value, "arrow.yaxd")
+
+    loaded = yf.load(path).results.value
+    assert loaded.equals(value)
+    # Buffers of memory mapped files are not owned by the default memory pool
+    before = pa.total_allocated_bytes()
+    yf.load(path)
+    assert pa.total_allocated_bytes() == before
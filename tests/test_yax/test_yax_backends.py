@@ -0,0 +1,188 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+import yaflux as yf
+from yaflux._yax import (
+    ArchiveSerializer,
+    BackendRegistry,
+    DirectoryBackend,
+    SqliteBackend,
+    TarBackend,
+    ZipBackend,
+)
+
+BACKENDS = {
+    ".yax": TarBackend,
+    ".yax.gz": TarBackend,
+    ".yax.zip": ZipBackend,
+    ".yaxd": DirectoryBackend,
+    ".yax.sqlite": SqliteBackend,
+}
+
+
+class BackendAnalysis(yf.Base):
+    @yf.step(creates="matrix")
+    def create_matrix(self) -> np.ndarray:
+        return np.arange(200, dtype=np.float64).reshape(20, 10)
+
+    @yf.step(creates="labels")
+    def create_labels(self) -> list[str]:
+        return [f"label_{i}" for i in range(self.parameters["n_labels"])]
+
+    @yf.step(creates="blocks")
+    def create_blocks(self):
+        for i in range(3):
+            yield np.full(2, i)
+
+
+@pytest.fixture
+def analysis():
+    analysis = BackendAnalysis(parameters={"n_labels": 3})
+    analysis.execute_all()
+    return analysis
+
+
+@pytest.mark.parametrize("extension", list(BACKENDS))
+def test_backend_for_extension(extension):
+    assert BackendRegistry.for_path(f"analysis{extension}") is BACKENDS[extension]
+    assert BackendRegistry.for_path("analysis") is TarBackend
+
+
+@pytest.mark.parametrize("extension", list(BACKENDS))
+def test_roundtrip(tmp_path, analysis, extension):
+    path = str(tmp_path / f"analysis{extension}")
+    analysis.save(path)
+    assert BackendRegistry.for_archive(path) is BACKENDS[extension]
+
+    loaded = yf.load(path)
+    assert np.array_equal(loaded.results.matrix, analysis.results.matrix)
+    assert loaded.results.labels == analysis.results.labels
+    assert [b.tolist() for b in loaded.results.blocks] == [[0, 0], [1, 1], [2, 2]]
+    assert loaded.parameters == {"n_labels": 3}
+
+    loaded = yf.load(path, select="labels")
+    assert loaded.results.labels == analysis.results.labels
+    assert not hasattr(loaded.results, "matrix")
+
+
+@pytest.mark.parametrize("extension", [".yax", ".yax.zip", ".yaxd", ".yax.sqlite"])
+def test_member_access(tmp_path, analysis, extension):
+    path = str(tmp_path / f"analysis{extension}")
+    analysis.save(path)
+
+    backend = BACKENDS[extension]
+    with backend(path, "r") as archive:
+        members = set(archive.list_members())
+        assert {"metadata.pkl", "manifest.json", "results/matrix.npy"} <= members
+        assert "results/blocks/00000002.npy" in members
+
+        full = archive.read_member("results/labels.pkl")
+        assert archive.read_member("results/labels.pkl", 2, 5) == full[2:7]
+        assert archive.read_member("results/labels.pkl", 3) == full[3:]
+
+        with pytest.raises(KeyError):
+            archive.read_member("results/missing.pkl")
+
+
+def test_explicit_backend(tmp_path, analysis):
+    path = str(tmp_path / "analysis.archive")
+    analysis.save(path, backend=ZipBackend)
+    assert os.path.exists(path + ".yax.zip")
+    assert yf.load(path + ".yax.zip").results.labels == analysis.results.labels
+
+
+def test_sqlite_update(tmp_path, analysis, monkeypatch):
+    path = str(tmp_path / "analysis.yax.sqlite")
+    analysis.save(path)
+
+    analysis.parameters["n_labels"] = 5
+    analysis.create_labels(force=True)
+
+    serialized = []
+    serialize = ArchiveSerializer._serialize
+
+    def record(key, value, *args):
+        serialized.append(key)
+        return serialize(key, value, *args)
+
+    monkeypatch.setattr(ArchiveSerializer, "_serialize", record)
+    analysis.save(path, force=True)
+
+    assert serialized == ["labels"]
+    assert len(yf.load(path).results.labels) == 5
+
+
+def test_compressed_sqlite(tmp_path, analysis):
+    # Members are stored as they are, only their formats may compress them
+    path = str(tmp_path / "analysis.yax.sqlite")
+    analysis.save(path, compress=True)
+    assert yf.load(path).results.labels == analysis.results.labels
+
+
+class SmallResults(yf.Base):
+    @yf.step(creates=[f"value_{i}" for i in range(200)])
+    def create_values(self) -> dict:
+        return {f"value_{i}": list(range(i)) for i in range(200)}
+
+
+@pytest.mark.parametrize("extension", [".yax", ".yax.zip", ".yaxd", ".yax.sqlite"])
+def test_benchmark_many_small_results(tmp_path, extension):
+    """Compare saving and selectively loading archives of many small results.
+
+    Run with `pytest -s` to print the timings of each backend.
+    """
+    analysis = SmallResults()
+    analysis.create_values()
+    path = str(tmp_path / f"small{extension}")
+
+    start = time.perf_counter()
+    analysis.save(path)
+    save_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    loaded = yf.load(path, select="value_199")
+    load_time = time.perf_counter() - start
+
+    assert loaded.results.value_199 == list(range(199))
+    print(f"{extension}: save {save_time * 1e3:.1f}ms, select {load_time * 1e3:.1f}ms")
+
+
+class LargeResults(yf.Base):
+    @yf.step(creates=["large_a", "large_b"])
+    def create_large(self) -> tuple[np.ndarray, np.ndarray]:
+        return np.ones((1000, 1000)), np.zeros((1000, 1000))
+
+
+@pytest.mark.parametrize("extension", [".yax", ".yax.zip", ".yaxd", ".yax.sqlite"])
+def test_benchmark_few_large_results(tmp_path, extension):
+    """Compare saving and loading archives of a few large results."""
+    analysis = LargeResults()
+    analysis.create_large()
+    path = str(tmp_path / f"large{extension}")
+
+    start = time.perf_counter()
+    analysis.save(path)
+    save_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    loaded = yf.load(path, select="large_b")
+    load_time = time.perf_counter() - start
+
+    assert loaded.results.large_b.shape == (1000, 1000)
+    print(f"{extension}: save {save_time * 1e3:.1f}ms, select {load_time * 1e3:.1f}ms")
+
+
+def test_custom_backend(tmp_path, analysis, monkeypatch):
+    class ScratchBackend(DirectoryBackend):
+        EXTENSIONS = (".scratch",)
+
+    monkeypatch.setattr(BackendRegistry, "_backends", list(BackendRegistry._backends))
+    BackendRegistry.register(ScratchBackend)
+
+    path = str(tmp_path / "analysis.scratch")
+    analysis.save(path)
+    assert os.path.isdir(path)
+    assert yf.load(path).results.labels == analysis.results.labels
@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+
+import yaflux as yf
+from yaflux._yax import ArchiveSerializer
+
+BACKENDS = [".yax", ".yax.zip", ".yaxd", ".yax.sqlite"]
+
+
+class MatrixAnalysis(yf.Base):
+    @yf.step(creates="matrix")
+    def create_matrix(self) -> np.ndarray:
+        return np.arange(100 * 30, dtype=np.float32).reshape(100, 30)
+
+    @yf.step(creates="cube")
+    def create_cube(self) -> np.ndarray:
+        return np.arange(6 * 5 * 4).reshape(6, 5, 4)
+
+    @yf.step(creates="labels")
+    def create_labels(self) -> list[str]:
+        return ["a", "b"]
+
+
+@pytest.fixture
+def analysis():
+    analysis = MatrixAnalysis()
+    analysis.execute_all()
+    return analysis
+
+
+@pytest.mark.parametrize("extension", BACKENDS)
+def test_chunked_roundtrip(tmp_path, analysis, extension):
+    path = str(tmp_path / f"chunked{extension}")
+    analysis.save(path, chunks={"matrix": (16, 8), "cube": 4})
+
+    manifest = ArchiveSerializer.read_manifest(path)
+    entry = manifest["results"]["matrix"]
+    assert entry["format"] == "chunked"
+    assert entry["chunk_shape"] == [16, 8]
+    assert len(entry["chunks"]) == 7 * 4
+
+    loaded = yf.load(path)
+    np.testing.assert_array_equal(loaded.results.matrix, analysis.results.matrix)
+    assert loaded.results.matrix.dtype == np.float32
+    np.testing.assert_array_equal(loaded.results.cube, analysis.results.cube)
+
+
+@pytest.mark.parametrize(
+    "selection",
+    [
+        np.s_[:10, :],
+        np.s_[95:],
+        np.s_[17:41, 3:20],
+        np.s_[::7, ::-3],
+        np.s_[-1],
+        np.s_[5, 9],
+        np.s_[..., 12],
+        np.s_[50:50],
+        np.s_[np.int64(3), :5],
+    ],
+)
+def test_chunked_slices(tmp_path, analysis, selection):
+    path = str(tmp_path / "chunked.yax.zip")
+    analysis.save(path, chunks={"matrix": (16, 8)})
+
+    loaded = yf.load(path, slices={"matrix": selection})
+    expected = analysis.results.matrix[selection]
+    np.testing.assert_array_equal(loaded.results.matrix, expected)
+    assert np.shape(loaded.results.matrix) == np.shape(expected)
+
+
+def test_chunked_slices_read_only_covered_chunks(tmp_path, analysis, monkeypatch):
+    path = str(tmp_path / "chunked.yaxd")
+    analysis.save(path, chunks={"matrix": (16, None)})
+
+    read = []
+    read_result = ArchiveSerializer._read_result.__func__
+
+    def tracking_read_result(cls, archive, member, *args):
+        read.append(member)
+        return read_result(cls, archive, member, *args)
+
+    monkeypatch.setattr(
+        ArchiveSerializer, "_read_result", classmethod(tracking_read_result)
+    )
+    loaded = yf.load(path, select="matrix", slices={"matrix": np.s_[20:40]})
+    assert loaded.results.matrix.shape == (20, 30)
+    assert read == ["results/matrix/1.0.npy", "results/matrix/2.0.npy"]
+
+
+def test_slices_of_unchunked_array(tmp_path, analysis):
+    path = str(tmp_path / "whole.yax")
+    analysis.save(path)
+
+    loaded = yf.load(path, slices={"cube": np.s_[1:3, :, 0]})
+    np.testing.assert_array_equal(loaded.results.cube, analysis.results.cube[1:3, :, 0])
+
+
+def test_slices_of_non_array(tmp_path, analysis):
+    path = str(tmp_path / "whole.yax")
+    analysis.save(path)
+
+    with pytest.raises(ValueError, match="array results"):
+        yf.load(path, slices={"labels": np.s_[:1]})
+
+
+def test_chunked_unsupported_selection(tmp_path, analysis):
+    path = str(tmp_path / "chunked.yax")
+    analysis.save(path, chunks={"matrix": 10})
+
+    with pytest.raises(IndexError, match="Only integers, slices"):
+        yf.load(path, slices={"matrix": np.s_[[1, 2]]})
+
+
+@pytest.mark.parametrize(
+    ("chunks", "error", "match"),
+    [
+        ({"labels": 1}, ValueError, "Only numpy arrays"),
+        ({"missing": 1}, yf.YaxMissingResultError, "missing"),
+        ({"matrix": (1, 2, 3)}, ValueError, "does not match"),
+        ({"matrix": (0, None)}, ValueError, "positive"),
+    ],
+)
+def test_chunked_invalid(tmp_path, analysis, chunks, error, match):
+    with pytest.raises(error, match=match):
+        analysis.save(str(tmp_path / "invalid.yax"), chunks=chunks)
+
+
+def test_chunked_update_changes_layout(tmp_path, analysis):
+    path = str(tmp_path / "chunked.yaxd")
+    analysis.save(path, chunks={"matrix": 50})
+    analysis.save(path, force=True, chunks={"matrix": 25})
+
+    entry = ArchiveSerializer.read_manifest(path)["results"]["matrix"]
+    assert entry["chunk_shape"] == [25, 30]
+    chunk_files = (tmp_path / "chunked.yaxd" / "results" / "matrix").iterdir()
+    assert sorted(p.name for p in chunk_files) == [f"{i}.0.npy" for i in range(4)]
+
+    # Saving without chunks stores the array whole again
+    analysis.save(path, force=True)
+    assert ArchiveSerializer.read_manifest(path)["results"]["matrix"]["format"] == "npy"
+    np.testing.assert_array_equal(yf.load(path).results.matrix, analysis.results.matrix)
@@ -0,0 +1,180 @@
+import math
+import pickle
+
+import numpy as np
+import pytest
+from _utils import _save_result
+
+import yaflux as yf
+from yaflux._yax import ArchiveSerializer
+from yaflux._yax._serializer._formats import ColumnSerializer, PickleSerializer
+
+N = 5000
+
+
+def _entry(path):
+    return ArchiveSerializer.read_manifest(path)["results"]["value"]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        list(range(N)),
+        [-(2**15) + i for i in range(N)],
+        [i % 100 for i in range(N)],
+        [i % 3 == 0 for i in range(N)],
+        [f"gene{i}" for i in range(N)],
+        ["é∂ø", "", "\ud800", "a\0b"] * (N // 4),
+        [f"é{i}\0\ud800" for i in range(N)],
+    ],
+    ids=[
+        "ints",
+        "negative_ints",
+        "narrow_ints",
+        "bools",
+        "strs",
+        "repeated_strs",
+        "separator_strs",
+    ],
+)
+def test_column_roundtrip(tmp_path, value):
+    path = _save_result(tmp_path, value)
+    assert _entry(path)["format"] == ColumnSerializer.FORMAT
+
+    loaded = yf.load(path).results.value
+    assert type(loaded) is type(value)
+    assert loaded == value
+    if isinstance(value, list):
+        assert all(type(a) is type(b) for a, b in zip(loaded, value, strict=True))
+
+
+@pytest.mark.parametrize(
+    ("value", "typecode"),
+    [
+        ([i % 100 for i in range(N)], "b"),
+        ([i % 30000 for i in range(N)], "h"),
+        (list(range(N)), "h"),
+    ],
+)
+def test_column_narrowest_ints(value, typecode):
+    result, _ = ColumnSerializer.serialize(value)
+    assert b'"typecode": "%s"' % typecode.encode() in result
+
+
+@pytest.mark.parametrize(
+    ("value", "encoding"),
+    [
+        ([f"gene{i}" for i in range(N)], b'"separated": true'),
+        ([f"a\0{i}" for i in range(N)], b'"offsets_bytes"'),
+        (["T cell", "B cell", "NK"] * N, b'"categories": ["T cell", "B cell", "NK"]'),
+        (["x"] * 100_000 + [f"c{i}" for i in range(34_000)] * 2, b'"typecode": "i"'),
+    ],
+    ids=["separated", "offsets", "categories", "many_categories"],
+)
+def test_column_string_encodings(value, encoding):
+    result, _ = ColumnSerializer.serialize(value)
+    assert encoding in result
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [f"gene{i}" for i in range(N)],
+        ["T cell", "B cell", "NK"] * N,
+        [i % 100 for i in range(N)],
+        [i % 3 == 0 for i in range(N)],
+    ],
+    ids=["strs", "labels", "narrow_ints", "bools"],
+)
+def test_column_smaller_than_pickle(tmp_path, value):
+    assert _entry(_save_result(tmp_path, value))["size_bytes"] < len(
+        pickle.dumps(value)
+    )
+
+
+class MutatedColumnAnalysis(yf.Base):
+    @yf.step(creates="value")
+    def create_value(self):
+        return {"ids": [1] * N, "matrix": np.zeros(3)}
+
+    @yf.step(mutates="value")
+    def mutate_value(self):
+        self.results.value["ids"][0] = 99
+
+
+def test_column_of_mutated_list(tmp_path):
+    analysis = MutatedColumnAnalysis()
+    analysis.create_value()
+    path = str(tmp_path / "column.yaxd")
+    analysis.save(path)
+
+    # Lists checked when splitting containers, then serialized by other
+    # threads, are converted again when serialized after being mutated
+    analysis.mutate_value()
+    path = str(tmp_path / "column.yax")
+    analysis.save(path)
+    assert yf.load(path).results.value["ids"][0] == 99
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        list(range(10)),
+        list(range(5**7)),
+        [-(2**40) + i for i in range(N)],
+        [i / 7 for i in range(N)],
+        [math.nan, math.inf, -math.inf, -0.0] * N,
+        [bytes([i % 256]) * (i % 5) for i in range(N)],
+        "x" * N,
+        b"\0\1" * N,
+        [1, 2.0] * N,
+        [1, None] * N,
+        [True, 1] * N,
+        [2**64] * N,
+        [np.float64(1.0)] * N,
+        tuple(range(N)),
+        "short",
+    ],
+    ids=[
+        "short",
+        "wide_ints",
+        "huge_range",
+        "floats",
+        "special_floats",
+        "bytes",
+        "str_blob",
+        "bytes_blob",
+        "mixed_numbers",
+        "none",
+        "bools_and_ints",
+        "huge_ints",
+        "numpy_scalars",
+        "tuple",
+        "short_str",
+    ],
+)
+def test_column_falls_back_to_pickle(tmp_path, value):
+    path = _save_result(tmp_path, value)
+    assert _entry(path)["format"] == PickleSerializer.FORMAT
+    loaded = yf.load(path).results.value
+    assert [repr(x) for x in loaded] == [repr(x) for x in value]
+
+
+def test_column_items_of_containers(tmp_path):
+    value = {"ids": list(range(N)), "names": [f"cell{i}" for i in range(N)]}
+    path = _save_result(tmp_path, value)
+
+    entry = _entry(path)
+    assert entry["format"] == ArchiveSerializer.CONTAINER_FORMAT
+    assert [item["format"] for item in entry["items"]] == ["column", "column"]
+
+    loaded = yf.load(path, components={"value": ["names"]}).results.value
+    assert loaded == {"names": value["names"]}
+
+
+def test_column_invalid_header(tmp_path):
+    result, metadata = ColumnSerializer.serialize(list(range(N)))
+    path = tmp_path / "column.bin"
+    path.write_bytes(b"NOTMAGIC" + result[8:])
+    with open(path, "rb") as f, pytest.raises(ValueError, match="invalid header"):
+        ColumnSerializer.deserialize(f, metadata)
@@ -0,0 +1,220 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import yaflux as yf
+from yaflux._yax import ArchiveSerializer, DirectoryBackend
+from yaflux._yax._serializer._formats import (
+    NumpySerializer,
+    PandasSerializer,
+    PickleSerializer,
+)
+
+BACKENDS = [".yax", ".yax.zip", ".yaxd", ".yax.sqlite"]
+
+
+def _samples() -> dict:
+    return {
+        "sample_a": np.arange(12.0).reshape(3, 4),
+        "sample_b": pd.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "c"]}),
+        "folds": [np.zeros(3), (np.ones(2), "label")],
+        "meta": {"n": 2, "names": ["a", "b"]},
+    }
+
+
+class ContainerAnalysis(yf.Base):
+    @yf.step(creates="samples")
+    def create_samples(self) -> dict:
+        return _samples()
+
+    @yf.step(creates="settings")
+    def create_settings(self) -> dict:
+        return {"threshold": 0.5, "labels": ["x", "y"]}
+
+
+@pytest.fixture
+def analysis():
+    analysis = ContainerAnalysis()
+    analysis.execute_all()
+    return analysis
+
+
+def _assert_samples(loaded, expected):
+    assert list(loaded) == list(expected)
+    np.testing.assert_array_equal(loaded["sample_a"], expected["sample_a"])
+    pd.testing.assert_frame_equal(loaded["sample_b"], expected["sample_b"])
+    assert isinstance(loaded["folds"], list)
+    assert isinstance(loaded["folds"][1], tuple)
+    np.testing.assert_array_equal(loaded["folds"][0], expected["folds"][0])
+    np.testing.assert_array_equal(loaded["folds"][1][0], expected["folds"][1][0])
+    assert loaded["folds"][1][1] == "label"
+    assert loaded["meta"] == expected["meta"]
+
+
+@pytest.mark.parametrize("extension", BACKENDS)
+def test_container_roundtrip(tmp_path, analysis, extension):
+    path = str(tmp_path / f"container{extension}")
+    analysis.save(path)
+
+    loaded = yf.load(path)
+    _assert_samples(loaded.results.samples, analysis.results.samples)
+    assert loaded.results.settings == analysis.results.settings
+
+
+def test_container_manifest(tmp_path, analysis):
+    path = str(tmp_path / "container.yax")
+    analysis.save(path)
+
+    results = ArchiveSerializer.read_manifest(path)["results"]
+    entry = results["samples"]
+    assert entry["format"] == ArchiveSerializer.CONTAINER_FORMAT
+    assert entry["type"] == "dict"
+    assert entry["keys"] == ["sample_a", "sample_b", "folds", "meta"]
+
+    sample_a, sample_b, folds, meta = entry["items"]
+    assert sample_a["format"] == NumpySerializer.FORMAT
+    assert sample_b["format"] == PandasSerializer.FORMAT
+    assert folds["format"] == ArchiveSerializer.CONTAINER_FORMAT
+    assert folds["type"] == "list"
+    assert folds["items"][1]["type"] == "tuple"
+    # Containers without items of a dedicated format are stored whole
+    assert meta["format"] == PickleSerializer.FORMAT
+    assert entry["size_bytes"] == sum(item["size_bytes"] for item in entry["items"])
+
+    assert results["settings"]["format"] == PickleSerializer.FORMAT
+
+
+def test_container_items_are_members(tmp_path, analysis):
+    path = str(tmp_path / "container.yaxd")
+    analysis.save(path)
+
+    with DirectoryBackend(path, "r") as archive:
+        members = {
+            name for name in archive.list_members() if name.startswith("results/")
+        }
+    assert members == {
+        "results/samples/0.npy",
+        "results/samples/1.arrow",
+        "results/samples/2.0.npy",
+        "results/samples/2.1.0.npy",
+        "results/samples/2.1.1.pkl",
+        "results/samples/3.pkl",
+        "results/settings.pkl",
+    }
+
+
+@pytest.mark.parametrize("extension", BACKENDS)
+def test_container_components(tmp_path, analysis, extension):
+    path = str(tmp_path / f"container{extension}")
+    analysis.save(path)
+
+    loaded = yf.load(path, components={"samples": ["sample_a", "folds/1/0"]})
+    samples = loaded.results.samples
+    assert list(samples) == ["sample_a", "folds"]
+    np.testing.assert_array_equal(
+        samples["sample_a"], analysis.results.samples["sample_a"]
+    )
+    assert len(samples["folds"]) == 1
+    assert isinstance(samples["folds"][0], tuple)
+    np.testing.assert_array_equal(samples["folds"][0][0], np.ones(2))
+
+
+def test_container_components_read_only_selected_items(tmp_path, analysis, monkeypatch):
+    path = str(tmp_path / "container.yax")
+    analysis.save(path)
+
+    read = []
+    read_result = ArchiveSerializer._read_result.__func__
+
+    def tracked(cls, archive, member, *args, **kwargs):
+        read.append(member)
+        return read_result(cls, archive, member, *args, **kwargs)
+
+    monkeypatch.setattr(ArchiveSerializer, "_read_result", classmethod(tracked))
+    loaded = yf.load(path, select="samples", components={"samples": ["folds"]})
+    assert read == [
+        "results/samples/2.0.npy",
+        "results/samples/2.1.0.npy",
+        "results/samples/2.1.1.pkl",
+    ]
+    assert list(loaded.results.samples) == ["folds"]
+
+
+@pytest.mark.parametrize("component", ["missing", "meta/n", "folds/5", "folds/x"])
+def test_container_missing_component(tmp_path, analysis, component):
+    path = str(tmp_path / "container.yax")
+    analysis.save(path)
+    with pytest.raises(ValueError, match="Item not found in container result"):
+        yf.load(path, components={"samples": [component]})
+
+
+def test_container_rejects_other_read_options(tmp_path, analysis):
+    path = str(tmp_path / "container.yaxd")
+    analysis.save(path)
+    with pytest.raises(ValueError, match="Only components can be read"):
+        yf.load(path, backed="samples")
+    with pytest.raises(ValueError, match="Only components can be read"):
+        yf.load(path, rows={"samples": slice(0, 1)})
+
+
+@pytest.mark.parametrize(
+    ("value", "split"),
+    [
+        ({1: np.zeros(3)}, False),
+        ({}, False),
+        ([1, 2.5, "a"], False),
+        ([np.zeros(3)], True),
+    ],
+    ids=["int_keys", "empty", "scalars", "array"],
+)
+def test_container_detection(tmp_path, value, split):
+    class Analysis(yf.Base):
+        @yf.step(creates="value")
+        def create_value(self):
+            return value
+
+    analysis = Analysis()
+    analysis.execute()
+    path = str(tmp_path / "container.yax")
+    analysis.save(path)
+
+    entry = ArchiveSerializer.read_manifest(path)["results"]["value"]
+    assert (entry["format"] == ArchiveSerializer.CONTAINER_FORMAT) == split
+
+    loaded = yf.load(path).results.value
+    assert type(loaded) is type(value)
+    assert len(loaded) == len(value)
+
+
+def test_self_referencing_container_is_pickled(tmp_path):
+    value: list = [np.zeros(3)]
+    value.append(value)
+
+    class Analysis(yf.Base):
+        @yf.step(creates="value")
+        def create_value(self):
+            return value
+
+    analysis = Analysis()
+    analysis.execute()
+    path = str(tmp_path / "container.yax")
+    analysis.save(path)
+
+    entry = ArchiveSerializer.read_manifest(path)["results"]["value"]
+    assert entry["format"] == PickleSerializer.FORMAT
+    loaded = yf.load(path).results.value
+    assert loaded[1] is loaded
+
+
+def test_container_update_removes_stale_items(tmp_path, analysis):
+    path = str(tmp_path / "container.yaxd")
+    analysis.save(path)
+
+    analysis.results._data["samples"] = {"sample_a": np.ones(2)}
+    analysis.results.set_versions(["samples"], "updated")
+    analysis.save(path, force=True)
+
+    with DirectoryBackend(path, "r") as archive:
+        members = [n for n in archive.list_members() if n.startswith("results/samples")]
+    assert members == ["results/samples/0.npy"]
+    np.testing.assert_array_equal(yf.load(path).results.samples["sample_a"], np.ones(2))
@@ -0,0 +1,137 @@
+import os
+
+import numpy as np
+import pytest
+
+import yaflux as yf
+from yaflux._yax import ArchiveSerializer
+
+
+class DirectoryAnalysis(yf.Base):
+    @yf.step(creates="matrix")
+    def create_matrix(self) -> np.ndarray:
+        return np.arange(20, dtype=np.float64).reshape(4, 5)
+
+    @yf.step(creates="labels")
+    def create_labels(self) -> list[str]:
+        return [f"label_{i}" for i in range(self.parameters["n_labels"])]
+
+    @yf.step(creates="blocks")
+    def create_blocks(self):
+        for i in range(3):
+            yield np.full(2, i)
+
+    @yf.step(creates="total", requires="matrix")
+    def total(self) -> float:
+        return float(self.results.matrix.sum())
+
+
+@pytest.fixture
+def analysis():
+    analysis = DirectoryAnalysis(parameters={"n_labels": 3})
+    analysis.execute_all()
+    return analysis
+
+
+def test_directory_roundtrip(tmp_path, analysis):
+    path = str(tmp_path / "analysis.yaxd")
+    analysis.save(path)
+    assert os.path.isdir(path)
+
+    loaded = yf.load(path)
+    assert np.array_equal(loaded.results.matrix, analysis.results.matrix)
+    assert loaded.results.labels == analysis.results.labels
+    assert [b.tolist() for b in loaded.results.blocks] == [[0, 0], [1, 1], [2, 2]]
+    assert loaded.results.total == analysis.results.total
+    assert loaded.parameters == {"n_labels": 3}
+    assert set(loaded.completed_steps) == set(analysis.completed_steps)
+
+
+def test_members_are_plain_files(tmp_path, analysis):
+    path = str(tmp_path / "analysis.yaxd")
+    analysis.save(path)
+
+    # Results can be consumed directly without any extraction step
+    matrix = np.load(os.path.join(path, "results", "matrix.npy"), mmap_mode="r")
+    assert isinstance(matrix, np.memmap)
+    assert np.array_equal(matrix, analysis.results.matrix)
+    assert os.path.exists(os.path.join(path, "results", "blocks", "00000002.npy"))
+    assert os.path.exists(os.path.join(path, "manifest.json"))
+
+
+def test_selective_load(tmp_path, analysis):
+    path = str(tmp_path / "analysis.yaxd")
+    analysis.save(path)
+
+    loaded = yf.load(path, select="labels")
+    assert loaded.results.labels == analysis.results.labels
+    assert not hasattr(loaded.results, "matrix")
+
+    loaded = yf.load(path, no_results=True)
+    assert loaded.results._data == {}
+
+
+def test_existing_directory(tmp_path, analysis):
+    path = str(tmp_path / "analysis.yaxd")
+    analysis.save(path)
+    with pytest.raises(FileExistsError):
+        analysis.save(path)
+
+
+def test_incremental_save(tmp_path, analysis, monkeypatch):
+    path = str(tmp_path / "analysis.yaxd")
+    analysis.save(path)
+
+    analysis.parameters["n_labels"] = 5
+    analysis.create_labels(force=True)
+
+    serialized = []
+    serialize = ArchiveSerializer._serialize
+
+    def record(key, value, *args):
+        serialized.append(key)
+        return serialize(key, value, *args)
+
+    monkeypatch.setattr(ArchiveSerializer, "_serialize", record)
+    analysis.save(path, force=True)
+
+    # Only the result with a new version is written again
+    assert serialized == ["labels"]
+    loaded = yf.load(path)
+    assert len(loaded.results.labels) == 5
+    assert np.array_equal(loaded.results.matrix, analysis.results.matrix)
+
+
+def test_removed_results_are_deleted(tmp_path, analysis):
+    path = str(tmp_path / "analysis.yaxd")
+    analysis.save(path)
+
+    other = DirectoryAnalysis(parameters={"n_labels": 1})
+    other.create_labels()
+    other.save(path, force=True)
+
+    assert sorted(os.listdir(os.path.join(path, "results"))) == ["labels.pkl"]
+    assert yf.load(path).results.labels == ["label_0"]
+
+
+def test_rewrite_removes_previous_members(tmp_path, analysis):
+    path = str(tmp_path / "analysis.yaxd")
+    analysis.save(path)
+
+    # An interrupted update leaves no manifest, so the archive is written anew
+    os.unlink(os.path.join(path, "manifest.json"))
+    other = DirectoryAnalysis(parameters={"n_labels": 2})
+    other.create_labels()
+    other.save(path, force=True)
+
+    assert sorted(os.listdir(os.path.join(path, "results"))) == ["labels.pkl"]
+    assert yf.load(path).results.labels == ["label_0", "label_1"]
+
+
+def test_load_trace(tmp_path, analysis):
+    path = str(tmp_path / "analysis.yaxd")
+    analysis.save(path)
+
+    trace = yf.load_trace(path)
+    names = {event["name"] for event in trace["traceEvents"]}
+    assert "create_matrix" in names
@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import yaflux as yf
+from yaflux._yax._serializer._formats import PandasSerializer
+
+N_ROWS = 1000
+N_COLUMNS = 200
+
+
+class WideAnalysis(yf.Base):
+    @yf.step(creates="features")
+    def create_features(self) -> pd.DataFrame:
+        rng = np.random.default_rng(0)
+        return pd.DataFrame(
+            rng.random((N_ROWS, N_COLUMNS)),
+            columns=[f"f{i}" for i in range(N_COLUMNS)],
+        )
+
+    @yf.step(creates="labeled")
+    def create_labeled(self) -> pd.DataFrame:
+        index = pd.Index([f"cell_{i}" for i in range(N_ROWS)], name="cell")
+        return pd.DataFrame({"a": np.arange(N_ROWS), "b": np.ones(N_ROWS)}, index=index)
+
+    @yf.step(creates="counts")
+    def create_counts(self) -> list[int]:
+        return [1, 2, 3]
+
+    @yf.step(creates="blocks")
+    def stream_blocks(self):
+        for i in range(3):
+            yield pd.DataFrame({"x": [i] * 4, "y": [-i] * 4})
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    # Small batches so row ranges span several of them
+    monkeypatch.setattr(PandasSerializer, "BATCH_ROWS", 64)
+    analysis = WideAnalysis()
+    analysis.execute_all()
+    path = str(tmp_path / "wide.yax")
+    analysis.save(path)
+    return analysis, path
+
+
+def test_load_columns(archive):
+    analysis, path = archive
+    loaded = yf.load(path, columns={"features": ["f3", "f1"]})
+
+    # Columns keep the order of the stored DataFrame
+    expected = analysis.results.features[["f1", "f3"]]
+    pd.testing.assert_frame_equal(loaded.results.features, expected)
+
+    # Results without a projection are loaded in full
+    pd.testing.assert_frame_equal(loaded.results.labeled, analysis.results.labeled)
+
+
+@pytest.mark.parametrize(
+    "rows", [slice(100, 300), (0, 10), slice(-5, None), slice(60, 70), (500, 500)]
+)
+def test_load_rows(archive, rows):
+    analysis, path = archive
+    loaded = yf.load(path, rows={"features": rows, "labeled": rows})
+
+    selection = rows if isinstance(rows, slice) else slice(*rows)
+    pd.testing.assert_frame_equal(
+        loaded.results.features, analysis.results.features.iloc[selection]
+    )
+    pd.testing.assert_frame_equal(
+        loaded.results.labeled, analysis.results.labeled.iloc[selection]
+    )
+
+
+def test_load_columns_and_rows_keeps_index(archive):
+    analysis, path = archive
+    loaded = yf.load(path, columns={"labeled": ["b"]}, rows={"labeled": (10, 20)})
+    pd.testing.assert_frame_equal(
+        loaded.results.labeled, analysis.results.labeled[["b"]].iloc[10:20]
+    )
+
+
+def test_load_rows_reads_only_overlapping_batches(archive, monkeypatch):
+    _, path = archive
+    read = []
+    get_batch = pa.ipc.RecordBatchFileReader.get_batch
+
+    def tracking_get_batch(self, i):
+        read.append(i)
+        return get_batch(self, i)
+
+    monkeypatch.setattr(pa.ipc.RecordBatchFileReader, "get_batch", tracking_get_batch)
+    yf.load(path, select="features", rows={"features": (130, 140)})
+    assert read == [2]
+
+
+def test_load_projection_of_stream(archive):
+    _, path = archive
+    loaded = yf.load(path, columns={"blocks": ["y"]}, rows={"blocks": (0, 2)})
+    blocks = list(loaded.results.blocks)
+    assert [block.columns.tolist() for block in blocks] == [["y"]] * 3
+    assert [block["y"].tolist() for block in blocks] == [[0, 0], [-1, -1], [-2, -2]]
+
+
+def test_load_unknown_columns(archive):
+    _, path = archive
+    with pytest.raises(ValueError, match="Columns not found"):
+        yf.load(path, columns={"features": ["missing"]})
+
+
+def test_load_projection_unsupported_format(archive):
+    _, path = archive
+    with pytest.raises(ValueError, match="does not support"):
+        yf.load(path, columns={"counts": ["a"]})
+
+
+def test_load_projection_of_unloaded_result(archive):
+    _, path = archive
+    with pytest.raises(ValueError, match="unloaded results"):
+        yf.load(path, select="labeled", columns={"features": ["f1"]})
+
+
+def test_load_rows_must_be_contiguous(archive):
+    _, path = archive
+    with pytest.raises(ValueError, match="contiguous"):
+        yf.load(path, rows={"features": slice(0, 10, 2)})
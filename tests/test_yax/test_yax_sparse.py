@@ -0,0 +1,131 @@
+import pickle
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from _utils import _save_result
+
+import yaflux as yf
+from yaflux._yax import ArchiveSerializer
+from yaflux._yax._serializer import SerializerRegistry
+from yaflux._yax._serializer._formats import PickleSerializer, SparseSerializer
+
+N_CELLS = 500
+N_GENES = 300
+
+
+def _counts(format: str) -> sp.spmatrix:
+    rng = np.random.default_rng(0)
+    return sp.random(
+        N_CELLS, N_GENES, density=0.05, format=format, dtype=np.float32, rng=rng
+    )
+
+
+def _assert_same(loaded, expected):
+    assert type(loaded) is type(expected)
+    assert loaded.format == expected.format
+    assert loaded.shape == expected.shape
+    assert loaded.dtype == expected.dtype
+    assert (loaded != expected).nnz == 0
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        _counts("csr"),
+        _counts("csc"),
+        _counts("coo"),
+        sp.csr_array(_counts("csr")),
+        sp.coo_array(_counts("coo")),
+        sp.csr_matrix((3, 4), dtype=np.int64),
+        sp.csr_matrix(np.array([[1 + 2j, 0], [0, 3j]])),
+    ],
+    ids=["csr", "csc", "coo", "csr_array", "coo_array", "empty", "complex"],
+)
+def test_sparse_roundtrip(tmp_path, value):
+    path = _save_result(tmp_path, value)
+    entry = ArchiveSerializer.read_manifest(path)["results"]["value"]
+    assert entry["format"] == SparseSerializer.FORMAT
+
+    _assert_same(yf.load(path).results.value, value)
+
+
+def test_sparse_keeps_index_dtype(tmp_path):
+    value = _counts("csr")
+    value.indices = value.indices.astype(np.int64)
+    value.indptr = value.indptr.astype(np.int64)
+    loaded = yf.load(_save_result(tmp_path, value)).results.value
+    assert loaded.indices.dtype == np.int64
+    assert loaded.indptr.dtype == np.int64
+
+
+def test_sparse_smaller_than_pickle(tmp_path):
+    value = _counts("csr")
+    path = _save_result(tmp_path, value)
+    entry = ArchiveSerializer.read_manifest(path)["results"]["value"]
+    assert entry["size_bytes"] < len(pickle.dumps(value)) + 1024
+
+
+def _size(path):
+    return ArchiveSerializer.read_manifest(path)["results"]["value"]["size_bytes"]
+
+
+def test_sparse_compression(tmp_path):
+    value = _counts("csr")
+    raw = _save_result(tmp_path, value, "raw.yaxd")
+    path = _save_result(tmp_path, value, "compressed.yaxd", compress=True)
+
+    # Components are compressed separately, and read into memory when backed
+    assert _size(path) < _size(raw)
+    _assert_same(yf.load(path).results.value, value)
+    _assert_same(yf.load(path, backed="value").results.value, value)
+
+
+def test_compressed_archives_store_raw_components(tmp_path):
+    value = _counts("csr")
+    raw = _save_result(tmp_path, value, "raw.yax")
+    path = _save_result(tmp_path, value, "compressed.yax.gz", compress=True)
+
+    # Archives compressing their members do not compress components again
+    assert _size(path) == _size(raw)
+    _assert_same(yf.load(path).results.value, value)
+
+
+def test_sparse_backed_is_memory_mapped(tmp_path):
+    value = _counts("csr")
+    path = _save_result(tmp_path, value, "sparse.yaxd")
+
+    loaded = yf.load(path, backed="value").results.value
+    _assert_same(loaded, value)
+    for component in (loaded.data, loaded.indices, loaded.indptr):
+        assert isinstance(component, np.memmap)
+        assert not component.flags.writeable
+        # Components are aligned for memory mapping
+        assert component.offset % SparseSerializer.ALIGNMENT == 0
+
+
+def test_sparse_backed_requires_files(tmp_path):
+    path = _save_result(tmp_path, _counts("csr"))
+    with pytest.raises(ValueError, match="directory archive"):
+        yf.load(path, backed="value")
+
+
+def test_other_sparse_formats_are_pickled(tmp_path):
+    value = _counts("lil")
+    path = _save_result(tmp_path, value)
+    entry = ArchiveSerializer.read_manifest(path)["results"]["value"]
+    assert entry["format"] == PickleSerializer.FORMAT
+    _assert_same(yf.load(path).results.value, value)
+
+
+def test_serde_without_sparse(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        SerializerRegistry,
+        "_serializers",
+        [s for s in SerializerRegistry._serializers if s is not SparseSerializer],
+    )
+    value = _counts("csr")
+    path = _save_result(tmp_path, value)
+    entry = ArchiveSerializer.read_manifest(path)["results"]["value"]
+    assert entry["format"] == PickleSerializer.FORMAT
+    _assert_same(yf.load(path).results.value, value)